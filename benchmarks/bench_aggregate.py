@@ -0,0 +1,65 @@
+"""Benchmark the aggregate tool on high-cardinality group keys.
+
+Compares a plain pandas groupby with the first call of ``group_by`` (coding the
+keys as categoricals), a later call with other aggregations on the same keys,
+and a repeated call served from the cache.
+
+Usage::
+
+    python -m benchmarks.bench_aggregate --rows 10000000 --users 1000000
+"""
+
+import argparse
+import time
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor import EditorConfig, InMemoryEditor
+
+
+def measure(func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--shops", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    table = pd.DataFrame(
+        {
+            "user": rng.integers(0, args.users, args.rows),
+            "shop": rng.choice([f"shop-{i}" for i in range(args.shops)], args.rows),
+            "revenue": rng.random(args.rows),
+            "units": rng.integers(0, 10, args.rows),
+        }
+    )
+    first = {"revenue": ["sum", "mean"], "units": ["count", "max"]}
+    second = {"revenue": ["min"], "units": ["sum", "nunique"]}
+    print(f"rows={args.rows} users={args.users} shops={args.shops}")
+    for by in (["shop"], ["user"], ["user", "shop"]):
+        editor = InMemoryEditor(table, EditorConfig())
+        plain = measure(lambda: table.groupby(by).agg(first))
+        plain_second = measure(lambda: table.groupby(by).agg(second))
+        coded = measure(lambda: editor.group_by(by, first))
+        reused = measure(lambda: editor.group_by(by, second))
+        cached = measure(lambda: editor.group_by(by, first))
+        groups = len(editor.group_by(by, first))
+        print(
+            f"by={str(by):<18} groups={groups:>9}\n"
+            f"  first aggregations : pandas {plain * 1000:8.1f} ms  "
+            f"group_by {coded * 1000:8.1f} ms  cached {cached * 1000:6.3f} ms\n"
+            f"  other aggregations : pandas {plain_second * 1000:8.1f} ms  "
+            f"group_by {reused * 1000:8.1f} ms (keys already coded)"
+        )
+
+
+if __name__ == "__main__":
+    main()
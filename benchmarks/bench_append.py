@@ -0,0 +1,93 @@
+"""Benchmark appending rows one at a time to a table.
+
+The rows are appended through the CRUD handler, which buffers them in the editor,
+and through a selector insert committed each time, which copies the table on every
+insert. The latter is quadratic, so that it runs fewer inserts by default.
+
+Usage::
+
+    python -m benchmarks.bench_append --inserts 100000 --concat-inserts 5000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor import InMemoryEditor, InsertRule, Range
+from mcp_table_editor.handler._crud_handler import (
+    CrudHandler,
+    CrudInputSchema,
+    Operation,
+    ResponseMode,
+)
+
+
+def make_table(rows: int, columns: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        rng.random((rows, columns)), columns=[f"c{i}" for i in range(columns)]
+    )
+
+
+def bench_editor(table: pd.DataFrame, inserts: int) -> float:
+    editor = InMemoryEditor(table)
+    start = time.perf_counter()
+    for label in range(len(table), len(table) + inserts):
+        editor.append([label], 1.0)
+    editor.table
+    return time.perf_counter() - start
+
+
+def bench_handler(table: pd.DataFrame, inserts: int) -> float:
+    editor = InMemoryEditor(table)
+    handler = CrudHandler(editor)
+    start = time.perf_counter()
+    for label in range(len(table), len(table) + inserts):
+        handler.handle(
+            CrudInputSchema(
+                method=Operation.INSERT,
+                rows=[label],
+                value=1.0,
+                commit=True,
+                response_mode=ResponseMode.DIFF,
+            )
+        )
+    editor.table
+    return time.perf_counter() - start
+
+
+def bench_concat(table: pd.DataFrame, inserts: int) -> float:
+    editor = InMemoryEditor(table)
+    start = time.perf_counter()
+    for label in range(len(table), len(table) + inserts):
+        selector = editor.select(Range(row=[label]))
+        editor.commit(selector.insert(value=1.0, insert_rule=InsertRule.EMPTY))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--inserts", type=int, default=100_000)
+    parser.add_argument("--concat-inserts", type=int, default=5_000)
+    args = parser.parse_args()
+
+    table = make_table(args.rows, args.columns)
+    print(f"rows={args.rows} columns={args.columns}")
+    for name, bench, inserts in (
+        ("editor.append", bench_editor, args.inserts),
+        ("crud handler", bench_handler, args.inserts),
+        ("selector concat", bench_concat, args.concat_inserts),
+    ):
+        elapsed = bench(table, inserts)
+        print(
+            f"{name:16}: {inserts:>7} inserts in {elapsed:8.2f} s "
+            f"({elapsed / inserts * 1e6:8.1f} us/insert)"
+        )
+
+
+if __name__ == "__main__":
+    main()
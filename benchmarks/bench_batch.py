@@ -0,0 +1,75 @@
+"""Benchmark 100 edits sent as individual tool calls against a single batch call.
+
+Usage::
+
+    python -m benchmarks.bench_batch --rows 100000 --edits 100
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor import InMemoryEditor
+from mcp_table_editor.handler import TOOL_HANDLERS_DICT
+from mcp_table_editor.mcp.handler_tool import HandlerTool
+
+
+def make_table(rows: int, columns: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        rng.random((rows, columns)), columns=[f"c{i}" for i in range(columns)]
+    )
+
+
+def make_edits(rows: int, columns: int, edits: int, seed: int = 1) -> list[dict]:
+    rng = np.random.default_rng(seed)
+    return [
+        {
+            "rows": [int(rng.integers(rows))],
+            "columns": [f"c{int(rng.integers(columns))}"],
+            "value": float(rng.random()),
+            "commit": True,
+        }
+        for _ in range(edits)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--edits", type=int, default=100)
+    args = parser.parse_args()
+
+    table = make_table(args.rows, args.columns)
+    edits = make_edits(args.rows, args.columns, args.edits)
+
+    editor = InMemoryEditor(table.copy())
+    update = HandlerTool(TOOL_HANDLERS_DICT["update_content"])
+    start = time.perf_counter()
+    individual_bytes = 0
+    for edit in edits:
+        individual_bytes += sum(len(c.text) for c in update.run(editor, edit))
+    individual = time.perf_counter() - start
+
+    batch_editor = InMemoryEditor(table.copy())
+    batch = HandlerTool(TOOL_HANDLERS_DICT["batch"])
+    operations = [{"tool": "update_content", "args": edit} for edit in edits]
+    start = time.perf_counter()
+    batch_bytes = sum(
+        len(c.text) for c in batch.run(batch_editor, {"operations": operations})
+    )
+    batched = time.perf_counter() - start
+
+    pd.testing.assert_frame_equal(editor.table, batch_editor.table)
+    print(f"rows={args.rows} columns={args.columns} edits={args.edits}")
+    print(
+        f"individual calls: {individual * 1000:10.1f} ms {individual_bytes:>12} bytes"
+    )
+    print(f"single batch    : {batched * 1000:10.1f} ms {batch_bytes:>12} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark the latency of light tool calls while a heavy call is running.
+
+A heavy sort runs on a large table while light `get_content` calls are sent on
+a small table, either inline on the event loop (the former behaviour of
+`call_tool`) or through the `ToolExecutor` thread pool.
+
+Usage::
+
+    python -m benchmarks.bench_concurrency --rows 5000000
+"""
+
+import argparse
+import asyncio
+import time
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor import InMemoryEditor
+from mcp_table_editor.handler import TOOL_HANDLERS_DICT
+from mcp_table_editor.mcp.executor import ToolExecutor
+from mcp_table_editor.mcp.handler_tool import HandlerTool
+
+SORT = HandlerTool(TOOL_HANDLERS_DICT["sort"])
+GET = HandlerTool(TOOL_HANDLERS_DICT["get_content"])
+
+
+async def run_inline(tool, editor, args):
+    return tool.run(editor, args)
+
+
+async def light_calls(run, editor, until: asyncio.Event, interval: float) -> list:
+    """Send a light call every interval, measuring from the time it was due."""
+    latencies = []
+    due = time.perf_counter()
+    while not until.is_set():
+        await asyncio.sleep(max(0.0, due - time.perf_counter()))
+        await run(GET, editor, {"rows": [0], "columns": ["value"]})
+        latencies.append(time.perf_counter() - due)
+        due += interval
+    return latencies
+
+
+async def scenario(run, heavy: InMemoryEditor, light: InMemoryEditor) -> list:
+    done = asyncio.Event()
+    light_task = asyncio.create_task(light_calls(run, light, done, 0.005))
+    await asyncio.sleep(0.05)
+    # Sort without serializing the whole table in the response.
+    await run(
+        HandlerTool(TOOL_HANDLERS_DICT["batch"]),
+        heavy,
+        {"operations": [{"tool": "sort", "args": {"by": ["value"]}}]},
+    )
+    done.set()
+    return await light_task
+
+
+def report(name: str, latencies: list) -> None:
+    ms = np.array(latencies) * 1000
+    print(
+        f"{name:9}: calls={len(ms):5} p50={np.percentile(ms, 50):9.2f} ms "
+        f"p99={np.percentile(ms, 99):9.2f} ms max={ms.max():9.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    heavy_table = pd.DataFrame({"value": rng.random(args.rows)})
+    light = InMemoryEditor(pd.DataFrame({"value": rng.random(100)}))
+
+    print(f"heavy table rows={args.rows} workers={args.workers}")
+    heavy = InMemoryEditor(heavy_table.copy())
+    report("inline", asyncio.run(scenario(run_inline, heavy, light)))
+
+    executor = ToolExecutor(max_workers=args.workers)
+    heavy = InMemoryEditor(heavy_table.copy())
+    report("executor", asyncio.run(scenario(executor.run, heavy, light)))
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark the per-call overhead of HandlerTool.run for small payloads.
+
+Compares the dispatch of the tool, which validates the arguments with a cached
+validator, reuses the handler instance and emits compact JSON, against building
+the handler and pretty-printing the response on every call.
+
+Usage::
+
+    python -m benchmarks.bench_dispatch --calls 10000
+"""
+
+import argparse
+import time
+from typing import Any, Callable
+
+import pandas as pd
+from mcp.types import TextContent
+
+from mcp_table_editor.editor import InMemoryEditor
+from mcp_table_editor.handler import TOOL_HANDLERS_DICT
+from mcp_table_editor.mcp.handler_tool import HandlerTool
+
+
+def naive_run(handler: Any, editor: InMemoryEditor, args: dict) -> list[TextContent]:
+    input_args = handler.input_schema.model_validate(args)
+    response = handler(editor).handle(input_args)
+    return [TextContent(type="text", text=response.model_dump_json(indent=2))]
+
+
+def measure(call: Callable[[], Any], calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        call()
+    return (time.perf_counter() - start) / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=10_000)
+    args = parser.parse_args()
+
+    editor = InMemoryEditor(pd.DataFrame({"A": [3, 1, 2], "B": ["x", "y", "z"]}))
+    cases = {
+        "get_content": {"columns": ["A"], "rows": [0]},
+        "flush": {},
+    }
+    print(f"calls={args.calls}")
+    for name, tool_args in cases.items():
+        handler = TOOL_HANDLERS_DICT[name]
+        tool = HandlerTool(handler)
+        naive = measure(lambda: naive_run(handler, editor, tool_args), args.calls)
+        dispatched = measure(lambda: tool.run(editor, tool_args), args.calls)
+        naive_bytes = len(naive_run(handler, editor, tool_args)[0].text)
+        dispatched_bytes = len(tool.run(editor, tool_args)[0].text)
+        print(
+            f"{name:12}: naive {naive * 1e6:8.1f} us/call {naive_bytes:6} bytes, "
+            f"dispatch {dispatched * 1e6:8.1f} us/call {dispatched_bytes:6} bytes"
+        )
+
+
+if __name__ == "__main__":
+    main()
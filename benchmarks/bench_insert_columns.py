@@ -0,0 +1,76 @@
+"""Benchmark inserting many columns into a table at once.
+
+The selector builds the new columns as one block and splices them in a single
+concat; the reference inserts them one at a time with `DataFrame.insert`, which
+adds a block per column. The new columns are boolean by default, so that 500
+columns of 1M rows fit in memory twice.
+
+Usage::
+
+    python -m benchmarks.bench_insert_columns --rows 1000000 --inserted 500
+"""
+
+import argparse
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor import EditorConfig, InsertRule, Range
+from mcp_table_editor.editor._in_memory_selector import InMemorySelector
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--inserted", type=int, default=500)
+    parser.add_argument("--value", default="false", choices=["false", "0", "nan"])
+    args = parser.parse_args()
+    value = {"false": False, "0": 0, "nan": np.nan}[args.value]
+
+    rng = np.random.default_rng(0)
+    table = pd.DataFrame(
+        rng.random((args.rows, args.columns)),
+        columns=[f"c{i}" for i in range(args.columns)],
+    )
+    new_columns = [f"n{i}" for i in range(args.inserted)]
+    position = args.columns // 2
+
+    def bulk() -> pd.DataFrame:
+        selector = InMemorySelector(table, Range(column=new_columns), EditorConfig())
+        return selector.insert(pos=position, value=value, insert_rule=InsertRule.EMPTY)
+
+    def per_column() -> pd.DataFrame:
+        df = table.copy(deep=False)
+        for i, column in enumerate(new_columns):
+            df.insert(position + i, column, value)
+        return df
+
+    # Reordering the rows, as sorting does, goes through every block.
+    positions = rng.permutation(args.rows)[: args.rows // 5]
+
+    print(f"rows={args.rows} columns={args.columns} inserted={args.inserted}")
+    warnings.simplefilter("ignore", pd.errors.PerformanceWarning)
+    for name, func in (("bulk insert", bulk), ("per-column insert", per_column)):
+        start = time.perf_counter()
+        result = func()
+        inserted = time.perf_counter() - start
+        start = time.perf_counter()
+        result.take(positions)
+        taken = time.perf_counter() - start
+        start = time.perf_counter()
+        result.copy()
+        copied = time.perf_counter() - start
+        print(
+            f"{name:18}: insert {inserted * 1000:8.1f} ms, "
+            f"{result._mgr.nblocks:4} blocks, "
+            f"take a fifth of the rows {taken * 1000:8.1f} ms, "
+            f"copy {copied * 1000:8.1f} ms"
+        )
+        del result
+
+
+if __name__ == "__main__":
+    main()
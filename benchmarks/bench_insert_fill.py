@@ -0,0 +1,81 @@
+"""Benchmark inserting rows and columns with the ABOVE fill rule.
+
+The selector fills only the inserted block; the reference fills the whole table
+after inserting, as a forward fill over all the rows would.
+
+Usage::
+
+    python -m benchmarks.bench_insert_fill --rows 5000000 --columns 10
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor import EditorConfig, InsertRule, Range
+from mcp_table_editor.editor._in_memory_selector import InMemorySelector
+
+
+def measure(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--inserted-rows", type=int, default=100)
+    parser.add_argument("--inserted-columns", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    values = rng.random((args.rows, args.columns))
+    values[values < 0.01] = np.nan
+    table = pd.DataFrame(values, columns=[f"c{i}" for i in range(args.columns)])
+    config = EditorConfig()
+    new_rows = list(range(args.rows, args.rows + args.inserted_rows))
+    new_columns = [f"n{i}" for i in range(args.inserted_columns)]
+
+    def insert_rows() -> None:
+        InMemorySelector(table, Range(row=new_rows), config).insert(
+            value=pd.NA, insert_rule=InsertRule.ABOVE
+        )
+
+    def insert_rows_whole_ffill() -> None:
+        new = pd.DataFrame(np.nan, index=new_rows, columns=table.columns)
+        pd.concat([table, new]).ffill()
+
+    def insert_columns() -> None:
+        InMemorySelector(table, Range(column=new_columns), config).insert(
+            value=np.nan, insert_rule=InsertRule.ABOVE
+        )
+
+    def insert_columns_whole_ffill() -> None:
+        df = table.copy()
+        for i, column in enumerate(new_columns):
+            df.insert(len(table.columns) + i, column, np.nan)
+        df.ffill()
+
+    print(
+        f"rows={args.rows} columns={args.columns} "
+        f"inserted rows={args.inserted_rows} columns={args.inserted_columns}"
+    )
+    for name, func in (
+        ("rows, block fill", insert_rows),
+        ("rows, whole ffill", insert_rows_whole_ffill),
+        ("columns, block fill", insert_columns),
+        ("columns, whole ffill", insert_columns_whole_ffill),
+    ):
+        print(f"{name:22}: {measure(func, args.repeat) * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
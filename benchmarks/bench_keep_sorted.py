@@ -0,0 +1,88 @@
+"""Benchmark keeping a table sorted on each edit against sorting it again.
+
+Each edit goes through the CRUD handler. With ``keep_sorted`` the editor moves
+the edited rows to their place; otherwise the whole table is sorted after the
+edit, as a user re-sorting after each change would.
+
+Usage::
+
+    python -m benchmarks.bench_keep_sorted --rows 1000000 --edits 20
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor import EditorConfig, InMemoryEditor
+from mcp_table_editor.handler import CrudHandler
+from mcp_table_editor.handler._crud_handler import CrudInputSchema
+
+BY = ["key", "rank"]
+
+
+def edits(kind: str, rows: int, count: int) -> list[CrudInputSchema]:
+    rng = np.random.default_rng(1)
+    if kind == "append":
+        return [
+            CrudInputSchema(
+                method="insert", rows=[rows + i], value=float(i), commit=True
+            )
+            for i in range(count)
+        ]
+    column = "key" if kind == "update key" else "value"
+    return [
+        CrudInputSchema(
+            method="update",
+            rows=[int(row)],
+            columns=[column],
+            value=float(rng.integers(0, 1000)),
+            commit=True,
+        )
+        for row in rng.integers(0, rows, count)
+    ]
+
+
+def measure(table: pd.DataFrame, kind: str, count: int, keep_sorted: bool) -> float:
+    editor = InMemoryEditor(table.copy(), EditorConfig())
+    editor.sort(by=BY, keep_sorted=keep_sorted)
+    handler = CrudHandler(editor)
+    start = time.perf_counter()
+    for args in edits(kind, len(table), count):
+        handler.apply(args)
+        if not keep_sorted:
+            editor.sort(by=BY)
+    elapsed = (time.perf_counter() - start) / count
+    table = editor.table
+    assert table[BY].equals(table.sort_values(BY, kind="stable")[BY])
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--edits", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    table = pd.DataFrame(
+        {
+            "key": rng.integers(0, 1000, args.rows).astype(float),
+            "rank": rng.integers(0, 100, args.rows),
+            "name": rng.choice(["a", "b", "c", "d"], args.rows),
+            "value": rng.random(args.rows),
+        }
+    )
+    print(f"rows={args.rows} edits={args.edits} by={BY}")
+    for kind in ("append", "update key", "update other"):
+        resort = measure(table, kind, args.edits, keep_sorted=False)
+        kept = measure(table, kind, args.edits, keep_sorted=True)
+        print(
+            f"{kind:<13} re-sort {resort * 1000:8.1f} ms/edit   "
+            f"keep_sorted {kept * 1000:8.1f} ms/edit (x{resort / kept:.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark live aggregates on small edits of a large table.
+
+Each edit updates a few rows and reads the aggregate, as a dashboard does. The
+live aggregate updates the groups from the changed rows, while ``group_by``
+computes the aggregation of the new version of the table again.
+
+Usage::
+
+    python -m benchmarks.bench_live_aggregate --rows 1000000 --edits 50
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor import EditorConfig, InMemoryEditor
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--shops", type=int, default=1000)
+    parser.add_argument("--edits", type=int, default=50)
+    parser.add_argument("--changed", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    table = pd.DataFrame(
+        {
+            "shop": rng.integers(0, args.shops, args.rows),
+            "revenue": rng.random(args.rows),
+            "units": rng.integers(0, 10, args.rows),
+        }
+    )
+    aggregations = {"revenue": ["sum", "mean"], "units": ["count", "max"]}
+    print(f"rows={args.rows} shops={args.shops} changed rows per edit={args.changed}")
+    for live in (False, True):
+        editor = InMemoryEditor(table.copy(), EditorConfig())
+        if live:
+            editor.register_aggregate("shops", "shop", aggregations)
+        edits = rng.integers(0, args.rows, (args.edits, args.changed))
+        maintain = read = 0.0
+        for labels in edits:
+            rows = pd.Index(np.unique(labels))
+            edited = editor.table.copy(deep=False)
+            edited["units"] = edited["units"].copy()
+            edited.loc[rows, "units"] = 9
+            start = time.perf_counter()
+            editor.commit(edited, rows=rows)
+            middle = time.perf_counter()
+            if live:
+                editor.live_aggregate("shops")
+            else:
+                editor.group_by("shop", aggregations)
+            maintain += middle - start
+            read += time.perf_counter() - middle
+        name = "live_aggregate" if live else "group_by"
+        print(
+            f"{name:<15} commit {maintain / args.edits * 1000:8.2f} ms/edit  "
+            f"read {read / args.edits * 1000:8.2f} ms/edit"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark the thread pool merge sort against ``sort_values``.
+
+The merge sort runs with each number of threads, in memory and spilling its
+sorted runs to temporary files.
+
+Usage::
+
+    python -m benchmarks.bench_merge_sort --rows 50000000 --workers 1 2 4 8
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor import EditorConfig, InMemoryEditor
+
+
+def measure(table: pd.DataFrame, config: EditorConfig, by: list[str]) -> float:
+    editor = InMemoryEditor(table.copy(), config)
+    start = time.perf_counter()
+    editor.sort(by=by)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunk-rows", type=int, default=1_000_000)
+    parser.add_argument(
+        "--spill-dir", default=None, help="Directory of the spilled runs."
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    table = pd.DataFrame(
+        {
+            "a": rng.integers(0, 1000, args.rows),
+            "b": rng.random(args.rows),
+            "c": rng.random(args.rows),
+        }
+    )
+    print(f"rows={args.rows} chunk_rows={args.chunk_rows}")
+    for by in (["b"], ["a", "b"]):
+        baseline = measure(table, EditorConfig(), by)
+        print(f"by={by}")
+        print(f"  sort_values            : {baseline * 1000:10.1f} ms")
+        for spill in (False, True):
+            for workers in args.workers:
+                config = EditorConfig(
+                    sort_workers=workers,
+                    sort_min_rows=0,
+                    sort_chunk_rows=args.chunk_rows,
+                    sort_spill_bytes=0 if spill else None,
+                    sort_spill_dir=args.spill_dir,
+                )
+                elapsed = measure(table, config, by)
+                label = f"{'spill' if spill else 'memory'} threads={workers}"
+                print(
+                    f"  {label:<23}: {elapsed * 1000:10.1f} ms "
+                    f"(x{baseline / elapsed:.2f})"
+                )
+
+
+if __name__ == "__main__":
+    main()
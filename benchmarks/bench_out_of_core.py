@@ -0,0 +1,98 @@
+"""Benchmark the out-of-core editor on a CSV file written chunk by chunk.
+
+The CSV file is streamed into a Parquet file, then rows are read by label,
+filtered with and without a range of ids which lets the row groups be skipped by
+their statistics, and aggregated by group. The peak memory of the process is
+reported after each step, and stays bounded by the memory limit plus the size
+of a block, whatever the number of rows. Run it in a fresh process for each
+size, since the peak memory never decreases.
+
+Usage::
+
+    python -m benchmarks.bench_out_of_core --rows 20000000 --memory-limit 268435456
+"""
+
+import argparse
+import os
+import resource
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor import EditorConfig, OutOfCoreEditor, Range
+
+
+def peak_memory() -> int:
+    """Peak resident memory of the process in MiB."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024
+
+
+def write_csv(path: str, rows: int, chunk_rows: int = 100_000) -> None:
+    rng = np.random.default_rng(0)
+    for start in range(0, rows, chunk_rows):
+        n = min(chunk_rows, rows - start)
+        pd.DataFrame(
+            {
+                "id": np.arange(start, start + n),
+                "region": rng.choice(["north", "south", "east", "west"], n),
+                "price": rng.random(n).round(4),
+                "units": rng.integers(0, 100, n),
+            }
+        ).to_csv(path, mode="a", header=start == 0, index=False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20_000_000)
+    parser.add_argument("--memory-limit", type=int, default=256 * 2**20)
+    parser.add_argument("--block-bytes", type=int, default=16 * 2**20)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    source = os.path.join(directory, "table.csv")
+    write_csv(source, args.rows)
+    print(
+        f"rows={args.rows} csv={os.path.getsize(source) // 2**20} MiB "
+        f"limit={args.memory_limit // 2**20} MiB peak={peak_memory()} MiB"
+    )
+    config = EditorConfig(
+        out_of_core_memory_limit=args.memory_limit,
+        out_of_core_block_bytes=args.block_bytes,
+        out_of_core_dir=directory,
+    )
+    start = time.perf_counter()
+    editor = OutOfCoreEditor.from_csv(source, config)
+    print(
+        f"{'ingest':<24} {time.perf_counter() - start:8.2f} s  "
+        f"row groups={editor.store.row_groups} peak={peak_memory()} MiB"
+    )
+    rows = np.random.default_rng(1).integers(0, args.rows, 100).tolist()
+    steps = {
+        "get 100 rows": lambda: editor.select(Range(row=rows)).df,
+        "filter with skipping": lambda: editor.query_expr(
+            f"id >= {args.rows - args.rows // 100} and price < 0.5"
+        ),
+        "filter without skipping": lambda: editor.query_expr(
+            "price < 0.00001 and units == 7"
+        ),
+        "group by region": lambda: editor.group_by(
+            "region", {"price": ["sum", "mean"], "units": "max"}
+        ),
+    }
+    for name, step in steps.items():
+        read = editor.store.row_groups_read
+        start = time.perf_counter()
+        step()
+        print(
+            f"{name:<24} {time.perf_counter() - start:8.2f} s  "
+            f"row groups read={editor.store.row_groups_read - read} "
+            f"peak={peak_memory()} MiB"
+        )
+    editor.close()
+    os.remove(source)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark the operators of a partitioned table by number of threads.
+
+Each operator runs on the whole table in pandas, then on the chunks of a
+partitioned table with each number of threads. The speedup over one thread
+depends on the cores available and on how much of each operator pandas runs
+without holding the GIL.
+
+Usage::
+
+    python -m benchmarks.bench_partitioned --rows 5000000 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor import EditorConfig, PartitionedEditor, Range
+
+
+def measure(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--columns", type=int, default=8)
+    parser.add_argument("--chunk-rows", type=int, default=250_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    table = pd.DataFrame(
+        rng.random((args.rows, args.columns)),
+        columns=[f"c{i}" for i in range(args.columns)],
+    )
+    query = "c0 > 0.5 and c1 < 0.1"
+    # A tenth of the rows in the middle of the table.
+    window = (args.rows * 45 // 100, args.rows * 55 // 100)
+    columns = list(table.columns[:4])
+
+    def update_frame() -> None:
+        df = table.copy()
+        df.loc[window[0] : window[1], columns] = 0.0
+
+    cases = {
+        "filter": (
+            lambda: table.query(query),
+            lambda editor: editor.filter(query),
+        ),
+        "update 10% rows": (
+            update_frame,
+            lambda editor: editor.update(Range(cell=(window, columns)), 0.0),
+        ),
+        "delete column": (
+            lambda: table.copy().assign(c0=np.nan),
+            lambda editor: editor.delete(Range(column=["c0"])),
+        ),
+        "aggregate": (
+            lambda: table.agg(["sum", "min", "max", "mean"]),
+            lambda editor: editor.aggregate(["sum", "min", "max", "mean"]),
+        ),
+    }
+
+    print(
+        f"rows={args.rows} columns={args.columns} chunk_rows={args.chunk_rows} "
+        f"cpus={os.cpu_count()}"
+    )
+    header = "".join(f"{f'{w} threads':>12}" for w in args.workers)
+    print(f"{'operator':16}{'pandas':>12}{header}")
+    for name, (baseline, operator) in cases.items():
+        line = f"{name:16}{measure(baseline, args.repeat) * 1000:10.1f}ms"
+        for workers in args.workers:
+            editor = PartitionedEditor(
+                table,
+                EditorConfig(partition_rows=args.chunk_rows, partition_workers=workers),
+            )
+            line += f"{measure(lambda: operator(editor), args.repeat) * 1000:10.1f}ms"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark lazy query plans against the eager pandas pipeline.
+
+The eager pipeline selects the rows, filters them with ``query``, sorts them,
+keeps the returned columns and takes the first rows, copying every column at
+each step. The plan filters before sorting, reads only the columns the
+operators use, fuses the sort and the limit into a top-k and takes the result
+from the table once.
+
+Usage::
+
+    python -m benchmarks.bench_plan --rows 1000000 --columns 20
+"""
+
+import argparse
+import time
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor import EditorConfig, InMemoryEditor, Range
+
+
+def measure(func: Callable[[], object], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--columns", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    table = pd.DataFrame(
+        rng.random((args.rows, args.columns)),
+        columns=[f"c{i}" for i in range(args.columns)],
+    )
+    table["c0"] = rng.integers(0, 10, args.rows)
+    editor = InMemoryEditor(table, EditorConfig())
+    rows = (args.rows // 10, args.rows - 1)
+    pipelines = {
+        "filter+sort+project+limit": (
+            lambda df: df.query("c0 > 4")
+            .sort_values("c1", ascending=False, kind="stable")[["c1", "c2"]]
+            .head(args.limit),
+            lambda plan: plan.filter("c0 > 4")
+            .sort("c1", ascending=False)
+            .project(["c1", "c2"])
+            .limit(args.limit),
+        ),
+        "sort+filter (pushdown)": (
+            lambda df: df.sort_values("c1", kind="stable").query("c0 > 7"),
+            lambda plan: plan.sort("c1").filter("c0 > 7"),
+        ),
+        "filter+project": (
+            lambda df: df.query("c0 == 3")[["c1"]],
+            lambda plan: plan.filter("c0 == 3").project(["c1"]),
+        ),
+    }
+    print(f"rows={args.rows} columns={args.columns} limit={args.limit}")
+    for name, (eager, planned) in pipelines.items():
+        plan = planned(editor.plan().select(Range(row=rows)))
+        eager_time = measure(lambda: eager(editor.table.loc[rows[0] : rows[1]]))
+        plan_time = measure(plan.collect)
+        print(
+            f"{name:<27} eager {eager_time * 1000:8.1f} ms  "
+            f"plan {plan_time * 1000:8.1f} ms  x{eager_time / plan_time:5.1f}"
+        )
+    print()
+    print(plan.explain())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark sorting a table in the process pool with 1, 2, 4 and 8 workers.
+
+Usage::
+
+    python -m benchmarks.bench_process_sort --rows 20000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor import EditorConfig, InMemoryEditor
+
+
+def measure(table: pd.DataFrame, config: EditorConfig, by: list[str]) -> float:
+    editor = InMemoryEditor(table.copy(), config)
+    start = time.perf_counter()
+    editor.sort(by=by)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    table = pd.DataFrame(
+        {
+            "a": rng.integers(0, 1000, args.rows),
+            "b": rng.random(args.rows),
+            "c": rng.random(args.rows),
+        }
+    )
+    by = ["a", "b"]
+
+    print(f"rows={args.rows} by={by}")
+    baseline = measure(table, EditorConfig(), by)
+    print(f"sort_values      : {baseline * 1000:10.1f} ms")
+    for workers in args.workers:
+        config = EditorConfig(process_workers=workers, process_min_rows=0)
+        # Start the pool before measuring.
+        measure(table.iloc[:1000], config, by)
+        elapsed = measure(table, config, by)
+        print(
+            f"process workers={workers}: {elapsed * 1000:10.1f} ms "
+            f"(x{baseline / elapsed:.2f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark GROUP BY through ``InMemoryEditor.query_sql`` against pandas groupby.
+
+Usage::
+
+    python -m benchmarks.bench_query_sql --rows 10000000 --groups 1000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor import InMemoryEditor
+
+
+def make_table(rows: int, groups: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "key": rng.integers(0, groups, rows),
+            "value": rng.random(rows),
+        }
+    )
+
+
+def measure(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--groups", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    editor = InMemoryEditor(make_table(args.rows, args.groups))
+
+    sql_time = measure(
+        lambda: editor.query_sql(
+            "SELECT key, SUM(value) AS total, COUNT(*) AS n FROM data GROUP BY key"
+        ),
+        args.repeat,
+    )
+    pandas_time = measure(
+        lambda: editor.table.groupby("key")["value"].agg(["sum", "count"]),
+        args.repeat,
+    )
+    print(f"rows={args.rows} groups={args.groups}")
+    print(f"query_sql (duckdb): {sql_time * 1000:10.1f} ms")
+    print(f"pandas groupby    : {pandas_time * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
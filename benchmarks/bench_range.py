@@ -0,0 +1,55 @@
+"""Benchmark selecting a contiguous window of rows by slice, label range and label list.
+
+Usage::
+
+    python -m benchmarks.bench_range --rows 5000000 --window 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor import InMemoryEditor, KeyRange, Range
+
+
+def measure(editor: InMemoryEditor, cell_range: Range, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        editor.select(cell_range).get()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--window", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    table = pd.DataFrame(
+        rng.random((args.rows, args.columns)),
+        columns=[f"c{i}" for i in range(args.columns)],
+    )
+    editor = InMemoryEditor(table)
+    start = args.rows // 3
+    stop = start + args.window
+
+    cases = {
+        "slice": Range(row=slice(start, stop)),
+        "label range": Range(row=KeyRange(start, stop - 1)),
+        "label list": Range(row=list(range(start, stop))),
+    }
+    print(f"rows={args.rows} columns={args.columns} window={args.window}")
+    for name, cell_range in cases.items():
+        elapsed = measure(editor, cell_range, args.repeat)
+        print(f"{name:12}: {elapsed * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark the cold start of the server with ``python -X importtime``.
+
+Imports the server module in fresh interpreters and prints the median import
+time, together with the modules taking the most cumulative time.
+
+Usage::
+
+    python -m benchmarks.bench_startup --module mcp_table_editor.mcp.server
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Import a module in a fresh interpreter and get the cumulative time of
+    each imported module in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="mcp_table_editor.mcp.server")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    runs = [import_times(args.module) for _ in range(args.runs)]
+    totals = [times[args.module] for times in runs]
+    print(f"module={args.module} runs={args.runs}")
+    print(f"import time: median {statistics.median(totals) / 1000:8.1f} ms")
+    for name in ("pandas", "numpy", "sqlalchemy", "fastapi", "mcp"):
+        print(f"  {name:12} loaded: {name in runs[-1]}")
+    print(f"top {args.top} modules by cumulative time:")
+    for name, cumulative in sorted(runs[-1].items(), key=lambda item: -item[1])[
+        : args.top
+    ]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark getting the top k rows against sorting the whole table.
+
+Usage::
+
+    python -m benchmarks.bench_top_k --rows 10000000 --k 20
+"""
+
+import argparse
+import time
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor import EditorConfig, InMemoryEditor
+
+
+def measure(func: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    table = pd.DataFrame(
+        {
+            "revenue": rng.random(args.rows),
+            "units": rng.integers(0, 100, args.rows),
+            "region": rng.choice(["north", "south", "east", "west"], args.rows),
+        }
+    )
+    editor = InMemoryEditor(table, EditorConfig())
+    k = args.k
+
+    cases = {
+        "revenue desc": (["revenue"], False, None),
+        "units desc, revenue desc": (["units", "revenue"], False, None),
+        "region by values, revenue desc": (
+            ["region", "revenue"],
+            [True, False],
+            {"region": ["west", "east"]},
+        ),
+    }
+    print(f"rows={args.rows} k={k}")
+    for name, (by, ascending, values) in cases.items():
+        if values is None:
+            full = measure(
+                lambda: table.sort_values(by, ascending=ascending).head(k),
+                args.repeat,
+            )
+        else:
+            order = pd.Index(values["region"]).get_indexer(table["region"])
+            order[order == -1] = len(values["region"])
+            keyed = table.assign(order=order)
+            full = measure(
+                lambda: keyed.sort_values(["order", "revenue"], ascending=ascending)
+                .drop(columns="order")
+                .head(k),
+                args.repeat,
+            )
+        top_k = measure(lambda: editor.top_k(by, k, ascending, values), args.repeat)
+        print(
+            f"{name:<32} full sort {full * 1000:9.1f} ms   "
+            f"top_k {top_k * 1000:8.1f} ms (x{full / top_k:.1f})"
+        )
+    nlargest = measure(lambda: table.nlargest(k, "revenue"), args.repeat)
+    print(f"{'revenue nlargest':<32} {nlargest * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""Benchmark suite running every handler of TOOL_HANDLERS across table sizes.
+
+Each handler is run through ``HandlerTool.run`` against synthetic tables,
+recording the latency, the peak memory traced by ``tracemalloc`` and the size of
+the response. The results are written as JSON, and can be compared against a
+saved baseline: the run fails with exit code 1 if a case regressed by more than
+the tolerance.
+
+Usage::
+
+    # Record a baseline
+    python -m benchmarks.suite --output baseline.json
+    # Compare a later run against it
+    python -m benchmarks.suite --baseline baseline.json --output current.json
+    # All the sizes, from 1k to 10M rows and 10 to 1000 columns
+    python -m benchmarks.suite --full --max-cells 100000000
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor import InMemoryEditor
+from mcp_table_editor.handler import TOOL_HANDLERS
+from mcp_table_editor.mcp.handler_tool import HandlerTool
+
+DEFAULT_ROWS = [1_000, 10_000, 100_000]
+DEFAULT_COLUMNS = [10, 100]
+FULL_ROWS = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+FULL_COLUMNS = [10, 100, 1_000]
+
+
+@dataclass
+class Case:
+    """Arguments of a handler for a table size, and whether it changes the table."""
+
+    args: Callable[[int, int], dict[str, Any]]
+    mutates: bool = False
+
+
+def _rows(rows: int, count: int) -> list[int]:
+    return list(range(0, rows, max(rows // count, 1)))[:count]
+
+
+CASES: dict[str, Case] = {
+    "Table CRUD handler": Case(
+        lambda rows, columns: {"method": "get", "rows": _rows(rows, 10)}
+    ),
+    "get_content": Case(
+        lambda rows, columns: {"rows": _rows(rows, 10), "columns": ["c0", "c1"]}
+    ),
+    "update_content": Case(
+        lambda rows, columns: {
+            "rows": _rows(rows, 100),
+            "columns": ["c1"],
+            "value": 0.5,
+            "response_mode": "diff",
+        }
+    ),
+    "insert_cell": Case(
+        lambda rows, columns: {
+            "rows": [rows // 2],
+            "value": 0.5,
+            "response_mode": "diff",
+        }
+    ),
+    "delete_content": Case(
+        lambda rows, columns: {
+            "rows": _rows(rows, 100),
+            "columns": ["c1"],
+            "response_mode": "diff",
+        }
+    ),
+    "remove_content": Case(
+        lambda rows, columns: {"rows": _rows(rows, 100), "response_mode": "diff"}
+    ),
+    "drop_content": Case(
+        lambda rows, columns: {"columns": ["c1"], "response_mode": "diff"}
+    ),
+    "sort": Case(lambda rows, columns: {"by": ["c1"]}, mutates=True),
+    "sort_by_value": Case(
+        lambda rows, columns: {"by": ["c0"], "values": [[3, 1, 4]]}, mutates=True
+    ),
+    "top_k": Case(lambda rows, columns: {"by": ["c1"], "k": 20}),
+    "aggregate": Case(
+        lambda rows, columns: {"by": ["c0"], "aggregations": {"c1": ["sum", "mean"]}}
+    ),
+    "query": Case(
+        lambda rows, columns: {
+            "filter": "c0 > 4",
+            "sort_by": ["c1"],
+            "columns": ["c0", "c1"],
+            "limit": 20,
+        }
+    ),
+    "flush": Case(lambda rows, columns: {}),
+    "trace": Case(lambda rows, columns: {"last": 10}),
+    "batch": Case(
+        lambda rows, columns: {
+            "operations": [
+                {
+                    "tool": "update_content",
+                    "args": {"rows": [row], "columns": ["c1"], "value": 0.5},
+                }
+                for row in _rows(rows, 10)
+            ],
+            "commit": False,
+        }
+    ),
+}
+
+
+@dataclass
+class Result:
+    handler: str
+    rows: int
+    columns: int
+    latency_ms: float
+    min_latency_ms: float
+    peak_memory_bytes: int
+    response_bytes: int
+
+    @property
+    def key(self) -> tuple[str, int, int]:
+        return (self.handler, self.rows, self.columns)
+
+
+def make_table(rows: int, columns: int, seed: int = 0) -> pd.DataFrame:
+    """A table of random floats, except `c0` holding small integer keys."""
+    rng = np.random.default_rng(seed)
+    table = pd.DataFrame(
+        rng.random((rows, columns)), columns=[f"c{i}" for i in range(columns)]
+    )
+    table["c0"] = rng.integers(0, 10, rows)
+    return table
+
+
+def run_case(tool: HandlerTool, case: Case, table: pd.DataFrame, repeat: int) -> Result:
+    rows, columns = table.shape
+    args = case.args(rows, columns)
+    editor = InMemoryEditor(table)
+
+    def prepare() -> InMemoryEditor:
+        return InMemoryEditor(table.copy()) if case.mutates else editor
+
+    latencies = []
+    response_bytes = 0
+    for _ in range(repeat):
+        target = prepare()
+        start = time.perf_counter()
+        response = tool.run(target, args)
+        latencies.append(time.perf_counter() - start)
+        response_bytes = sum(len(content.text) for content in response)
+
+    # Tracing slows the handler down, so the memory is measured in a separate run.
+    target = prepare()
+    tracemalloc.start()
+    try:
+        tool.run(target, args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Result(
+        handler=tool.name,
+        rows=rows,
+        columns=columns,
+        latency_ms=statistics.median(latencies) * 1000,
+        min_latency_ms=min(latencies) * 1000,
+        peak_memory_bytes=peak,
+        response_bytes=response_bytes,
+    )
+
+
+def compare(
+    results: list[Result], baseline: list[Result], tolerance: float
+) -> list[str]:
+    """Get the regressions of the results against the baseline."""
+    previous = {result.key: result for result in baseline}
+    regressions = []
+    for result in results:
+        base = previous.get(result.key)
+        if base is None:
+            continue
+        for metric in ("latency_ms", "peak_memory_bytes", "response_bytes"):
+            value, reference = getattr(result, metric), getattr(base, metric)
+            if value > reference * (1 + tolerance):
+                regressions.append(
+                    f"{result.handler} rows={result.rows} columns={result.columns}: "
+                    f"{metric} {reference:.6g} -> {value:.6g} "
+                    f"(+{(value / max(reference, 1e-9) - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def load(path: str) -> list[Result]:
+    with open(path) as f:
+        return [Result(**result) for result in json.load(f)["results"]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS)
+    parser.add_argument("--columns", type=int, nargs="+", default=DEFAULT_COLUMNS)
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Run all the sizes, from 1k to 10M rows and 10 to 1000 columns.",
+    )
+    parser.add_argument(
+        "--max-cells",
+        type=int,
+        default=10_000_000,
+        help="Skip the table sizes with more cells than this.",
+    )
+    parser.add_argument(
+        "--handlers",
+        nargs="+",
+        default=None,
+        help="Names of the handlers to run. All of TOOL_HANDLERS by default.",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="Path of the JSON file to write.")
+    parser.add_argument("--baseline", help="Path of a JSON file to compare with.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Relative increase of a metric over the baseline considered a regression.",
+    )
+    args = parser.parse_args()
+
+    rows_list = FULL_ROWS if args.full else args.rows
+    columns_list = FULL_COLUMNS if args.full else args.columns
+    tools = [
+        HandlerTool(handler)
+        for handler in TOOL_HANDLERS
+        if args.handlers is None or handler.name in args.handlers
+    ]
+
+    results: list[Result] = []
+    for rows in rows_list:
+        for columns in columns_list:
+            if rows * columns > args.max_cells:
+                print(f"skip rows={rows} columns={columns}: over --max-cells")
+                continue
+            table = make_table(rows, columns)
+            for tool in tools:
+                if tool.name not in CASES:
+                    print(f"skip {tool.name}: no benchmark case")
+                    continue
+                result = run_case(tool, CASES[tool.name], table, args.repeat)
+                results.append(result)
+                print(
+                    f"{result.handler:20} rows={rows:>9} columns={columns:>5} "
+                    f"{result.latency_ms:10.2f} ms "
+                    f"{result.peak_memory_bytes / 2**20:9.1f} MiB "
+                    f"{result.response_bytes:>9} bytes"
+                )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "meta": {
+                        "python": platform.python_version(),
+                        "pandas": pd.__version__,
+                        "numpy": np.__version__,
+                        "machine": platform.machine(),
+                    },
+                    "results": [asdict(result) for result in results],
+                },
+                f,
+                indent=2,
+            )
+
+    if args.baseline:
+        regressions = compare(results, load(args.baseline), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print("no regression against the baseline")
+
+
+if __name__ == "__main__":
+    main()
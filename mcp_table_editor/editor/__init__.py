@@ -1,12 +1,41 @@
+from typing import TYPE_CHECKING, Any
+
 from mcp_table_editor.editor._config import EditorConfig
 from mcp_table_editor.editor._in_memory_editor import InMemoryEditor
-from mcp_table_editor.editor._range import Range
+from mcp_table_editor.editor._partitioned_editor import PartitionedEditor
+from mcp_table_editor.editor._range import KeyRange, Range
 from mcp_table_editor.editor._selector import InsertRule, Selector
 
+if TYPE_CHECKING:
+    from mcp_table_editor.editor._out_of_core import OutOfCoreEditor
+    from mcp_table_editor.editor._write_behind_editor import WriteBehindEditor
+
+# Names loaded on first access, so that importing the package does not import
+# sqlalchemy or pyarrow unless a persistent or out-of-core store is used.
+_LAZY_ATTRIBUTES = {
+    "OutOfCoreEditor": "mcp_table_editor.editor._out_of_core",
+    "WriteBehindEditor": "mcp_table_editor.editor._write_behind_editor",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     "InMemoryEditor",
+    "PartitionedEditor",
+    "KeyRange",
     "Range",
     "Selector",
     "InsertRule",
     "EditorConfig",
+    "WriteBehindEditor",
+    "OutOfCoreEditor",
 ]
@@ -0,0 +1,147 @@
+import threading
+from collections import OrderedDict
+from typing import Hashable, Mapping, Sequence
+
+import pandas as pd
+
+# Aggregations of the values of a column over a group of rows.
+AGGREGATIONS = ("sum", "mean", "count", "min", "max", "nunique")
+
+AggregationSpec = Mapping[str, str | Sequence[str]]
+
+
+def normalize_aggregations(
+    aggregations: AggregationSpec, columns: pd.Index
+) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """
+    Check the aggregations of each column, and put them in a canonical order,
+    which is hashable.
+
+    Raises
+    ------
+    ValueError
+        If there is no aggregation, or an aggregation is not supported.
+    KeyError
+        If a column is not in the table.
+    """
+    if not aggregations:
+        raise ValueError("At least one aggregation is required.")
+    missing = [column for column in aggregations if column not in columns]
+    if missing:
+        raise KeyError(f"Columns not in the table: {missing}")
+    spec = []
+    for column, funcs in aggregations.items():
+        funcs = (funcs,) if isinstance(funcs, str) else tuple(funcs)
+        unknown = [func for func in funcs if func not in AGGREGATIONS]
+        if unknown or not funcs:
+            raise ValueError(
+                f"Unsupported aggregations {unknown} of column {column!r}, "
+                f"expected some of {AGGREGATIONS}."
+            )
+        spec.append((column, tuple(dict.fromkeys(funcs))))
+    return tuple(spec)
+
+
+def group_aggregate(
+    table: pd.DataFrame,
+    groupers: Sequence[pd.Categorical],
+    by: Sequence[str],
+    spec: tuple[tuple[str, tuple[str, ...]], ...],
+) -> pd.DataFrame:
+    """
+    Aggregate the columns of a table by groups of rows.
+
+    Parameters
+    ----------
+    table : pd.DataFrame
+        The table.
+    groupers : Sequence[pd.Categorical]
+        The group keys, coded as categoricals so that pandas groups the rows by
+        their codes without hashing the values again. Rows with a missing key
+        are left out.
+    by : Sequence[str]
+        The names of the group keys.
+    spec : tuple[tuple[str, tuple[str, ...]], ...]
+        The aggregations of each column, see `normalize_aggregations`.
+
+    Returns
+    -------
+    pd.DataFrame
+        A row per group sorted by the keys, with the keys in the dtypes of their
+        columns and a column "<column>_<aggregation>" per aggregation. A single
+        row without keys if there is no group key.
+    """
+    columns = [column for column, _ in spec]
+    names = [f"{column}_{func}" for column, funcs in spec for func in funcs]
+    if not groupers:
+        row = [table[column].agg(func) for column, funcs in spec for func in funcs]
+        return pd.DataFrame([row], columns=names)
+    grouped = table[columns].groupby(list(groupers), observed=True, sort=True)
+    result = grouped.agg({column: list(funcs) for column, funcs in spec})
+    result.columns = names
+    result.index.names = list(by)
+    result = result.reset_index()
+    # The keys are categoricals of the groupers, not the values of the columns.
+    return result.astype({column: table[column].dtype for column in by})
+
+
+class AggregateCache:
+    """
+    Results of the aggregations of a version of the table, and the codes of the
+    group keys they used.
+
+    Everything is dropped when the version changes, since any edit may change
+    the results. The version is any token identifying the state of the table.
+    The results are evicted least recently used first.
+    """
+
+    def __init__(self, max_results: int = 32) -> None:
+        self.max_results = max_results
+        self._guard = threading.Lock()
+        self._version: Hashable = None
+        self._results: OrderedDict[Hashable, pd.DataFrame] = OrderedDict()
+        self._keys: dict[str, pd.Categorical] = {}
+
+    def _check(self, version: Hashable) -> None:
+        if version != self._version:
+            self._version = version
+            self._results.clear()
+            self._keys.clear()
+
+    def get(self, version: Hashable, key: Hashable) -> pd.DataFrame | None:
+        """Get the cached result of an aggregation of a version, if any."""
+        with self._guard:
+            self._check(version)
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+            return result
+
+    def put(self, version: Hashable, key: Hashable, result: pd.DataFrame) -> None:
+        """Cache the result of an aggregation of a version."""
+        with self._guard:
+            self._check(version)
+            self._results[key] = result
+            while len(self._results) > self.max_results:
+                self._results.popitem(last=False)
+
+    def grouper(
+        self, version: Hashable, column: str, values: pd.Series
+    ) -> pd.Categorical:
+        """
+        Get the values of a group key of a version coded as a categorical.
+        The codes are computed once per version, and shared by the aggregations.
+        """
+        with self._guard:
+            self._check(version)
+            grouper = self._keys.get(column)
+        if grouper is None:
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                grouper = values.array
+            else:
+                codes, uniques = pd.factorize(values, sort=True)
+                grouper = pd.Categorical.from_codes(codes, categories=uniques)
+            with self._guard:
+                if version == self._version:
+                    self._keys[column] = grouper
+        return grouper
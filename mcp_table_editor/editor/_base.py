@@ -1,4 +1,4 @@
-from typing import Protocol, Sequence
+from typing import Any, Mapping, Protocol, Sequence
 
 import pandas as pd
 
@@ -89,7 +89,10 @@ class BaseEditor(Protocol):
         ...
 
     def sort(
-        self, by: str | Sequence[str] | None = None, ascending: bool = True
+        self,
+        by: str | Sequence[str] | None = None,
+        ascending: bool = True,
+        keep_sorted: bool = False,
     ) -> None:
         """
         Sort the table by the given column(s).
@@ -101,6 +104,8 @@ class BaseEditor(Protocol):
             Default to None
         ascending : bool, default True
             Whether to sort in ascending order. If False, sort in descending order.
+        keep_sorted : bool, default False
+            Whether to keep the table sorted by the column(s) on later edits.
         """
         ...
 
@@ -119,6 +124,45 @@ class BaseEditor(Protocol):
         """
         ...
 
+    def top_k(
+        self,
+        by: str | Sequence[str],
+        k: int,
+        ascending: bool | Sequence[bool] = True,
+        values: Mapping[str, Sequence[Any]] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Get the first k rows of the table in sorted order, without sorting it.
+
+        Parameters
+        ----------
+        by : str | list[str]
+            The column(s) to sort by.
+        k : int
+            The number of rows.
+        ascending : bool | list[bool], default True
+            Whether to sort each column in ascending order.
+        values : dict[str, list] | None
+            Custom order of the values of some of the columns, as in `sort_by_values`.
+        """
+        ...
+
+    def group_by(
+        self, by: str | Sequence[str], aggregations: Mapping[str, str | Sequence[str]]
+    ) -> pd.DataFrame:
+        """
+        Aggregate columns of the table by groups of rows.
+
+        Parameters
+        ----------
+        by : str | list[str]
+            The column(s) grouping the rows. If empty, the whole table is one group.
+        aggregations : dict[str, str | list[str]]
+            The aggregations of each column, some of "sum", "mean", "count",
+            "min", "max" and "nunique".
+        """
+        ...
+
     def get_table(self) -> pd.DataFrame:
         """
         Get the table as a pandas DataFrame.
@@ -16,6 +16,154 @@ class EditorConfig(BaseModel):
         description="Maximum number of rows in the editor.",
     )
 
+    # Process pool execution
+    process_workers: int | None = Field(
+        None,
+        description=(
+            "Number of worker processes sorting large tables over shared memory. "
+            "If None, sorting runs in the calling thread."
+        ),
+    )
+    process_min_rows: int = Field(
+        1_000_000,
+        description="Minimum number of rows of a table sorted in the process pool.",
+    )
+
+    # Thread pool merge sort
+    sort_workers: int | None = Field(
+        None,
+        description=(
+            "Number of threads sorting large tables with a parallel merge sort. "
+            "If None, sorting runs in the calling thread."
+        ),
+    )
+    sort_min_rows: int = Field(
+        1_000_000,
+        description="Minimum number of rows of a table sorted by the merge sort.",
+    )
+    sort_chunk_rows: int = Field(
+        1_000_000,
+        description="Number of rows of each run sorted by a thread of the merge sort.",
+    )
+    sort_spill_bytes: int | None = Field(
+        None,
+        description=(
+            "Size in bytes of the sort keys over which the sorted runs are written "
+            "to temporary files and merged from disk. If None, they stay in memory."
+        ),
+    )
+    sort_spill_dir: str | None = Field(
+        None,
+        description=(
+            "Directory of the temporary files of the merge sort. "
+            "If None, the default temporary directory."
+        ),
+    )
+
+    # Append buffer
+    append_chunk_rows: int = Field(
+        4096,
+        description=(
+            "Number of appended rows buffered as Python values before they are "
+            "converted to a chunk of the table."
+        ),
+    )
+
+    # Partitioned storage
+    partition_rows: int = Field(
+        1_000_000,
+        description="Number of rows of each chunk of a partitioned table.",
+    )
+    partition_workers: int | None = Field(
+        None,
+        description=(
+            "Number of threads running the operators of a partitioned table "
+            "on its chunks. If None, the number of CPUs."
+        ),
+    )
+
+    # Aggregations
+    aggregate_cache_size: int = Field(
+        32,
+        description=(
+            "Number of results of aggregations cached for the current version "
+            "of the table."
+        ),
+    )
+
+    # Write-behind persistence
+    flush_interval: float = Field(
+        1.0,
+        description="Interval in seconds between writes of pending changes to the store.",
+    )
+    flush_rows: int = Field(
+        1000,
+        description="Number of pending rows which triggers a write before the interval.",
+    )
+    flush_max_backoff: float = Field(
+        60.0,
+        description=(
+            "Maximum time in seconds between retries of a failed write, which "
+            "doubles from the flush interval after each failure."
+        ),
+    )
+
+    # Memory budget
+    memory_soft_limit: int | None = Field(
+        None,
+        description=(
+            "Memory in bytes over which edits growing the table log a warning, "
+            "and the numeric columns of the table are downcast to smaller dtypes "
+            "if `memory_compact_dtypes` is set. If None, there is no soft limit."
+        ),
+    )
+    memory_compact_dtypes: bool = Field(
+        False,
+        description=(
+            "Whether to downcast the numeric columns of a table over the soft limit, "
+            "which changes the dtypes seen by the clients, e.g. int64 to int8. "
+            "Otherwise, the table is only reported in the log."
+        ),
+    )
+    memory_hard_limit: int | None = Field(
+        None,
+        description=(
+            "Memory in bytes over which edits growing the table are rejected. "
+            "If None, the table may grow without limit."
+        ),
+    )
+    memory_sample_rows: int = Field(
+        1000,
+        description="Number of rows sampled to estimate the memory of object columns.",
+    )
+    memory_resample_interval: int = Field(
+        100,
+        description="Number of estimates of the memory after which object columns are sampled again.",
+    )
+
+    # Out-of-core storage
+    out_of_core_memory_limit: int = Field(
+        256 * 2**20,
+        description=(
+            "Memory in bytes used by an out-of-core table, for the row groups "
+            "read from disk and the results of reads, whatever its size."
+        ),
+    )
+    out_of_core_block_bytes: int = Field(
+        16 * 2**20,
+        description=(
+            "Number of bytes of CSV text converted at a time into a row group "
+            "of an out-of-core table."
+        ),
+    )
+    out_of_core_dir: str | None = Field(
+        None,
+        description=(
+            "Directory of the Parquet files of out-of-core tables. "
+            "If None, the default temporary directory."
+        ),
+    )
+
     @classmethod
     def default(cls) -> "EditorConfig":
         """
@@ -1,13 +1,49 @@
-from typing import Any, Iterable, Protocol, Sequence, TypeVar
+import tempfile
+import threading
+from functools import partial
+from logging import getLogger
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Iterable,
+    Mapping,
+    Protocol,
+    Sequence,
+    TypeVar,
+)
 
+import numpy as np
 import pandas as pd
 from ulid import ULID
 
+from mcp_table_editor.editor._aggregate import (
+    AggregateCache,
+    AggregationSpec,
+    group_aggregate,
+    normalize_aggregations,
+)
 from mcp_table_editor.editor._base import BaseEditor
 from mcp_table_editor.editor._config import EditorConfig
 from mcp_table_editor.editor._in_memory_selector import InMemorySelector
+from mcp_table_editor.editor._live_aggregate import LiveAggregate, changed_rows
+from mcp_table_editor.editor._memory import MemoryAccount, compact_dtypes
+from mcp_table_editor.editor._merge_sort import is_sortable, merge_argsort
+from mcp_table_editor.editor._plan import QueryPlan
 from mcp_table_editor.editor._range import Range
-from mcp_table_editor.editor._selector import Selector
+from mcp_table_editor.editor._selector import InsertRule, Selector
+from mcp_table_editor.editor._shared_memory import (
+    SharedTable,
+    is_shareable,
+    parallel_argsort,
+)
+from mcp_table_editor.editor._sorted import restore_order
+from mcp_table_editor.editor._top_k import key_code, top_k_positions
+
+_logger = getLogger(__name__)
+
+SQL_TABLE_NAME = "data"
+SQL_ID_COLUMN = "_id"
 
 
 class InMemoryEditor(BaseEditor):
@@ -17,12 +53,47 @@ class InMemoryEditor(BaseEditor):
         config: EditorConfig | None = None,
     ) -> None:
         self.id = ULID().hex
+        # Appended rows not joined to the table yet, see `append`.
+        self._append_guard = threading.Lock()
+        self.config = config or EditorConfig.default()
         if table is None:
             table = pd.DataFrame()
-        else:
-            self.table = table
+        self.table = table
         self.schema: dict[str, str] = {}
-        self.config = config or EditorConfig.default()
+        # Incremented on every change of the table.
+        self.version = 0
+        self._memory = MemoryAccount(
+            self.config.memory_sample_rows, self.config.memory_resample_interval
+        )
+        self._memory_usage: tuple[int, int, int] | None = None
+        # Memory of the table when it last went over the soft limit.
+        self._soft_limit_usage = 0
+        # The columns and order the table is kept sorted by, see `sort`.
+        self.sort_key: tuple[list[str], bool] | None = None
+        self._aggregates = AggregateCache(self.config.aggregate_cache_size)
+        # Aggregations kept up to date on every edit, see `register_aggregate`.
+        self._live_aggregates: dict[str, LiveAggregate] = {}
+        # Key columns of the current version in shared memory, see `_shared_table`.
+        self._shared: tuple[tuple[int, int], SharedTable] | None = None
+
+    @property
+    def table(self) -> pd.DataFrame:
+        """
+        The table, including the rows appended since it was last read.
+        """
+        if self._chunks or self._tail_index:
+            self._consolidate()
+        return self._table
+
+    @table.setter
+    def table(self, table: pd.DataFrame) -> None:
+        self._table = table
+        # Chunks of appended rows, and the appended rows not converted to a chunk yet.
+        self._chunks: list[pd.DataFrame] = []
+        self._chunk_rows = 0
+        self._chunks_usage = 0
+        self._tail_index: list[Any] = []
+        self._tail_rows: list[list[Any]] = []
 
     def query_expr(self, query: str) -> pd.DataFrame:
         """
@@ -40,23 +111,57 @@ class InMemoryEditor(BaseEditor):
         """
         return self.table.query(query)
 
-    def query_sql(self, query: str) -> pd.DataFrame:
+    def query_sql(
+        self, query: str, tables: Mapping[str, pd.DataFrame] | None = None
+    ) -> pd.DataFrame:
         """
         Query the table with a given SQL expression.
 
+        The query is executed by an embedded DuckDB engine which scans the
+        DataFrame columns in place instead of copying them into a database.
+        The table is exposed as ``data`` and its index as the ``_id`` column,
+        like the table layout used by ``SqlEditor``.
+
         Parameters
         ----------
         query : str
             The SQL expression to filter the table.
+        tables : Mapping[str, pd.DataFrame] | None
+            Additional tables to expose to the query by name, e.g. for joins.
 
         Returns
         -------
-        Selector
-            A Selector object that contains the filtered table.
+        pd.DataFrame
+            A DataFrame that contains the result of the query.
+            If the result contains the ``_id`` column, it is used as the index.
         """
-        raise NotImplementedError(
-            "SQL query is not implemented yet. Please use query_expr instead."
-        )
+        try:
+            import duckdb
+        except ImportError as e:
+            raise ImportError(
+                "SQL query requires duckdb. Please install it with "
+                "`pip install mcp-table-editor[sql]`."
+            ) from e
+
+        with duckdb.connect() as conn:
+            conn.register(SQL_TABLE_NAME, _with_id_column(self.table))
+            for name, table in (tables or {}).items():
+                conn.register(name, _with_id_column(table))
+            result = conn.execute(query).df()
+
+        if SQL_ID_COLUMN in result.columns:
+            result = result.set_index(SQL_ID_COLUMN)
+            result.index.name = self.table.index.name
+        return result
+
+    def plan(self) -> QueryPlan:
+        """
+        Start a lazy query of the table, which is optimized and run at once
+        when it is collected, e.g.
+        ``editor.plan().filter("price > 10").sort("price").limit(5).collect()``,
+        see `QueryPlan`.
+        """
+        return QueryPlan(self)
 
     def select(self, range: Range) -> Selector:
         """Select a range of cells in the table.
@@ -95,8 +200,258 @@ class InMemoryEditor(BaseEditor):
             self.config,
         )
 
+    def commit(self, table: pd.DataFrame, rows: pd.Index | None = None) -> None:
+        """
+        Replace the table with an edited version of it.
+
+        Parameters
+        ----------
+        table : pd.DataFrame
+            The edited table, e.g. the dataframe of a selector after an operation.
+        rows : pd.Index | None
+            The labels of the rows which may have been changed by the edit.
+            If None, any row may have been changed.
+
+        Raises
+        ------
+        ValueError
+            If the edit grows the table over `config.memory_hard_limit`.
+        """
+        if self.sort_key is not None:
+            table = self._restore_order(table, rows)
+        hard_limit = self.config.memory_hard_limit
+        soft_limit = self.config.memory_soft_limit
+        usage = None
+        if hard_limit is not None or soft_limit is not None:
+            usage = self._memory.estimate(table)
+            if soft_limit is not None and usage > soft_limit:
+                table, usage = self._over_soft_limit(table, usage)
+            if (
+                hard_limit is not None
+                and usage > hard_limit
+                and usage > self.memory_usage
+            ):
+                raise ValueError(
+                    f"The edit is rejected because the table would use about "
+                    f"{usage} bytes, over the memory limit of {hard_limit} bytes. "
+                    "Drop rows or columns to free memory first."
+                )
+        if self._live_aggregates:
+            self._update_aggregates(self.table, table, rows)
+        self.table = table
+        self.version += 1
+        if usage is not None:
+            self._memory_usage = (self.version, self._storage_id(), usage)
+
+    def append(
+        self,
+        index: Sequence[Any] | pd.Index,
+        value: Any = pd.NA,
+        insert_rule: InsertRule = InsertRule.ABOVE,
+    ) -> list[list[Any]]:
+        """
+        Append rows filled with a value at the end of the table.
+
+        The rows are buffered as Python values and converted to chunks of
+        `config.append_chunk_rows` rows, which are joined to the table when it is
+        read or when they are as large as the table. Appending rows one at a time
+        takes amortized constant time then, instead of copying the table each time.
+        If a memory limit is set, the rows are committed at once to check it.
+        The live aggregates are updated with the new rows only.
+
+        Parameters
+        ----------
+        index : Sequence[Any] | pd.Index
+            The labels of the new rows.
+        value : Any
+            The scalar value of the cells of the new rows.
+        insert_rule : InsertRule
+            If ABOVE and the value is missing, the new rows copy the last row.
+
+        Returns
+        -------
+        list[list[Any]]
+            The values of the new rows, in the order of the columns.
+        """
+        columns = self.columns
+        if not pd.isna(value):
+            row = [value] * len(columns)
+        elif insert_rule == InsertRule.ABOVE and self.shape[0] > 0:
+            row = self._last_row()
+        else:
+            row = [np.nan] * len(columns)
+        index = list(index)
+        rows = [list(row) for _ in index]
+
+        if self._commits_appends():
+            appended = pd.DataFrame(rows, index=index, columns=columns)
+            self.commit(pd.concat([self.table, appended]), rows=pd.Index([]))
+            return rows
+
+        if self._live_aggregates:
+            appended = pd.DataFrame(rows, index=index, columns=columns)
+            for aggregate in self._live_aggregates.values():
+                aggregate.update(appended.iloc[:0], appended)
+        self._tail_index.extend(index)
+        self._tail_rows.extend(rows)
+        if len(self._tail_index) >= self.config.append_chunk_rows:
+            chunk = self._tail_chunk()
+            self._chunks.append(chunk)
+            self._chunk_rows += len(chunk)
+            self._chunks_usage += self._memory.estimate(chunk)
+            self._tail_index, self._tail_rows = [], []
+            if self._chunk_rows >= self._stored_rows():
+                # Joining the chunks copies the table only when they doubled its size.
+                self._consolidate()
+        cached = self._memory_usage
+        if cached is not None and cached[:2] == (self.version, self._storage_id()):
+            # The estimate of the table is still valid, the buffer is added to it.
+            self._memory_usage = (self.version + 1, *cached[1:])
+        self.version += 1
+        return rows
+
+    def _has_memory_limit(self) -> bool:
+        return (
+            self.config.memory_soft_limit is not None
+            or self.config.memory_hard_limit is not None
+        )
+
+    def _commits_appends(self) -> bool:
+        """
+        Whether appended rows are committed at once instead of being buffered,
+        to check the memory limits or to place them in the sort order.
+        """
+        return self._has_memory_limit() or self.sort_key is not None
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """
+        Number of rows and columns of the table, without joining the appended rows.
+        """
+        rows = self._stored_rows() + self._chunk_rows + len(self._tail_index)
+        return rows, len(self.columns)
+
+    def _stored_rows(self) -> int:
+        """Number of rows of the table, without the appended rows."""
+        return len(self._table)
+
+    def _storage_id(self) -> int:
+        """Identity of the table without the appended rows, which is replaced on change."""
+        return id(self._table)
+
+    def _last_row(self) -> list[Any]:
+        if self._tail_rows:
+            return self._tail_rows[-1]
+        last = self._chunks[-1] if self._chunks else self._table
+        return last.iloc[-1].tolist()
+
+    def _tail_chunk(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            self._tail_rows, index=self._tail_index, columns=self.columns
+        )
+
+    def _consolidate(self) -> None:
+        """
+        Join the appended rows to the table.
+        Readers may call it concurrently, so that it is serialized by a lock.
+        """
+        with self._append_guard:
+            if not (self._chunks or self._tail_index):
+                return
+            parts = [self._table, *self._chunks]
+            if self._tail_index:
+                parts.append(self._tail_chunk())
+            self.table = pd.concat(parts)
+
+    @property
+    def memory_usage(self) -> int:
+        """
+        Estimated memory used by the table in bytes.
+        The estimate is updated when the table changes, see `MemoryAccount`.
+        """
+        cached = self._memory_usage
+        if cached is None or cached[:2] != (self.version, self._storage_id()):
+            cached = (self.version, self._storage_id(), self._estimate_stored())
+            self._memory_usage = cached
+        usage = cached[2] + self._chunks_usage
+        if self._tail_index:
+            # Assume the buffered rows take as much as the rows of the table.
+            rows = self._stored_rows() + self._chunk_rows
+            if rows > 0:
+                usage += usage * len(self._tail_index) // rows
+        return usage
+
+    def _estimate_stored(self) -> int:
+        """Estimate the memory of the table without the appended rows."""
+        return self._memory.estimate(self._table)
+
+    def _over_soft_limit(
+        self, table: pd.DataFrame, usage: int
+    ) -> tuple[pd.DataFrame, int]:
+        """
+        Warn about a table over the soft memory limit, and downcast its columns if
+        `config.memory_compact_dtypes` is set. This is done again only after the
+        table grew by a tenth since the last time.
+        """
+        if usage <= self._soft_limit_usage * 1.1:
+            return table, usage
+        self._soft_limit_usage = usage
+        if not self.config.memory_compact_dtypes:
+            _logger.warning(
+                "The table uses about %d bytes, over the soft memory limit of %d "
+                "bytes. Drop rows or columns to free memory, or enable "
+                "memory_compact_dtypes to downcast the numeric columns.",
+                usage,
+                self.config.memory_soft_limit,
+            )
+            return table, usage
+        compacted = compact_dtypes(table)
+        changes = [
+            f"{column}: {before} -> {after}"
+            for column, before, after in zip(
+                table.columns, table.dtypes, compacted.dtypes
+            )
+            if before != after
+        ]
+        if changes:
+            _logger.warning(
+                "Downcast columns over the soft memory limit: %s", ", ".join(changes)
+            )
+        table = compacted
+        usage = self._memory.estimate(table)
+        self._soft_limit_usage = usage
+        return table, usage
+
+    def flush(self, timeout: float | None = None) -> int:
+        """
+        Write pending changes of the table to its persistent store.
+        The in-memory editor has no store, so there is nothing to write.
+
+        Parameters
+        ----------
+        timeout : float | None
+            Maximum time to wait in seconds. If None, wait until the changes are written.
+
+        Returns
+        -------
+        int
+            The latest version of the table written to the store.
+        """
+        return self.version
+
+    def close(self) -> None:
+        """
+        Release the resources held by the editor.
+        The in-memory editor holds the table, and its key columns in shared memory
+        if it was sorted in the process pool.
+        """
+        self._release_shared()
+
     def sort(
-        self, by: str | Sequence[str] | None = None, ascending: bool = True
+        self,
+        by: str | Sequence[str] | None = None,
+        ascending: bool = True,
+        keep_sorted: bool = False,
     ) -> None:
         """
         Sort the table by the given column(s).
@@ -108,12 +463,28 @@ class InMemoryEditor(BaseEditor):
             Default to None
         ascending : bool, default True
             Whether to sort in ascending order. If False, sort in descending order.
+        keep_sorted : bool, default False
+            Whether to keep the table sorted by the column(s) on later edits, see
+            `_restore_order`. Otherwise, the order of a previous sort is forgotten.
         """
         if isinstance(by, str):
             by = [by]
         elif by is None:
             by = self.table.columns.tolist()
-        self.table.sort_values(by=by, ascending=ascending, inplace=True)
+        if self._use_process_pool(by):
+            shared_keys = {column: self.table[column].to_numpy for column in by}
+            self._process_sort(shared_keys, ascending)
+        else:
+            if self._use_merge_sort(by):
+                keys = [self.table[column].to_numpy() for column in by]
+                self._take(self._merge_argsort(keys, ascending))
+            else:
+                self.table.sort_values(
+                    by=by, ascending=ascending, kind="stable", inplace=True
+                )
+            self.version += 1
+        # The sort key is only kept once the table is sorted by it.
+        self.sort_key = (list(by), ascending) if keep_sorted else None
 
     def sort_by_values(
         self, columns: str | list[str], values: Sequence[str] | Sequence[Sequence[str]]
@@ -136,13 +507,296 @@ class InMemoryEditor(BaseEditor):
                 )
             values = [values]
 
+        if self._use_process_pool([]):
+            shared_keys = {
+                (column, tuple(value_list)): partial(
+                    _value_order, self.table[column], value_list
+                )
+                for column, value_list in zip(columns, values)
+            }
+            self._process_sort(shared_keys, True)
+            self.sort_key = None
+            return
+        if self._use_merge_sort([]):
+            keys = [
+                _value_order(self.table[column], value_list)
+                for column, value_list in zip(columns, values)
+            ]
+            self._take(self._merge_argsort(keys, True))
+            self.version += 1
+            self.sort_key = None
+            return
+
         key_columns = [f"${col}-key" for col in columns]
         for key_column, column, value_list in zip(key_columns, columns, values):
             self.table[key_column] = self.table[column].map(
                 lambda x: value_list.index(x) if x in value_list else len(value_list)
             )
-        self.table.sort_values(by=key_columns, inplace=True)
+        self.table.sort_values(by=key_columns, kind="stable", inplace=True)
         self.table.drop(columns=key_columns, inplace=True)
+        self.version += 1
+        self.sort_key = None
+
+    def top_k(
+        self,
+        by: str | Sequence[str],
+        k: int,
+        ascending: bool | Sequence[bool] = True,
+        values: Mapping[str, Sequence[Any]] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Get the first k rows of the table in sorted order, without sorting it.
+        The rows are the head of a stable sort, with the missing values last.
+
+        Parameters
+        ----------
+        by : str | list[str]
+            The column(s) to sort by.
+        k : int
+            The number of rows.
+        ascending : bool | list[bool], default True
+            Whether to sort each column in ascending order.
+        values : dict[str, list] | None
+            Custom order of the values of some of the columns, as in `sort_by_values`.
+        """
+        if isinstance(by, str):
+            by = [by]
+        if isinstance(ascending, bool):
+            ascending = [ascending] * len(by)
+        if len(ascending) != len(by):
+            raise ValueError(
+                f"Expected {len(by)} sort orders for {by}, got {len(ascending)}."
+            )
+        values = values or {}
+        unknown = set(values).difference(by)
+        if unknown:
+            raise ValueError(f"Custom orders of columns not sorted by: {unknown}")
+        table = self.table
+        codes = [
+            key_code(table[column], order, values.get(column))
+            for column, order in zip(by, ascending)
+        ]
+        return table.take(top_k_positions(codes, k))
+
+    def group_by(
+        self, by: str | Sequence[str], aggregations: AggregationSpec
+    ) -> pd.DataFrame:
+        """
+        Aggregate columns of the table by groups of rows, see `group_aggregate`.
+
+        The group keys are coded as categoricals once per version of the table,
+        and the results are cached until the table changes, so that repeated
+        aggregations do not scan the table again.
+
+        Parameters
+        ----------
+        by : str | list[str]
+            The column(s) grouping the rows. If empty, the whole table is one group.
+        aggregations : dict[str, str | list[str]]
+            The aggregations of each column, some of "sum", "mean", "count",
+            "min", "max" and "nunique".
+
+        Returns
+        -------
+        pd.DataFrame
+            A row per group sorted by the keys, with the keys and a column
+            "<column>_<aggregation>" per aggregation. The result is shared with
+            the cache and must not be modified.
+        """
+        if isinstance(by, str):
+            by = [by]
+        table = self.table
+        missing = [column for column in by if column not in table.columns]
+        if missing:
+            raise KeyError(f"Columns not in the table: {missing}")
+        spec = normalize_aggregations(aggregations, table.columns)
+        # The table may also be replaced without a new version, e.g. in tests.
+        version = (self.version, id(table))
+        key = (tuple(by), spec)
+        result = self._aggregates.get(version, key)
+        if result is None:
+            groupers = [
+                self._aggregates.grouper(version, column, table[column])
+                for column in by
+            ]
+            result = group_aggregate(table, groupers, by, spec)
+            self._aggregates.put(version, key, result)
+        return result
+
+    def register_aggregate(
+        self, name: str, by: str | Sequence[str], aggregations: AggregationSpec
+    ) -> pd.DataFrame:
+        """
+        Register a live aggregate, which is updated from the rows changed by
+        each edit instead of being computed again, see `LiveAggregate`.
+        The maintenance of an edit takes time proportional to the changed rows.
+
+        Parameters
+        ----------
+        name : str
+            The name of the aggregate, replacing any aggregate of the same name.
+        by : str | list[str]
+            The column(s) grouping the rows. If empty, the whole table is one group.
+        aggregations : dict[str, str | list[str]]
+            The aggregations of each column, some of "sum", "mean", "count",
+            "min" and "max".
+
+        Returns
+        -------
+        pd.DataFrame
+            The current result of the aggregate, see `live_aggregate`.
+
+        Raises
+        ------
+        KeyError
+            If a column is not in the table.
+        ValueError
+            If an aggregation is not supported.
+        """
+        if isinstance(by, str):
+            by = [by]
+        self._live_aggregates[name] = LiveAggregate(by, aggregations, self.columns)
+        return self.live_aggregate(name)
+
+    def live_aggregate(self, name: str) -> pd.DataFrame:
+        """
+        Get the current result of a live aggregate.
+
+        Returns
+        -------
+        pd.DataFrame
+            A row per group sorted by the keys, with the keys and a column
+            "<column>_<aggregation>" per aggregation, like `group_by`. The
+            result is shared until the next edit and must not be modified.
+
+        Raises
+        ------
+        KeyError
+            If there is no live aggregate of this name, e.g. because an edit
+            dropped one of its columns.
+        """
+        if name not in self._live_aggregates:
+            raise KeyError(f"No live aggregate named {name!r}.")
+        return self._live_aggregates[name].result(self.table)
+
+    def unregister_aggregate(self, name: str) -> None:
+        """Stop updating a live aggregate."""
+        self._live_aggregates.pop(name, None)
+
+    def _update_aggregates(
+        self, before: pd.DataFrame, table: pd.DataFrame, rows: pd.Index | None
+    ) -> None:
+        """
+        Update the live aggregates with the rows changed by an edit. They are
+        computed again on their next read if any row may have been changed, and
+        forgotten if the edit drops one of their columns.
+        """
+        for name, aggregate in list(self._live_aggregates.items()):
+            if not aggregate.uses(table.columns):
+                del self._live_aggregates[name]
+        changes = changed_rows(before, table, rows) if rows is not None else None
+        for aggregate in self._live_aggregates.values():
+            if changes is None:
+                aggregate.invalidate()
+            else:
+                aggregate.update(*changes)
+
+    def _use_process_pool(self, columns: Sequence[str]) -> bool:
+        """Whether to sort by the columns in the process pool."""
+        return (
+            self.config.process_workers is not None
+            and len(self.table) >= self.config.process_min_rows
+            and all(is_shareable(self.table[column]) for column in columns)
+        )
+
+    def _process_sort(
+        self,
+        keys: Mapping[Hashable, Callable[[], np.ndarray]],
+        ascending: bool,
+    ) -> None:
+        """
+        Sort the table in the process pool by the key columns, computed by the given
+        functions unless they are already in shared memory. The sorted keys are kept
+        in shared memory for the next version of the table.
+        """
+        shared = self._shared_table()
+        for key, values in keys.items():
+            shared.share(key, values)
+        sorted_keys = SharedTable()
+        try:
+            positions = parallel_argsort(
+                shared, list(keys), ascending, self.config.process_workers, sorted_keys
+            )
+        except BaseException:
+            sorted_keys.close()
+            raise
+        self._take(positions)
+        self.version += 1
+        self._release_shared()
+        self._shared = ((self.version, self._storage_id()), sorted_keys)
+
+    def _shared_table(self) -> SharedTable:
+        """
+        Get the key columns of the current version of the table in shared memory,
+        which are copied once and reused by the sorts until the table changes.
+        """
+        if self._chunks or self._tail_index:
+            # Joining the appended rows replaces the table.
+            self._consolidate()
+        state = (self.version, self._storage_id())
+        if self._shared is None or self._shared[0] != state:
+            self._release_shared()
+            self._shared = (state, SharedTable())
+        return self._shared[1]
+
+    def _release_shared(self) -> None:
+        if self._shared is not None:
+            self._shared[1].close()
+            self._shared = None
+
+    def _use_merge_sort(self, columns: Sequence[str]) -> bool:
+        """Whether to sort by the columns with the merge sort."""
+        return (
+            self.config.sort_workers is not None
+            and len(self.table) >= self.config.sort_min_rows
+            and all(is_sortable(self.table[column]) for column in columns)
+        )
+
+    def _merge_argsort(self, keys: list[np.ndarray], ascending: bool) -> np.ndarray:
+        """Sort by the keys with the merge sort, spilling to disk if they are large."""
+        spill = self.config.sort_spill_bytes is not None and (
+            sum(key.nbytes for key in keys) > self.config.sort_spill_bytes
+        )
+        return merge_argsort(
+            keys,
+            ascending,
+            self.config.sort_workers or 1,
+            self.config.sort_chunk_rows,
+            spill_dir=(
+                (self.config.sort_spill_dir or tempfile.gettempdir()) if spill else None
+            ),
+        )
+
+    def _restore_order(
+        self, table: pd.DataFrame, rows: pd.Index | None
+    ) -> pd.DataFrame:
+        """
+        Sort an edited table by the sort key, moving only the rows of the edit,
+        see `restore_order`. If any row may have been changed, the whole table
+        is sorted again. The sort key is forgotten if the edit drops one of its
+        columns.
+        """
+        by, ascending = self.sort_key
+        if not set(by).issubset(table.columns):
+            self.sort_key = None
+            return table
+        if rows is None:
+            return table.sort_values(by=by, ascending=ascending, kind="stable")
+        return restore_order(self.table, table, rows, by, ascending)
+
+    def _take(self, positions: np.ndarray) -> None:
+        """Reorder the rows of the table by their positions."""
+        self.table = self.table.take(positions)
 
     def get_table(self) -> pd.DataFrame:
         """
@@ -155,7 +809,7 @@ class InMemoryEditor(BaseEditor):
         # Get the columns of the table.
         # TODO: If the table has too many columns, we should return a subset of the columns.
         # Note that it is controlled by the config.
-        return self.table.columns
+        return self._table.columns
 
     @property
     def index(self) -> pd.Index:
@@ -163,3 +817,21 @@ class InMemoryEditor(BaseEditor):
         # TODO: If the table has too many rows, we should return a subset of the rows.
         # Note that it is controlled by the config.
         return self.table.index
+
+
+def _value_order(column: pd.Series, values: Sequence[Any]) -> np.ndarray:
+    """Get the position of each value of a column in a list of values.
+    The values not in the list are placed after all the listed ones.
+    """
+    order = pd.Index(values).drop_duplicates().get_indexer(column)
+    order[order == -1] = len(values)
+    return order
+
+
+def _with_id_column(table: pd.DataFrame) -> pd.DataFrame:
+    """Expose the index of a table as the ``_id`` column without copying the data."""
+    if SQL_ID_COLUMN in table.columns:
+        return table
+    view = table.copy(deep=False)
+    view.insert(0, SQL_ID_COLUMN, table.index)
+    return view
@@ -1,23 +1,34 @@
 from enum import Enum
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from mcp_table_editor.editor._config import EditorConfig
 from mcp_table_editor.editor._range import Range
 from mcp_table_editor.editor._selector import InsertRule, Selector
-from mcp_table_editor.misc import merge_index
+from mcp_table_editor.misc import merge_index, span
 
 
 class InMemorySelector(Selector):
     def __init__(
         self, df: pd.DataFrame, cell_range: Range, editor_config: EditorConfig
     ) -> None:
-        # Ensure the selector works on a copy to maintain immutability
-        self.df = df.copy()
+        # Ensure the selector works on a copy to maintain immutability.
+        # The operations changing the dataframe copy its data first, so a shallow
+        # copy is enough and selecting a part of a large table copies only that part.
+        with span("selector_copy"):
+            self.df = df.copy(deep=False)
         self.range = cell_range
         self.editor_config = editor_config
 
+    def _copy(self) -> pd.DataFrame:
+        """
+        Copy the internal dataframe before an operation changes it.
+        """
+        with span("selector_copy"):
+            return self.df.copy()
+
     def _update(self, df: pd.DataFrame) -> None:
         """
         Update the internal dataframe with a new one.
@@ -46,13 +57,13 @@ class InMemorySelector(Selector):
         pd.DataFrame
             A new dataframe after dropping the selected range.
         """
-        df = self.df.copy()  # Work on a copy
+        df = self._copy()  # Work on a copy
         if self.range.is_column_range():
-            df = df.drop(columns=self.range.get_columns())  # Not inplace
+            df = df.drop(columns=self.range.get_columns(df.columns))  # Not inplace
         if self.range.is_index_range():
-            df = df.drop(index=self.range.get_index())  # Not inplace
+            df = df.drop(index=self.range.get_index(df.index))  # Not inplace
         if self.range.is_location_range():
-            _, columns_to_drop = self.range.get_location()
+            _, columns_to_drop = self.range.get_location(df.index, df.columns)
             df = df.drop(columns=columns_to_drop)  # Not inplace
         self._update(df)
         return df  # Return the modified copy
@@ -65,17 +76,33 @@ class InMemorySelector(Selector):
     ) -> pd.DataFrame:
         df = self.df
         if self.range.is_column_range():
+            positions = range.get_column_positions(df.columns)
             if option_columns is not None:
-                df = df[merge_index(df.columns, range.get_columns(), option_columns)]
+                df = df[
+                    merge_index(
+                        df.columns, range.get_columns(df.columns), option_columns
+                    )
+                ]
+            elif positions is not None:
+                # Slice the positions, which takes a view instead of a copy.
+                df = df.iloc[:, positions]
             else:
-                df = df[range.get_columns()]
+                df = df[range.get_columns(df.columns)]
         if self.range.is_index_range():
+            positions = range.get_index_positions(df.index)
             if option_rows is not None:
-                df = df.loc[merge_index(df.index, range.get_index(), option_rows)]
+                df = df.loc[
+                    merge_index(df.index, range.get_index(df.index), option_rows)
+                ]
+            elif positions is not None:
+                df = df.iloc[positions]
             else:
-                df = df.loc[range.get_index()]
+                df = df.loc[range.get_index(df.index)]
         if self.range.is_location_range():
-            index, columns = range.get_location()
+            positions = range.get_location_positions(df.index, df.columns)
+            if option_columns is None and option_rows is None and positions is not None:
+                return df.iloc[positions]
+            index, columns = range.get_location(df.index, df.columns)
             if option_columns is not None:
                 columns = merge_index(df.columns, columns, option_columns)
             if option_rows is not None:
@@ -91,13 +118,13 @@ class InMemorySelector(Selector):
         pd.DataFrame
             A new dataframe with the selected range set to NA.
         """
-        df = self.df.copy()  # Work on a copy
+        df = self._copy()  # Work on a copy
         if self.range.is_column_range():
-            df[self.range.get_columns()] = pd.NA
+            df[self.range.get_columns(df.columns)] = pd.NA
         if self.range.is_index_range():
-            df.loc[self.range.get_index()] = pd.NA
+            df.loc[self.range.get_index(df.index)] = pd.NA
         if self.range.is_location_range():
-            index, columns = self.range.get_location()
+            index, columns = self.range.get_location(df.index, df.columns)
             df.loc[index, columns] = pd.NA
         self._update(df)
         return df  # Return the modified copy
@@ -125,13 +152,13 @@ class InMemorySelector(Selector):
         pd.DataFrame
             A new dataframe with the selected range updated.
         """
-        df = self.df.copy()  # Work on a copy
+        df = self._copy()  # Work on a copy
         if self.range.is_column_range():
-            df[self.range.get_columns()] = value
+            df[self.range.get_columns(df.columns)] = value
         if self.range.is_index_range():
-            df.loc[self.range.get_index()] = value
+            df.loc[self.range.get_index(df.index)] = value
         if self.range.is_location_range():
-            index, columns = self.range.get_location()
+            index, columns = self.range.get_location(df.index, df.columns)
             df.loc[index, columns] = value
         self._update(df)
         return df  # Return the modified copy
@@ -166,7 +193,9 @@ class InMemorySelector(Selector):
         TypeError
             If the range type is invalid for insertion.
         """
-        df = self.df.copy()  # Work on a copy
+        # Inserting adds new columns or builds a new dataframe without changing
+        # the existing columns, so a shallow copy is enough.
+        df = self.df.copy(deep=False)
 
         if self.range.is_column_range():
             cols_to_insert = self.range.get_columns()
@@ -176,13 +205,19 @@ class InMemorySelector(Selector):
                     "Position 'pos' must be an integer for column insertion."
                 )
 
-            current_pos = insert_pos
-            for i, col in enumerate(cols_to_insert):
-                df.insert(loc=current_pos + i, column=col, value=value)
+            df = _insert_columns(df, insert_pos, cols_to_insert, value)
+            if insert_rule == InsertRule.ABOVE:
+                # Only the new columns are filled, the other ones keep their NAs.
+                inserted = slice(insert_pos, insert_pos + len(cols_to_insert))
+                filled = _fill_above(df.iloc[:, inserted])
+                for i in range(len(cols_to_insert)):
+                    df.isetitem(insert_pos + i, filled.iloc[:, i])
 
         elif self.range.is_index_range():
             index_to_insert = self.range.get_index()
             new_rows_df = pd.DataFrame(value, index=index_to_insert, columns=df.columns)
+            if insert_rule == InsertRule.ABOVE:
+                new_rows_df = _fill_above(new_rows_df, df.iloc[-1:])
             df = pd.concat([df, new_rows_df], axis=0)
 
         elif self.range.is_location_range():
@@ -190,9 +225,50 @@ class InMemorySelector(Selector):
         else:
             raise TypeError("Invalid range type for insert operation.")
 
-        if insert_rule == InsertRule.ABOVE:
-            df = df.ffill(axis=0)
-
         self._update(df)
 
         return df  # Return the modified copy
+
+
+def _fill_above(block: pd.DataFrame, above: pd.DataFrame | None = None) -> pd.DataFrame:
+    """
+    Fill the missing values of an inserted block with the nearest values above them.
+    The first rows of the block are filled from the last row of `above`, if given,
+    so that the cost is proportional to the size of the block.
+    """
+    with pd.option_context("future.no_silent_downcasting", True):
+        block = block.ffill()
+        if above is not None and len(above) > 0:
+            block = block.fillna(above.iloc[-1])
+        return block.infer_objects()
+
+
+def _insert_columns(
+    df: pd.DataFrame, pos: int, columns: pd.Index, value: Any
+) -> pd.DataFrame:
+    """
+    Insert columns filled with a value at a position in a single concat.
+    The new columns are built as one block, instead of one block per column
+    as `DataFrame.insert` does, which fragments the dataframe.
+    """
+    if not 0 <= pos <= len(df.columns):
+        raise IndexError(
+            f"index {pos} is out of bounds for axis 0 with size {len(df.columns)}"
+        )
+    duplicated = columns[columns.isin(df.columns) | columns.duplicated()]
+    if len(duplicated) > 0:
+        raise ValueError(f"cannot insert {duplicated[0]}, already exists")
+    if pd.api.types.is_scalar(value) or value is None:
+        dtype = pd.Series([value]).dtype
+        if isinstance(dtype, np.dtype):
+            # Lay out the values column by column, like the blocks of a dataframe,
+            # so that the new columns are contiguous in memory.
+            values = np.full((len(columns), len(df.index)), value, dtype=dtype)
+            block = pd.DataFrame(values.T, index=df.index, columns=columns, copy=False)
+        else:
+            block = pd.DataFrame(value, index=df.index, columns=columns)
+    else:
+        # A value per row, repeated in each new column.
+        block = pd.DataFrame({column: value for column in columns}, index=df.index)
+    # The existing columns are not copied, see `InMemorySelector.insert`.
+    return pd.concat([df.iloc[:, :pos], block, df.iloc[:, pos:]], axis=1, copy=False)
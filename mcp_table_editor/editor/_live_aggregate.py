@@ -0,0 +1,317 @@
+import operator
+import threading
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor._aggregate import AggregationSpec, normalize_aggregations
+
+# Aggregations maintained from the rows changed by each edit.
+LIVE_AGGREGATIONS = ("sum", "mean", "count", "min", "max")
+# Number of rows up to which their groups are updated by a loop over the rows,
+# instead of grouping them with pandas, which has a higher fixed cost.
+_LOOP_ROWS = 64
+# Extremes, with the comparison of a value coming before another one.
+_EXTREMES = {"min": operator.lt, "max": operator.gt}
+
+
+class LiveAggregate:
+    """
+    Aggregations of the columns of a table by groups of rows, kept up to date
+    from the rows changed by each edit instead of being computed again.
+
+    Each group holds its number of rows, and the sum, count of values, minimum
+    and maximum of each column. Sums and counts are decomposable: the rows
+    removed by an edit are subtracted and the new ones are added, and means are
+    derived from them. The minimum and maximum only absorb new rows; when a
+    removed value may have been the extreme of its group and the new rows of
+    the group do not replace it, the group is marked and computed again from
+    the rows of the marked groups when the result is read. Any edit whose
+    changed rows are not known, or which the state cannot absorb, e.g. values
+    which are not numbers anymore, falls back to computing the whole aggregation
+    again when it is next read.
+
+    Sums of floats are updated by subtraction, so that they may differ from a
+    fresh sum by rounding errors.
+    """
+
+    def __init__(
+        self, by: Sequence[str], aggregations: AggregationSpec, columns: pd.Index
+    ) -> None:
+        missing = [column for column in by if column not in columns]
+        if missing:
+            raise KeyError(f"Columns not in the table: {missing}")
+        self.by = list(by)
+        self.spec = normalize_aggregations(aggregations, columns)
+        unsupported = {func for _, funcs in self.spec for func in funcs} - set(
+            LIVE_AGGREGATIONS
+        )
+        if unsupported:
+            raise ValueError(
+                f"Unsupported live aggregations {sorted(unsupported)}, "
+                f"expected some of {LIVE_AGGREGATIONS}."
+            )
+        self.columns = [column for column, _ in self.spec]
+        # Fields of the state of a group after its number of rows: the count of
+        # each column, its sum for sums and means, and the requested extremes.
+        self._fields = []
+        for column, funcs in self.spec:
+            self._fields.append((column, "count"))
+            if {"sum", "mean"} & set(funcs):
+                self._fields.append((column, "sum"))
+            self._fields.extend((column, func) for func in _EXTREMES if func in funcs)
+        self._position = {field: i + 1 for i, field in enumerate(self._fields)}
+        self._guard = threading.Lock()
+        self._groups: dict[tuple, list[Any]] = {}
+        # Groups whose minimum or maximum must be computed again.
+        self._dirty: set[tuple] = set()
+        self._stale = True
+        self._result: pd.DataFrame | None = None
+
+    def uses(self, columns: pd.Index) -> bool:
+        """Whether all the columns of the aggregation are in the columns."""
+        return set(self.by).issubset(columns) and set(self.columns).issubset(columns)
+
+    def invalidate(self) -> None:
+        """Compute the whole aggregation again when it is next read."""
+        with self._guard:
+            self._stale = True
+            self._result = None
+
+    def update(self, removed: pd.DataFrame, added: pd.DataFrame) -> None:
+        """
+        Update the groups with the rows changed by an edit.
+
+        Parameters
+        ----------
+        removed : pd.DataFrame
+            The rows before the edit which were changed or removed by it.
+        added : pd.DataFrame
+            The rows after the edit which were changed or added by it.
+        """
+        with self._guard:
+            if self._stale:
+                return
+            self._result = None
+            try:
+                new = self._partials(added)
+                for key, partial in self._partials(removed).items():
+                    self._remove(key, partial, new.get(key))
+                for key, partial in new.items():
+                    self._add(key, partial)
+            except (TypeError, KeyError):
+                # Values which cannot be added or compared anymore.
+                self._stale = True
+
+    def result(self, table: pd.DataFrame) -> pd.DataFrame:
+        """
+        Get the aggregation of the table, which must be the table it was kept up
+        to date with, computing the marked groups again.
+
+        Returns
+        -------
+        pd.DataFrame
+            A row per group sorted by the keys, with the keys and a column
+            "<column>_<aggregation>" per aggregation, like `group_aggregate`.
+            The result is shared until the next edit and must not be modified.
+        """
+        with self._guard:
+            if self._stale:
+                self._groups = self._partials(table)
+                self._dirty.clear()
+                self._stale = False
+            elif self._dirty:
+                self._groups.update(self._partials(self._group_rows(table)))
+                self._dirty.clear()
+            if self._result is None:
+                self._result = self._frame()
+            return self._result
+
+    def compute(self, chunks: Iterable[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Get the aggregation of a table read in chunks of rows, combining the
+        state of the groups of each chunk, so that only a chunk is held in
+        memory at a time. The result is like the one of `result`.
+        """
+        with self._guard:
+            self._groups = {}
+            for chunk in chunks:
+                for key, partial in self._partials(chunk).items():
+                    self._add(key, partial)
+            self._dirty.clear()
+            self._stale = False
+            self._result = self._frame()
+            return self._result
+
+    def _partials(self, rows: pd.DataFrame) -> dict[tuple, list[Any]]:
+        """Get the state of each group of the rows, see `_fields`."""
+        if len(rows) <= _LOOP_ROWS:
+            return self._loop_partials(rows)
+        values = rows[self.columns]
+        funcs = list(dict.fromkeys(func for _, func in self._fields))
+        if not self.by:
+            if len(rows) == 0:
+                return {}
+            stats = values.agg(funcs)
+            return {(): [len(rows), *(stats.at[f, c] for c, f in self._fields)]}
+        grouped = values.groupby([rows[column] for column in self.by], sort=False)
+        sizes = grouped.size()
+        stats = grouped.agg(funcs)
+        items = [sizes.tolist()] + [stats[field].tolist() for field in self._fields]
+        keys = sizes.index.tolist()
+        if len(self.by) == 1:
+            keys = [(key,) for key in keys]
+        return {key: list(state) for key, *state in zip(keys, *items)}
+
+    def _loop_partials(self, rows: pd.DataFrame) -> dict[tuple, list[Any]]:
+        """Get the state of each group of a few rows by a loop over them."""
+        keys = zip(*(rows[column].tolist() for column in self.by))
+        if not self.by:
+            keys = [()] * len(rows)
+        values = [rows[column].tolist() for column in self.columns]
+        groups: dict[tuple, list[Any]] = {}
+        for row, key in enumerate(keys):
+            if any(pd.isna(part) for part in key):
+                continue
+            state = groups.get(key)
+            if state is None:
+                state = [
+                    0,
+                    *(0 if f in ("count", "sum") else np.nan for _, f in self._fields),
+                ]
+                groups[key] = state
+            state[0] += 1
+            for column, column_values in zip(self.columns, values):
+                value = column_values[row]
+                if pd.isna(value):
+                    continue
+                count = self._position[column, "count"]
+                if (column, "sum") in self._position:
+                    state[self._position[column, "sum"]] += value
+                for func, before in _EXTREMES.items():
+                    i = self._position.get((column, func))
+                    if i is not None and (state[count] == 0 or before(value, state[i])):
+                        state[i] = value
+                state[count] += 1
+        return groups
+
+    def _remove(
+        self, key: tuple, partial: list[Any], replacement: list[Any] | None
+    ) -> None:
+        """
+        Subtract the state of removed rows from their group. The replacement is
+        the state of the new rows of the group, which may replace the extremes.
+        """
+        state = self._groups[key]
+        state[0] -= partial[0]
+        if state[0] == 0:
+            del self._groups[key]
+            self._dirty.discard(key)
+            return
+        for column in self.columns:
+            count = self._position[column, "count"]
+            state[count] -= partial[count]
+            if partial[count] == 0:
+                continue
+            if (column, "sum") in self._position:
+                i = self._position[column, "sum"]
+                state[i] -= partial[i]
+            replaced = replacement is not None and replacement[count] > 0
+            for func, before in _EXTREMES.items():
+                i = self._position.get((column, func))
+                if i is None or before(state[i], partial[i]):
+                    continue
+                if not (replaced and not before(partial[i], replacement[i])):
+                    # A removed value may have been the extreme of the group.
+                    self._dirty.add(key)
+
+    def _add(self, key: tuple, partial: list[Any]) -> None:
+        state = self._groups.get(key)
+        if state is None:
+            self._groups[key] = partial
+            return
+        state[0] += partial[0]
+        for column in self.columns:
+            count = self._position[column, "count"]
+            if partial[count] == 0:
+                continue
+            if (column, "sum") in self._position:
+                i = self._position[column, "sum"]
+                state[i] += partial[i]
+            for func, before in _EXTREMES.items():
+                i = self._position.get((column, func))
+                if i is not None and (
+                    state[count] == 0 or before(partial[i], state[i])
+                ):
+                    state[i] = partial[i]
+            state[count] += partial[count]
+
+    def _group_rows(self, table: pd.DataFrame) -> pd.DataFrame:
+        """Get the rows of the table in the marked groups."""
+        if not self.by:
+            return table
+        if len(self.by) == 1:
+            keys = [key for key, in self._dirty]
+            return table[table[self.by[0]].isin(keys)]
+        keys = pd.MultiIndex.from_frame(table[self.by])
+        return table[keys.isin(list(self._dirty))]
+
+    def _frame(self) -> pd.DataFrame:
+        """Build the result from the state of the groups."""
+        names = [f"{column}_{func}" for column, funcs in self.spec for func in funcs]
+        records = []
+        for key, state in self._groups.items():
+            row = list(key)
+            for column, funcs in self.spec:
+                count = state[self._position[column, "count"]]
+                for func in funcs:
+                    if func == "count":
+                        row.append(count)
+                    elif func == "sum":
+                        row.append(state[self._position[column, "sum"]])
+                    elif count == 0:
+                        row.append(np.nan)
+                    elif func == "mean":
+                        row.append(state[self._position[column, "sum"]] / count)
+                    else:
+                        row.append(state[self._position[column, func]])
+            records.append(row)
+        result = pd.DataFrame(records, columns=[*self.by, *names])
+        if self.by and len(result) > 1:
+            result = result.sort_values(self.by, kind="stable", ignore_index=True)
+        return result
+
+
+def changed_rows(
+    before: pd.DataFrame, table: pd.DataFrame, rows: pd.Index
+) -> tuple[pd.DataFrame, pd.DataFrame] | None:
+    """
+    Get the rows changed by an edit: the rows before the edit which were changed
+    or removed, and the rows after it which were changed or added.
+
+    The rows of the edit are found by their labels in the hash table of the
+    index, which pandas keeps with the index, and the added and removed rows by
+    comparing the indexes, which is a vectorized scan without hashing when the
+    index is kept or rows are only appended. None if the labels are not
+    unique, so that the rows cannot be matched.
+    """
+    if not (before.index.is_unique and table.index.is_unique):
+        return None
+    removed = [_positions(before.index, rows)]
+    added = [_positions(table.index, rows)]
+    if not table.index.equals(before.index):
+        if len(table) > len(before) and table.index[: len(before)].equals(before.index):
+            added.append(np.arange(len(before), len(table)))
+        else:
+            removed.append(np.flatnonzero(~before.index.isin(table.index)))
+            added.append(np.flatnonzero(~table.index.isin(before.index)))
+    return (
+        before.take(np.unique(np.concatenate(removed))),
+        table.take(np.unique(np.concatenate(added))),
+    )
+
+
+def _positions(index: pd.Index, labels: pd.Index) -> np.ndarray:
+    positions = index.get_indexer(labels)
+    return positions[positions >= 0]
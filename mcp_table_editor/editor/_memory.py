@@ -0,0 +1,107 @@
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+class MemoryAccount:
+    """
+    Estimate of the memory used by a table, kept up to date incrementally.
+
+    The fixed-size columns are counted exactly from their buffers. The memory of
+    the Python objects of object columns is estimated from a sample of their rows,
+    and the per-row estimate is reused by later estimates until the column is
+    re-sampled, every `resample_interval` estimates, so that no estimate scans the
+    whole table.
+    """
+
+    def __init__(self, sample_rows: int = 1000, resample_interval: int = 100) -> None:
+        self.sample_rows = sample_rows
+        self.resample_interval = resample_interval
+        # Bytes of the objects of a row of each object column, beyond the pointer.
+        self._object_bytes_per_row: dict[Any, float] = {}
+        self._estimates = 0
+
+    def estimate(self, table: pd.DataFrame) -> int:
+        """
+        Estimate the memory used by a table in bytes, including its index.
+        """
+        self._estimates += 1
+        if self._estimates % self.resample_interval == 0:
+            self._object_bytes_per_row.clear()
+
+        total = int(table.memory_usage(index=True, deep=False).sum())
+        if len(table) == 0:
+            return total
+        for key, values in _object_arrays(table):
+            per_row = self._object_bytes_per_row.get(key)
+            if per_row is None:
+                per_row = self._object_bytes_per_row[key] = self._sample(values)
+            total += int(per_row * len(table))
+        return total
+
+    def _sample(self, values: pd.Series | pd.Index) -> float:
+        positions = np.unique(
+            np.linspace(0, len(values) - 1, min(self.sample_rows, len(values))).astype(
+                int
+            )
+        )
+        sample = values.take(positions)
+        if isinstance(sample, pd.Index):
+            deep = sample.memory_usage(deep=True)
+            shallow = sample.memory_usage(deep=False)
+        else:
+            deep = sample.memory_usage(index=False, deep=True)
+            shallow = sample.memory_usage(index=False, deep=False)
+        return (deep - shallow) / len(positions)
+
+
+def _object_arrays(table: pd.DataFrame):
+    """Iterate over the index and the columns of a table holding Python objects."""
+    if table.index.dtype == object:
+        yield ("index",), table.index
+    for i, dtype in enumerate(table.dtypes):
+        if dtype == object:
+            yield ("column", table.columns[i]), table.iloc[:, i]
+
+
+def compact_dtypes(table: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast the numeric columns of a table to the smallest dtypes holding their
+    values exactly, e.g. int64 to int8 or float64 to float32.
+
+    Returns
+    -------
+    pd.DataFrame
+        The compacted table, or the table itself if no column could be downcast.
+    """
+    compacted = {}
+    for i, dtype in enumerate(table.dtypes):
+        if not isinstance(dtype, np.dtype) or dtype.kind not in "iuf":
+            continue
+        column = table.iloc[:, i]
+        kind = "float" if dtype.kind == "f" else "integer"
+        downcast = pd.to_numeric(column, downcast=kind)
+        if downcast.dtype.itemsize >= dtype.itemsize:
+            continue
+        if dtype.kind == "f" and not _same_values(column, downcast):
+            # float32 would round the values.
+            continue
+        compacted[i] = downcast
+    if not compacted:
+        return table
+    table = table.copy(deep=False)
+    for i, column in compacted.items():
+        table.isetitem(i, column)
+    return table
+
+
+def _same_values(before: pd.Series, after: pd.Series) -> bool:
+    before_values = before.to_numpy()
+    after_values = after.to_numpy().astype(before_values.dtype)
+    return bool(
+        np.all(
+            (before_values == after_values)
+            | (np.isnan(before_values) & np.isnan(after_values))
+        )
+    )
@@ -0,0 +1,232 @@
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor._partitioned import get_thread_pool
+
+# Code of the missing values, after every other value.
+_MISSING = np.iinfo(np.uint64).max
+_SIGN = np.uint64(1 << 63)
+
+
+def is_sortable(series: pd.Series) -> bool:
+    """
+    Whether a column can be sorted by the merge sort.
+    """
+    return isinstance(series.dtype, np.dtype) and series.dtype.kind in "biufmM"
+
+
+def merge_argsort(
+    keys: Sequence[np.ndarray],
+    ascending: bool | Sequence[bool] = True,
+    workers: int = 2,
+    chunk_rows: int = 1_000_000,
+    spill_dir: str | None = None,
+) -> np.ndarray:
+    """
+    Get the stable sorting permutation of the rows by the given keys with a
+    parallel merge sort.
+
+    The keys are encoded as unsigned integers ordered like the rows. The rows are
+    split into runs of `chunk_rows` rows sorted in a thread pool, and the runs are
+    merged pairwise, the earlier run winning ties, until one is left. The
+    permutation matches ``sort_values(kind="stable", na_position="last")``.
+
+    Parameters
+    ----------
+    keys : Sequence[np.ndarray]
+        Numeric, boolean or datetime keys to sort by, the first one is the
+        primary key.
+    ascending : bool | Sequence[bool]
+        Sort order of each key.
+    workers : int
+        Number of threads.
+    chunk_rows : int
+        Number of rows of each sorted run.
+    spill_dir : str | None
+        If given, the sorted runs and the merged runs are written to temporary
+        files in this directory and merged from memory-mapped files, instead of
+        being held in memory.
+
+    Returns
+    -------
+    np.ndarray
+        The positions of the rows in sorted order.
+    """
+    if chunk_rows <= 0:
+        raise ValueError(f"chunk_rows must be positive, got {chunk_rows}.")
+    if isinstance(ascending, bool):
+        ascending = [ascending] * len(keys)
+    codes = [_sort_code(key, order) for key, order in zip(keys, ascending)]
+    rows = len(codes[0]) if codes else 0
+    if rows == 0:
+        return np.arange(0)
+    packed = _pack(codes)
+    pool = get_thread_pool(workers)
+
+    def sort_run(start: int) -> tuple[np.ndarray, np.ndarray]:
+        stop = min(start + chunk_rows, rows)
+        if len(codes) == 1:
+            order = np.argsort(codes[0][start:stop], kind="stable")
+        else:
+            # np.lexsort sorts by the last key first, and is stable.
+            order = np.lexsort([code[start:stop] for code in reversed(codes)])
+        positions = order + start
+        return packed[positions], positions
+
+    spill = (
+        tempfile.TemporaryDirectory(dir=spill_dir, ignore_cleanup_errors=True)
+        if spill_dir is not None
+        else nullcontext()
+    )
+    with spill as dir:
+        runs = [
+            _save(run, dir, f"run-{i}") if dir else run
+            for i, run in enumerate(pool.map(sort_run, range(0, rows, chunk_rows)))
+        ]
+        del packed
+        level = 0
+        while len(runs) > 1:
+            level += 1
+            merged = []
+            for i in range(0, len(runs) - 1, 2):
+                out = _open(dir, f"merge-{level}-{i}", runs[i], runs[i + 1])
+                merged.append(_merge(runs[i], runs[i + 1], out, pool, workers))
+            if len(runs) % 2:
+                merged.append(runs[-1])
+            # The files of the merged runs are unmapped once they are released.
+            spilled = _filenames(runs[: len(runs) - len(runs) % 2])
+            runs = merged
+            for filename in spilled:
+                os.remove(filename)
+        result = np.array(runs[0][1])
+        del runs
+    return result
+
+
+def _sort_code(values: np.ndarray, ascending: bool) -> np.ndarray:
+    """
+    Encode the values as unsigned integers which sort ascending in the
+    requested order, with the missing values last.
+    """
+    kind = values.dtype.kind
+    missing = None
+    if kind == "f":
+        # Adding zero turns -0.0 into 0.0, which sorts as equal.
+        values = values.astype(np.float64) + 0.0
+        missing = np.isnan(values)
+        bits = values.view(np.uint64)
+        codes = np.where(bits & _SIGN, ~bits, bits | _SIGN)
+    elif kind in "mM":
+        missing = np.isnat(values)
+        codes = values.view(np.int64).view(np.uint64) ^ _SIGN
+    elif kind == "i":
+        codes = values.astype(np.int64).view(np.uint64) ^ _SIGN
+    elif kind in "ub":
+        codes = values.astype(np.uint64)
+    else:
+        raise TypeError(f"Cannot merge sort values of dtype {values.dtype}.")
+    if not ascending:
+        codes = ~codes
+    if missing is not None and missing.any():
+        codes[missing] = _MISSING
+    return codes
+
+
+def _pack(codes: list[np.ndarray]) -> np.ndarray:
+    """
+    Pack the codes of the keys of each row into one comparable item: the codes
+    themselves for a single key, else their big-endian bytes, which compare
+    byte by byte in the order of the keys. Fixed-width bytes compare faster
+    than raw void items.
+    """
+    if len(codes) == 1:
+        return codes[0]
+    stacked = np.stack(codes, axis=1).astype(">u8")
+    return stacked.view(f"S{8 * len(codes)}").ravel()
+
+
+def _merge(
+    left: tuple[np.ndarray, np.ndarray],
+    right: tuple[np.ndarray, np.ndarray],
+    out: tuple[np.ndarray, np.ndarray],
+    pool: ThreadPoolExecutor,
+    workers: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Merge two sorted runs into `out`, the rows of the left run before the equal
+    rows of the right one. The position of each row in the merged run is its
+    position in its run plus the number of rows of the other run before it.
+    """
+    (left_codes, left_positions), (right_codes, right_positions) = left, right
+    out_codes, out_positions = out
+    pieces = [
+        (codes, positions, other, side, piece)
+        for codes, positions, other, side in (
+            (left_codes, left_positions, right_codes, "left"),
+            (right_codes, right_positions, left_codes, "right"),
+        )
+        for piece in _pieces(len(codes), workers)
+    ]
+
+    def merge_piece(codes, positions, other, side, piece: slice) -> None:
+        at = np.searchsorted(other, codes[piece], side=side)
+        at += np.arange(piece.start, piece.stop)
+        out_codes[at] = codes[piece]
+        out_positions[at] = positions[piece]
+
+    list(pool.map(lambda args: merge_piece(*args), pieces))
+    return out_codes, out_positions
+
+
+def _pieces(length: int, count: int) -> list[slice]:
+    bounds = np.linspace(0, length, max(count, 1) + 1).astype(int)
+    return [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def _open(
+    dir: str | None,
+    name: str,
+    left: tuple[np.ndarray, np.ndarray],
+    right: tuple[np.ndarray, np.ndarray],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Allocate a merged run, in memory or in files of the spill directory."""
+    rows = len(left[0]) + len(right[0])
+    codes_dtype, positions_dtype = left[0].dtype, left[1].dtype
+    if dir is None:
+        return np.empty(rows, codes_dtype), np.empty(rows, positions_dtype)
+    return (
+        np.lib.format.open_memmap(
+            os.path.join(dir, f"{name}.codes.npy"), "w+", codes_dtype, (rows,)
+        ),
+        np.lib.format.open_memmap(
+            os.path.join(dir, f"{name}.positions.npy"), "w+", positions_dtype, (rows,)
+        ),
+    )
+
+
+def _save(
+    run: tuple[np.ndarray, np.ndarray], dir: str, name: str
+) -> tuple[np.ndarray, np.ndarray]:
+    """Write a sorted run to the spill directory, and map it back from the files."""
+    saved = []
+    for suffix, array in zip(("codes", "positions"), run):
+        path = os.path.join(dir, f"{name}.{suffix}.npy")
+        np.save(path, array)
+        saved.append(np.load(path, mmap_mode="r"))
+    return saved[0], saved[1]
+
+
+def _filenames(runs: list[tuple[np.ndarray, np.ndarray]]) -> list[str]:
+    """Get the files of the runs mapped from the spill directory."""
+    return [
+        str(array.filename)
+        for run in runs
+        for array in run
+        if isinstance(array, np.memmap) and array.filename
+    ]
@@ -0,0 +1,554 @@
+import ast
+import operator
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, BinaryIO, Callable, Iterator, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError as e:
+    raise ImportError(
+        "The out-of-core editor requires pyarrow. Please install it with "
+        "`pip install mcp-table-editor[parquet]`."
+    ) from e
+
+from mcp_table_editor.editor._aggregate import AggregationSpec
+from mcp_table_editor.editor._config import EditorConfig
+from mcp_table_editor.editor._in_memory_editor import InMemoryEditor
+from mcp_table_editor.editor._in_memory_selector import InMemorySelector
+from mcp_table_editor.editor._live_aggregate import LiveAggregate
+from mcp_table_editor.editor._memory import MemoryAccount
+from mcp_table_editor.editor._plan import referenced_columns
+from mcp_table_editor.editor._range import Range
+from mcp_table_editor.editor._selector import InsertRule, Selector
+
+# Comparisons of a column with a literal, and their mirror when the literal is
+# on the left-hand side.
+_COMPARISONS: dict[type[ast.cmpop], tuple[str, str]] = {
+    ast.Lt: ("<", ">"),
+    ast.LtE: ("<=", ">="),
+    ast.Gt: (">", "<"),
+    ast.GtE: (">=", "<="),
+    ast.Eq: ("==", "=="),
+}
+# Whether a row group whose values are between a minimum and a maximum may
+# hold values matching a comparison with a literal.
+_MAY_MATCH: dict[str, Callable[[Any, Any, Any], bool]] = {
+    "<": lambda low, high, value: low < value,
+    "<=": lambda low, high, value: low <= value,
+    ">": lambda low, high, value: high > value,
+    ">=": lambda low, high, value: high >= value,
+    "==": lambda low, high, value: low <= value <= high,
+}
+
+Condition = tuple[str, str, Any]
+
+
+def ingest_csv(
+    source: str | os.PathLike,
+    path: str | os.PathLike,
+    block_bytes: int = 16 * 2**20,
+    column_types: Mapping[str, Any] | None = None,
+) -> None:
+    """
+    Convert a CSV file to a Parquet file, streaming it block by block so that
+    only a block is held in memory, whatever the size of the file.
+
+    Each block of about `block_bytes` bytes of text, ending at the end of a
+    record, becomes a row group, with the minimum and maximum of each column,
+    which lets scans skip row groups. The blocks are read one at a time since
+    the streaming reader of pyarrow reads many blocks ahead.
+
+    Parameters
+    ----------
+    source : str | os.PathLike
+        The CSV file, with a header row.
+    path : str | os.PathLike
+        The Parquet file to write.
+    block_bytes : int
+        The number of bytes of text converted at a time.
+    column_types : Mapping[str, Any] | None
+        Types of some columns, as pyarrow types or names like "float64". The
+        other types are inferred from the first block.
+
+    Raises
+    ------
+    ValueError
+        If a later block holds values which do not fit the inferred type of
+        their column, which `column_types` can widen.
+    """
+    types = {
+        name: pa.type_for_alias(kind) if isinstance(kind, str) else kind
+        for name, kind in (column_types or {}).items()
+    }
+    writer = None
+    try:
+        with open(source, "rb") as file:
+            for block in _csv_blocks(file, block_bytes):
+                if writer is None:
+                    # The types of the columns are inferred from the whole block.
+                    table = pa_csv.read_csv(
+                        pa.py_buffer(block),
+                        read_options=pa_csv.ReadOptions(block_size=len(block) + 1),
+                        convert_options=pa_csv.ConvertOptions(column_types=types),
+                    )
+                    read_options = pa_csv.ReadOptions(column_names=table.column_names)
+                    convert_options = pa_csv.ConvertOptions(
+                        column_types=dict(zip(table.column_names, table.schema.types))
+                    )
+                    writer = pq.ParquetWriter(path, table.schema)
+                else:
+                    table = pa_csv.read_csv(
+                        pa.py_buffer(block),
+                        read_options=read_options,
+                        convert_options=convert_options,
+                    )
+                writer.write_table(table, row_group_size=max(table.num_rows, 1))
+    except pa.ArrowInvalid as e:
+        raise ValueError(
+            f"Could not convert {os.fspath(source)!r}: {e}. "
+            "Set the types of the columns with `column_types`."
+        ) from e
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        raise ValueError(f"{os.fspath(source)!r} is empty, expected a header row.")
+
+
+def _csv_blocks(file: BinaryIO, block_bytes: int) -> Iterator[bytes]:
+    """
+    Read a CSV file in blocks of whole records of at least `block_bytes` bytes.
+    A record ends at a newline after an even number of quotes, since newlines
+    may also be quoted in values.
+    """
+    rest = b""
+    while True:
+        data = file.read(block_bytes)
+        if not data:
+            if rest:
+                yield rest
+            return
+        block = rest + data
+        end = block.rfind(b"\n")
+        while end >= 0 and block.count(b'"', 0, end) % 2:
+            end = block.rfind(b"\n", 0, end)
+        if end < 0:
+            rest = block
+            continue
+        rest = block[end + 1 :]
+        yield block[: end + 1]
+
+
+class ParquetStore:
+    """
+    A read-only table stored in a Parquet file, read one row group at a time.
+
+    The rows are labelled by their position in the file. The decoded row groups
+    are kept in a working set of at most half of `memory_limit` bytes, evicted
+    least recently used first, and results larger than the other half are
+    rejected instead of being read, so that the memory used stays bounded by
+    the limit whatever the size of the file.
+    """
+
+    def __init__(self, path: str | os.PathLike, memory_limit: int) -> None:
+        self.path = os.fspath(path)
+        self.memory_limit = memory_limit
+        self._file = pq.ParquetFile(self.path)
+        metadata = self._file.metadata
+        self.num_rows = metadata.num_rows
+        self.columns = pd.Index(self._file.schema_arrow.names)
+        self.offsets = np.cumsum(
+            [0] + [metadata.row_group(i).num_rows for i in range(self.row_groups)]
+        )
+        self._memory = MemoryAccount()
+        # Memory of a row of each column once decoded, estimated from the first
+        # row group, to check the size of results before reading them.
+        self._row_bytes = dict.fromkeys(self.columns, 0.0)
+        if self.row_groups > 0:
+            first = self._file.read_row_group(0).to_pandas()
+            for column in self.columns:
+                size = self._memory.estimate(first[[column]])
+                self._row_bytes[column] = size / max(len(first), 1)
+        self._guard = threading.Lock()
+        self._working_set: OrderedDict[tuple, tuple[pd.DataFrame, int]] = OrderedDict()
+        self.working_set_bytes = 0
+        # Number of row groups read from the file, for statistics.
+        self.row_groups_read = 0
+
+    def close(self) -> None:
+        """Release the working set and the file."""
+        with self._guard:
+            self._working_set.clear()
+            self.working_set_bytes = 0
+        self._file.close()
+
+    @property
+    def row_groups(self) -> int:
+        return self._file.metadata.num_row_groups
+
+    def empty_frame(self) -> pd.DataFrame:
+        """An empty dataframe with the columns and dtypes of the table."""
+        return self._file.schema_arrow.empty_table().to_pandas()
+
+    def read(self, row_group: int, columns: Sequence[Any]) -> pd.DataFrame:
+        """
+        Read columns of a row group, labelled by the positions of the rows,
+        from the working set if it holds them.
+        """
+        key = (row_group, tuple(columns))
+        with self._guard:
+            cached = self._working_set.get(key)
+            if cached is not None:
+                self._working_set.move_to_end(key)
+                return cached[0]
+            table = self._file.read_row_group(row_group, columns=list(columns))
+            self.row_groups_read += 1
+        frame = table.to_pandas()
+        frame.index = pd.RangeIndex(
+            self.offsets[row_group], self.offsets[row_group + 1]
+        )
+        with self._guard:
+            size = self._memory.estimate(frame)
+            if size <= self.memory_limit // 2 and key not in self._working_set:
+                self._working_set[key] = (frame, size)
+                self.working_set_bytes += size
+                while self.working_set_bytes > self.memory_limit // 2:
+                    _, (_, evicted) = self._working_set.popitem(last=False)
+                    self.working_set_bytes -= evicted
+        return frame
+
+    def take(self, positions: np.ndarray, columns: Sequence[Any]) -> pd.DataFrame:
+        """
+        Get the rows at the positions, in their order, reading only the row
+        groups holding them.
+
+        Raises
+        ------
+        KeyError
+            If a position is outside of the table.
+        ValueError
+            If the rows would use more than half of the memory limit.
+        """
+        self._check_size(len(positions), columns)
+        if len(positions) == 0:
+            return self.empty_frame()[list(columns)]
+        unique = np.unique(positions)
+        if unique[0] < 0 or unique[-1] >= self.num_rows:
+            raise KeyError(f"Rows not in the table: {unique[[0, -1]].tolist()}")
+        row_groups = np.searchsorted(self.offsets, unique, side="right") - 1
+        result = pd.concat(
+            [
+                self.read(int(i), columns).loc[unique[row_groups == i]]
+                for i in np.unique(row_groups)
+            ]
+        )
+        if len(unique) != len(positions) or np.any(np.diff(positions) < 0):
+            result = result.loc[positions]
+        return result
+
+    def filter(self, expr: str) -> pd.DataFrame:
+        """
+        Get the rows matching a query expression, see `DataFrame.query`.
+
+        Row groups whose minimum and maximum show that none of their rows can
+        match a comparison of a column with a literal, combined with the others
+        by "and", are skipped without being read. Only the columns of the
+        expression are read to find the matching rows.
+
+        Raises
+        ------
+        ValueError
+            If the matching rows would use more than half of the memory limit.
+        """
+        conditions = parse_conditions(expr)
+        columns = referenced_columns(expr, self.columns)
+        parts = []
+        rows = 0
+        for i in range(self.row_groups):
+            if not self.may_match(i, conditions):
+                continue
+            mask = np.asarray(self.read(i, columns).eval(expr), dtype=bool)
+            if not mask.any():
+                continue
+            rows += int(mask.sum())
+            self._check_size(rows, self.columns)
+            parts.append(self.read(i, self.columns)[mask])
+        return pd.concat(parts) if parts else self.empty_frame()
+
+    def scan(self, columns: Sequence[Any]) -> Iterator[pd.DataFrame]:
+        """Read columns of the row groups one after the other."""
+        for i in range(self.row_groups):
+            yield self.read(i, columns)
+
+    def may_match(self, row_group: int, conditions: Sequence[Condition]) -> bool:
+        """
+        Whether the statistics of a row group allow rows matching all the
+        conditions. True if they are missing or cannot be compared.
+        """
+        metadata = self._file.metadata.row_group(row_group)
+        for column, op, value in conditions:
+            if column not in self.columns:
+                continue
+            statistics = metadata.column(self.columns.get_loc(column)).statistics
+            if statistics is None or not statistics.has_min_max:
+                continue
+            try:
+                if not _MAY_MATCH[op](statistics.min, statistics.max, value):
+                    return False
+            except TypeError:
+                continue
+        return True
+
+    def _check_size(self, rows: int, columns: Sequence[Any]) -> None:
+        size = rows * sum(self._row_bytes[column] for column in columns)
+        if size > self.memory_limit // 2:
+            raise ValueError(
+                f"The result of {rows} rows would use about {int(size)} bytes, "
+                f"over half of the memory limit of {self.memory_limit} bytes. "
+                "Select fewer rows or columns, or use a narrower filter."
+            )
+
+
+def parse_conditions(expr: str) -> list[Condition]:
+    """
+    Get the comparisons of a column with a literal which the rows matching a
+    query expression must all satisfy, as (column, operator, value). Other
+    parts of the expression are left out, so that they never skip rows.
+    """
+    try:
+        tree = ast.parse(expr.strip(), mode="eval").body
+    except SyntaxError:
+        return []
+    conditions: list[Condition] = []
+    nodes = [tree]
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, ast.BoolOp) and isinstance(node.op, ast.And):
+            nodes.extend(node.values)
+        elif isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitAnd):
+            nodes.extend([node.left, node.right])
+        elif isinstance(node, ast.Compare):
+            operands = [node.left, *node.comparators]
+            for left, op, right in zip(operands, node.ops, operands[1:]):
+                condition = _condition(left, op, right)
+                if condition is not None:
+                    conditions.append(condition)
+    return conditions
+
+
+def _condition(left: ast.expr, op: ast.cmpop, right: ast.expr) -> Condition | None:
+    if type(op) not in _COMPARISONS:
+        return None
+    forward, mirrored = _COMPARISONS[type(op)]
+    if isinstance(left, ast.Name) and isinstance(right, ast.Constant):
+        return (left.id, forward, right.value)
+    if isinstance(left, ast.Constant) and isinstance(right, ast.Name):
+        return (right.id, mirrored, left.value)
+    return None
+
+
+class OutOfCoreEditor(InMemoryEditor):
+    """
+    Read-only editor of a table larger than memory, stored in a Parquet file,
+    see `ParquetStore`.
+
+    Selecting a range reads only the row groups holding its rows, filters skip
+    row groups by their statistics, and aggregations combine partial
+    aggregates of each row group, so that only a working set of row groups is
+    held in memory. The whole table is only loaded if it fits in
+    `config.out_of_core_memory_limit`, e.g. for sorting.
+    """
+
+    def __init__(self, store: ParquetStore, config: EditorConfig | None = None) -> None:
+        self.store = store
+        # Whether the Parquet file is removed on close, see `from_csv`.
+        self.owns_store = False
+        super().__init__(store.empty_frame(), config)
+
+    @classmethod
+    def from_csv(
+        cls,
+        source: str | os.PathLike,
+        config: EditorConfig | None = None,
+        column_types: Mapping[str, Any] | None = None,
+    ) -> "OutOfCoreEditor":
+        """
+        Stream a CSV file into a Parquet file in `config.out_of_core_dir`, or
+        the temporary directory, and open it, see `ingest_csv`.
+        """
+        config = config or EditorConfig.default()
+        fd, path = tempfile.mkstemp(
+            suffix=".parquet", prefix="mcp-table-editor-", dir=config.out_of_core_dir
+        )
+        os.close(fd)
+        try:
+            ingest_csv(source, path, config.out_of_core_block_bytes, column_types)
+        except BaseException:
+            os.remove(path)
+            raise
+        editor = cls.open(path, config)
+        editor.owns_store = True
+        return editor
+
+    @classmethod
+    def open(
+        cls, path: str | os.PathLike, config: EditorConfig | None = None
+    ) -> "OutOfCoreEditor":
+        """Open a Parquet file, e.g. written by `ingest_csv`."""
+        config = config or EditorConfig.default()
+        return cls(ParquetStore(path, config.out_of_core_memory_limit), config)
+
+    @property
+    def _table(self) -> pd.DataFrame:
+        if self._loaded is None:
+            positions = np.arange(self.store.num_rows)
+            self._loaded = self.store.take(positions, self.store.columns)
+        return self._loaded
+
+    @_table.setter
+    def _table(self, table: pd.DataFrame) -> None:
+        # The table is loaded from the store when it is first read.
+        self._loaded: pd.DataFrame | None = None
+
+    @property
+    def columns(self) -> pd.Index:
+        return self.store.columns
+
+    @property
+    def index(self) -> pd.Index:
+        return pd.RangeIndex(self.store.num_rows)
+
+    def _stored_rows(self) -> int:
+        return self.store.num_rows
+
+    @property
+    def memory_usage(self) -> int:
+        """Bytes of the row groups held in the working set."""
+        return self.store.working_set_bytes
+
+    def select(self, range: Range) -> Selector:
+        """
+        Select a range of cells in the table, reading only the row groups
+        holding its rows and only its columns.
+
+        Raises
+        ------
+        KeyError
+            If the range selects rows or columns which are not in the table.
+        ValueError
+            If the selected cells would use more than the memory limit.
+        """
+        index, columns = self.index, self.columns
+        if range.is_location_range():
+            rows, columns = range.get_location(index, columns)
+        else:
+            rows = range.get_index(index) if range.is_index_range() else index
+            if range.is_column_range():
+                columns = range.get_columns(columns)
+        missing = columns.difference(self.columns).tolist()
+        missing += rows.difference(index).tolist()
+        if missing:
+            raise KeyError(f"Not in the table: {missing}")
+        frame = self.store.take(np.asarray(rows, dtype=np.int64), columns)
+        # The labels of the rows are their positions, which select the same
+        # cells in the dataframe of the selection.
+        if range.is_location_range():
+            selected = Range(cell=(rows, columns))
+        else:
+            selected = Range(
+                row=rows if range.is_index_range() else None,
+                column=columns if range.is_column_range() else None,
+            )
+        return InMemorySelector(frame, selected, self.config)
+
+    def select_all(self) -> Selector:
+        return self.select(Range(row=slice(None), column=slice(None)))
+
+    def query_expr(self, query: str) -> pd.DataFrame:
+        """
+        Get the rows matching a query expression, see `ParquetStore.filter`.
+        """
+        return self.store.filter(query)
+
+    def filter(self, query: str) -> pd.DataFrame:
+        """
+        Get the rows matching a query expression, see `ParquetStore.filter`.
+        """
+        return self.store.filter(query)
+
+    def query(self, query: str) -> Selector:
+        result = self.store.filter(query)
+        return InMemorySelector(
+            result, Range(row=result.index, column=result.columns), self.config
+        )
+
+    def group_by(
+        self, by: str | Sequence[str], aggregations: AggregationSpec
+    ) -> pd.DataFrame:
+        """
+        Aggregate columns of the table by groups of rows, combining the partial
+        aggregates of each row group, see `LiveAggregate`. Only "sum", "mean",
+        "count", "min" and "max" are supported. The results are cached.
+        """
+        if isinstance(by, str):
+            by = [by]
+        aggregate = LiveAggregate(by, aggregations, self.columns)
+        version = (self.version, id(self.store))
+        key = (tuple(by), aggregate.spec)
+        result = self._aggregates.get(version, key)
+        if result is None:
+            columns = list(dict.fromkeys([*by, *aggregate.columns]))
+            result = aggregate.compute(self.store.scan(columns))
+            self._aggregates.put(version, key, result)
+        return result
+
+    def commit(self, table: pd.DataFrame, rows: pd.Index | None = None) -> None:
+        raise ValueError(_READ_ONLY)
+
+    def append(
+        self,
+        index: Sequence[Any] | pd.Index,
+        value: Any = pd.NA,
+        insert_rule: InsertRule = InsertRule.ABOVE,
+    ) -> list[list[Any]]:
+        raise ValueError(_READ_ONLY)
+
+    def sort(
+        self,
+        by: str | Sequence[str] | None = None,
+        ascending: bool = True,
+        keep_sorted: bool = False,
+    ) -> None:
+        raise ValueError(_READ_ONLY)
+
+    def sort_by_values(
+        self, columns: str | list[str], values: Sequence[str] | Sequence[Sequence[str]]
+    ) -> None:
+        raise ValueError(_READ_ONLY)
+
+    def _take(self, positions: np.ndarray) -> None:
+        raise ValueError(_READ_ONLY)
+
+    def close(self) -> None:
+        """
+        Release the working set, and remove the Parquet file written by
+        `from_csv`.
+        """
+        self.store.close()
+        self._loaded = None
+        if self.owns_store and os.path.exists(self.store.path):
+            os.remove(self.store.path)
+
+
+_READ_ONLY = (
+    "The out-of-core table is read-only. Select or filter the rows to edit, "
+    "and load them into an in-memory editor."
+)
@@ -0,0 +1,392 @@
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Sequence, TypeVar
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor._range import (
+    AnyKeys,
+    Range,
+    _is_key_range,
+    _key_range_positions,
+)
+
+T = TypeVar("T")
+
+# Rows of a chunk selected by an operator, as a slice or a boolean mask.
+RowSelection = slice | np.ndarray
+
+_pools: dict[int, ThreadPoolExecutor] = {}
+
+# Aggregates combined from partial aggregates of each chunk.
+AGGREGATES = ("sum", "count", "min", "max", "mean")
+
+
+def get_thread_pool(workers: int) -> ThreadPoolExecutor:
+    """
+    Get the thread pool with the given number of workers, starting it on first use.
+    It is separate from the pool running the tool calls, which wait for it.
+    """
+    if workers not in _pools:
+        _pools[workers] = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="mcp-table-editor-partition"
+        )
+    return _pools[workers]
+
+
+@atexit.register
+def _shutdown_pools() -> None:
+    for pool in _pools.values():
+        pool.shutdown(wait=False, cancel_futures=True)
+    _pools.clear()
+
+
+class PartitionedTable:
+    """
+    A table stored as chunks of consecutive rows.
+
+    Operators visit only the chunks overlapping the selected rows, and run on
+    each chunk in a thread pool, where pandas releases the GIL in most of its
+    kernels. The table is immutable: operators changing it return a new table
+    sharing the chunks they left unchanged.
+    """
+
+    def __init__(
+        self,
+        chunks: Sequence[pd.DataFrame],
+        columns: pd.Index | None = None,
+        workers: int = 1,
+    ) -> None:
+        # An empty table is kept as a single empty chunk, which holds the dtypes.
+        self.chunks = [chunk for chunk in chunks if len(chunk) > 0] or list(chunks[:1])
+        if columns is None:
+            columns = chunks[0].columns if chunks else pd.Index([])
+        self.columns = columns
+        self.workers = workers
+        self._offsets = np.cumsum([0, *(len(chunk) for chunk in self.chunks)])
+        self._bounds: list[tuple[Any, Any]] | None | bool = False
+
+    @classmethod
+    def from_frame(
+        cls, table: pd.DataFrame, chunk_rows: int, workers: int = 1
+    ) -> "PartitionedTable":
+        """
+        Split a table into chunks of `chunk_rows` rows.
+        The chunks are views of the table, which is not copied.
+        """
+        if chunk_rows <= 0:
+            raise ValueError(f"chunk_rows must be positive, got {chunk_rows}.")
+        chunks = [
+            table.iloc[start : start + chunk_rows]
+            for start in range(0, len(table), chunk_rows)
+        ]
+        return cls(chunks or [table], table.columns, workers)
+
+    def __len__(self) -> int:
+        return int(self._offsets[-1])
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self), len(self.columns)
+
+    @property
+    def index(self) -> pd.Index:
+        """
+        The labels of the rows of all the chunks.
+        """
+        if len(self.chunks) <= 1:
+            return self.to_frame().index
+        return self.chunks[0].index.append([chunk.index for chunk in self.chunks[1:]])
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Join the chunks into a single dataframe.
+        """
+        if not self.chunks:
+            return pd.DataFrame(columns=self.columns)
+        if len(self.chunks) == 1:
+            return self.chunks[0]
+        return pd.concat(self.chunks)
+
+    def map(self, func: Callable[..., T], *items: Sequence[Any]) -> list[T]:
+        """
+        Call a function on each tuple of items in the thread pool, in order.
+        """
+        calls = list(zip(*items))
+        if self.workers <= 1 or len(calls) <= 1:
+            return [func(*call) for call in calls]
+        return list(get_thread_pool(self.workers).map(func, *items))
+
+    def append(self, rows: pd.DataFrame, chunk_rows: int) -> "PartitionedTable":
+        """
+        Append rows at the end of the table, filling up the last chunk first.
+        """
+        if len(rows) == 0:
+            return self
+        chunks = [chunk for chunk in self.chunks if len(chunk) > 0]
+        if chunks and len(chunks[-1]) < chunk_rows:
+            rows = pd.concat([chunks.pop(), rows])
+        chunks.extend(
+            rows.iloc[start : start + chunk_rows]
+            for start in range(0, len(rows), chunk_rows)
+        )
+        return PartitionedTable(chunks, self.columns, self.workers)
+
+    def select(self, cell_range: Range) -> pd.DataFrame:
+        """
+        Get the cells of a range, visiting only the chunks overlapping its rows.
+        """
+        rows, columns = _split_range(cell_range)
+        selection = self.select_rows(rows)
+        positions = self.columns.get_indexer(self._columns(columns))
+        parts = self.map(
+            lambda i, selected: self.chunks[i].iloc[selected, positions],
+            *_unzip(selection, 2),
+        )
+        result = pd.concat(parts) if parts else self.to_frame().iloc[:0, positions]
+        if rows is not None and not isinstance(rows, slice) and not _is_key_range(rows):
+            # Labels are returned in the order they are given, like `.loc`.
+            result = result.loc[_labels(rows)]
+        return result
+
+    def filter(self, expr: str) -> pd.DataFrame:
+        """
+        Get the rows matching a query expression, see `DataFrame.query`.
+        """
+        if not self.chunks:
+            return self.to_frame().query(expr)
+        return pd.concat(self.map(lambda chunk: chunk.query(expr), self.chunks))
+
+    def update(self, cell_range: Range, value: Any) -> "PartitionedTable":
+        """
+        Set the cells of a range to a scalar value, upcasting the columns which
+        cannot hold it, e.g. int to float for NaN.
+        Only the updated columns of the chunks overlapping the range are copied.
+
+        Raises
+        ------
+        KeyError
+            If the range selects columns which are not in the table.
+        """
+        rows, columns = _split_range(cell_range)
+        columns = self._columns(columns)
+        missing = columns.difference(self.columns)
+        if len(missing) > 0:
+            raise KeyError(f"Columns not in the table: {missing.tolist()}")
+        positions = self.columns.get_indexer(columns)
+
+        def update_chunk(i: int, selected: RowSelection) -> pd.DataFrame:
+            chunk = self.chunks[i].copy(deep=False)
+            mask = np.zeros(len(chunk), dtype=bool)
+            mask[selected] = True
+            for position in positions:
+                chunk.isetitem(position, chunk.iloc[:, position].mask(mask, value))
+            return chunk
+
+        selection = self.select_rows(rows)
+        updated = self.map(update_chunk, *_unzip(selection, 2))
+        chunks = list(self.chunks)
+        for (i, _), chunk in zip(selection, updated):
+            chunks[i] = chunk
+        return PartitionedTable(chunks, self.columns, self.workers)
+
+    def delete(self, cell_range: Range) -> "PartitionedTable":
+        """
+        Set the cells of a range to NA, as NaN in the numeric columns.
+        """
+        return self.update(cell_range, pd.NA)
+
+    def contains(self, cell_range: Range) -> bool:
+        """
+        Whether the rows and columns given by labels in a range are all in the
+        table. Slices and label ranges select only existing rows and columns.
+        """
+        rows, columns = _split_range(cell_range)
+        if columns is not None and not isinstance(columns, slice):
+            if (
+                not _is_key_range(columns)
+                and not _labels(columns).isin(self.columns).all()
+            ):
+                return False
+        if rows is None or isinstance(rows, slice) or _is_key_range(rows):
+            return True
+        labels = _labels(rows)
+        found = np.zeros(len(labels), dtype=bool)
+        for chunk in self.chunks:
+            found |= labels.isin(chunk.index)
+        return bool(found.all())
+
+    def aggregate(
+        self, func: str | Sequence[str], columns: Sequence[Any] | None = None
+    ) -> pd.Series | pd.DataFrame:
+        """
+        Aggregate columns over all the rows, from partial aggregates of each chunk.
+
+        Parameters
+        ----------
+        func : str | Sequence[str]
+            One or more of "sum", "count", "min", "max" and "mean".
+        columns : Sequence[Any] | None
+            The columns to aggregate. If None, all the columns.
+
+        Returns
+        -------
+        pd.Series | pd.DataFrame
+            The aggregate of each column, or a dataframe with a row per function
+            if several functions are given, like `DataFrame.agg`.
+        """
+        funcs = [func] if isinstance(func, str) else list(func)
+        unknown = [name for name in funcs if name not in AGGREGATES]
+        if unknown:
+            raise ValueError(
+                f"Unsupported aggregates {unknown}, expected some of {AGGREGATES}."
+            )
+        columns = self.columns if columns is None else pd.Index(columns)
+        needed = set(funcs) - {"mean"}
+        if "mean" in funcs:
+            needed |= {"sum", "count"}
+        partial_funcs = [
+            name for name in ("sum", "count", "min", "max") if name in needed
+        ]
+
+        parts = self.map(
+            lambda chunk: chunk[columns].agg(partial_funcs),
+            self.chunks or [self.to_frame()],
+        )
+        partials = pd.concat(parts, keys=range(len(parts)))
+        results = {}
+        for name in funcs:
+            if name == "mean":
+                results[name] = (
+                    partials.xs("sum", level=1).sum()
+                    / partials.xs("count", level=1).sum()
+                )
+            elif name in ("sum", "count"):
+                results[name] = partials.xs(name, level=1).sum()
+            else:
+                results[name] = getattr(partials.xs(name, level=1), name)()
+        if isinstance(func, str):
+            return results[func].rename(None)
+        return pd.DataFrame(results).T
+
+    def select_rows(self, keys: AnyKeys | None) -> list[tuple[int, RowSelection]]:
+        """
+        Get the chunks overlapping the selected rows, with the rows of each chunk.
+        Chunks whose labels are sorted are skipped by their bounds without being read.
+        A label range over labels which are not sorted selects the positions between
+        its bounds, like `.loc`.
+        """
+        if keys is None:
+            return [(i, slice(None)) for i in range(len(self.chunks))]
+        if isinstance(keys, slice):
+            return self._select_positions(keys)
+        if _is_key_range(keys) and self._chunk_bounds() is None:
+            return self._select_positions(_key_range_positions(keys, self.index))
+        candidates = self._candidate_chunks(keys)
+        if _is_key_range(keys):
+
+            def mask(chunk: pd.DataFrame) -> np.ndarray:
+                selected = np.zeros(len(chunk), dtype=bool)
+                selected[_key_range_positions(keys, chunk.index)] = True
+                return selected
+
+        else:
+            labels = _labels(keys)
+
+            def mask(chunk: pd.DataFrame) -> np.ndarray:
+                return chunk.index.isin(labels)
+
+        masks = self.map(lambda i: mask(self.chunks[i]), candidates)
+        return [
+            (i, selected) for i, selected in zip(candidates, masks) if selected.any()
+        ]
+
+    def _select_positions(self, keys: slice) -> list[tuple[int, RowSelection]]:
+        start, stop, step = keys.indices(len(self))
+        if step < 0:
+            raise ValueError("Slices with a negative step are not supported.")
+        selection = []
+        for i, chunk in enumerate(self.chunks):
+            offset = int(self._offsets[i])
+            end = offset + len(chunk)
+            if stop <= offset or start >= end:
+                continue
+            first = start
+            if start < offset:
+                # The first position of the chunk on the grid of the step.
+                first += -(-(offset - start) // step) * step
+            if first >= min(stop, end):
+                continue
+            selection.append((i, slice(first - offset, min(stop, end) - offset, step)))
+        return selection
+
+    def _candidate_chunks(self, keys: AnyKeys) -> list[int]:
+        """
+        Get the chunks which may hold the selected labels.
+        """
+        bounds = self._chunk_bounds()
+        everything = list(range(len(self.chunks)))
+        if bounds is None:
+            return everything
+        firsts = pd.Index([first for first, _ in bounds])
+        try:
+            if _is_key_range(keys):
+                start, stop = keys.start, keys.stop
+                return [
+                    i
+                    for i, (first, last) in enumerate(bounds)
+                    if (start is None or last >= start)
+                    and (stop is None or first <= stop)
+                ]
+            labels = _labels(keys)
+            found = firsts.searchsorted(labels, side="right") - 1
+            return sorted({int(i) for i in found if i >= 0})
+        except TypeError:
+            # Labels which are not comparable with the index.
+            return everything
+
+    def _chunk_bounds(self) -> list[tuple[Any, Any]] | None:
+        """
+        The first and last label of each chunk, if the labels of the table are
+        sorted and the chunks do not share labels, else None.
+        """
+        if self._bounds is False:
+            bounds = []
+            for chunk in self.chunks:
+                if len(chunk) == 0 or not chunk.index.is_monotonic_increasing:
+                    bounds = None
+                    break
+                first, last = chunk.index[0], chunk.index[-1]
+                if bounds and not bounds[-1][1] < first:
+                    bounds = None
+                    break
+                bounds.append((first, last))
+            self._bounds = bounds
+        return self._bounds
+
+    def _columns(self, keys: AnyKeys | None) -> pd.Index:
+        if keys is None:
+            return self.columns
+        return Range(column=keys).get_columns(self.columns)
+
+
+def _split_range(cell_range: Range) -> tuple[AnyKeys | None, AnyKeys | None]:
+    """Get the row and column keys of a range, None for all of them."""
+    if cell_range.is_location_range():
+        return cell_range.cell[0], cell_range.cell[1]
+    return cell_range.row, cell_range.column
+
+
+def _labels(keys: AnyKeys) -> pd.Index:
+    if isinstance(keys, pd.Index):
+        return keys
+    if isinstance(keys, (list, tuple)):
+        return pd.Index(keys)
+    return pd.Index([keys])
+
+
+def _unzip(pairs: list[tuple], size: int) -> list[list]:
+    if not pairs:
+        return [[] for _ in range(size)]
+    return [list(items) for items in zip(*pairs)]
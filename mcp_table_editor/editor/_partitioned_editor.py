@@ -0,0 +1,207 @@
+import os
+from typing import Any, Sequence
+
+import pandas as pd
+
+from mcp_table_editor.editor._in_memory_editor import InMemoryEditor
+from mcp_table_editor.editor._partitioned import (
+    PartitionedTable,
+    _labels,
+    _split_range,
+)
+from mcp_table_editor.editor._partitioned_selector import PartitionedSelector
+from mcp_table_editor.editor._range import Range, _is_key_range
+from mcp_table_editor.editor._selector import Selector
+
+
+class PartitionedEditor(InMemoryEditor):
+    """
+    InMemoryEditor which stores the table as chunks of `config.partition_rows` rows.
+
+    Selecting a range reads only the chunks overlapping it, and the `filter`,
+    `update`, `delete` and `aggregate` operators run on each chunk in a thread pool
+    of `config.partition_workers` threads. Updates copy only the chunks they change,
+    and the whole table is joined from the chunks only when it is read.
+    Updates of the columns the table is kept sorted by, or under memory limits,
+    are committed as a whole table instead, see `commit`, so that the order and
+    the limits are kept.
+    """
+
+    @property
+    def workers(self) -> int:
+        """Number of threads running the operators."""
+        return self.config.partition_workers or os.cpu_count() or 1
+
+    @property
+    def _table(self) -> pd.DataFrame:
+        if self._frame is None:
+            self._frame = self.partitions.to_frame()
+        return self._frame
+
+    @_table.setter
+    def _table(self, table: pd.DataFrame) -> None:
+        self._frame: pd.DataFrame | None = table
+        self.partitions = PartitionedTable.from_frame(
+            table, self.config.partition_rows, self.workers
+        )
+        self._partition_usage: dict[int, int] = {}
+
+    def _set_partitions(self, cell_range: Range, partitions: PartitionedTable) -> None:
+        """
+        Replace the chunks of the table after an operator changed the cells of
+        a range, with the invariants of `commit`.
+        """
+        rows, columns = _split_range(cell_range)
+        edited = self.columns
+        if columns is not None:
+            edited = Range(column=columns).get_columns(self.columns)
+        labels = None
+        if rows is not None and not (isinstance(rows, slice) or _is_key_range(rows)):
+            labels = _labels(rows).unique()
+        sort_columns = self.sort_key[0] if self.sort_key is not None else []
+        if self._has_memory_limit() or edited.isin(sort_columns).any():
+            self.commit(partitions.to_frame(), rows=labels)
+            return
+        for aggregate in self._live_aggregates.values():
+            if not edited.isin([*aggregate.by, *aggregate.columns]).any():
+                continue
+            if labels is None:
+                aggregate.invalidate()
+            else:
+                aggregate.update(
+                    self.partitions.select(Range(row=labels)),
+                    partitions.select(Range(row=labels)),
+                )
+        self.partitions = partitions
+        self._frame = None
+        self.version += 1
+
+    def _join_appended(self) -> None:
+        """Move the appended rows into the chunks before operating on them."""
+        if self._chunks or self._tail_index:
+            self._consolidate()
+
+    def _stored_rows(self) -> int:
+        return len(self.partitions)
+
+    def _storage_id(self) -> int:
+        return id(self.partitions)
+
+    def _estimate_stored(self) -> int:
+        # The estimate of each chunk is kept until the chunk is replaced.
+        usage = {}
+        for chunk in self.partitions.chunks:
+            usage[id(chunk)] = self._partition_usage.get(id(chunk))
+            if usage[id(chunk)] is None:
+                usage[id(chunk)] = self._memory.estimate(chunk)
+        self._partition_usage = usage
+        return sum(usage.values())
+
+    def _last_row(self) -> list[Any]:
+        if self._tail_rows or self._chunks:
+            return super()._last_row()
+        return self.partitions.chunks[-1].iloc[-1].tolist()
+
+    @property
+    def columns(self) -> pd.Index:
+        return self.partitions.columns
+
+    @property
+    def index(self) -> pd.Index:
+        # The labels are read from the chunks, without joining the table.
+        self._join_appended()
+        if self._frame is not None:
+            return self._frame.index
+        return self.partitions.index
+
+    def select(self, range: Range) -> Selector:
+        """Select a range of cells in the table.
+        Reading the selection visits only the chunks overlapping the range.
+
+        Parameters
+        ----------
+        range : Range
+            The range of cells to select. The range is defined by the row and column indices.
+
+        Returns
+        -------
+        Selector
+            A Selector object that contains the selected cells.
+        """
+        self._join_appended()
+        return PartitionedSelector(self.partitions, range, self.config)
+
+    def query_expr(self, query: str) -> pd.DataFrame:
+        """
+        Query the table with a given query expression, chunk by chunk.
+        """
+        return self.filter(query)
+
+    def filter(self, query: str) -> pd.DataFrame:
+        """
+        Get the rows matching a query expression, filtering the chunks in parallel.
+
+        Parameters
+        ----------
+        query : str
+            The query expression, see `DataFrame.query`.
+
+        Returns
+        -------
+        pd.DataFrame
+            The matching rows.
+        """
+        self._join_appended()
+        return self.partitions.filter(query)
+
+    def update(self, range: Range, value: Any) -> None:
+        """
+        Set the cells of a range to a scalar value, in the chunks overlapping it.
+
+        Parameters
+        ----------
+        range : Range
+            The cells to update, in existing columns.
+        value : Any
+            The new value of the cells.
+        """
+        self._join_appended()
+        self._set_partitions(range, self.partitions.update(range, value))
+
+    def delete(self, range: Range) -> None:
+        """
+        Set the cells of a range to NA, in the chunks overlapping it.
+
+        Parameters
+        ----------
+        range : Range
+            The cells to delete, in existing columns.
+        """
+        self._join_appended()
+        self._set_partitions(range, self.partitions.delete(range))
+
+    def aggregate(
+        self, func: str | Sequence[str], columns: Sequence[Any] | None = None
+    ) -> pd.Series | pd.DataFrame:
+        """
+        Aggregate columns over all the rows, from partial aggregates of each chunk.
+        See `PartitionedTable.aggregate`.
+        """
+        self._join_appended()
+        return self.partitions.aggregate(func, columns)
+
+    def sort(
+        self,
+        by: str | Sequence[str] | None = None,
+        ascending: bool = True,
+        keep_sorted: bool = False,
+    ) -> None:
+        super().sort(by=by, ascending=ascending, keep_sorted=keep_sorted)
+        # The table may be sorted in place, so that it is split again.
+        self._table = self._table
+
+    def sort_by_values(
+        self, columns: str | list[str], values: Sequence[str] | Sequence[Sequence[str]]
+    ) -> None:
+        super().sort_by_values(columns, values)
+        self._table = self._table
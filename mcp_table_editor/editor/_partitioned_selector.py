@@ -0,0 +1,91 @@
+import pandas as pd
+
+from mcp_table_editor.editor._config import EditorConfig
+from mcp_table_editor.editor._in_memory_selector import InMemorySelector
+from mcp_table_editor.editor._partitioned import PartitionedTable
+from mcp_table_editor.editor._range import Range
+from mcp_table_editor.misc import merge_index
+
+
+class PartitionedSelector(InMemorySelector):
+    """
+    Selector of a partitioned table.
+
+    Reading the selected range visits only the chunks overlapping it. The operations
+    changing the table work on the whole dataframe, which is joined from the chunks
+    on first use.
+    """
+
+    def __init__(
+        self, table: PartitionedTable, cell_range: Range, editor_config: EditorConfig
+    ) -> None:
+        self.partitions = table
+        self.range = cell_range
+        self.editor_config = editor_config
+        self._df: pd.DataFrame | None = None
+
+    @property
+    def df(self) -> pd.DataFrame:
+        if self._df is None:
+            self._df = self.partitions.to_frame().copy(deep=False)
+        return self._df
+
+    @df.setter
+    def df(self, df: pd.DataFrame) -> None:
+        self._df = df
+
+    def selected_dataframe(self) -> pd.DataFrame:
+        """
+        Get the selected dataframe based on the range.
+        """
+        if self._df is not None or not self._is_chunked(self.range):
+            return super().selected_dataframe()
+        return self.partitions.select(self.range)
+
+    def display_dataframe(self, columns: pd.Index, rows: pd.Index) -> pd.DataFrame:
+        """
+        Get the selected dataframe for display, with the given columns and rows.
+        The cells are read from the chunks holding the displayed rows.
+        """
+        if self._df is not None or not self._is_chunked(self.range):
+            return super().display_dataframe(columns, rows)
+        table_columns = self.partitions.columns
+        display_columns = table_columns
+        display_rows = None
+        if self.range.is_column_range():
+            display_columns = merge_index(
+                table_columns, self.range.get_columns(table_columns), columns
+            )
+        if self.range.is_index_range():
+            index = self.partitions.index
+            display_rows = merge_index(index, self.range.get_index(index), rows)
+        if self.range.is_location_range():
+            index = self.partitions.index
+            selected_rows, selected_columns = self.range.get_location(
+                index, table_columns
+            )
+            display_columns = merge_index(table_columns, selected_columns, columns)
+            display_rows = merge_index(index, selected_rows, rows)
+        if display_rows is not None and len(display_rows) == len(self.partitions):
+            # Every row is displayed, in the order of the table.
+            display_rows = None
+        row_keys = slice(None) if display_rows is None else display_rows
+        return self.partitions.select(Range(cell=(row_keys, display_columns)))
+
+    def get(self) -> pd.DataFrame:
+        """Get the selected range from the dataframe.
+
+        Returns
+        -------
+        pd.DataFrame
+            The selected range from the dataframe.
+        """
+        return self.selected_dataframe()
+
+    def _is_chunked(self, cell_range: Range) -> bool:
+        """
+        Whether the range can be read chunk by chunk.
+        Slices with a negative step reverse the rows, which is left to pandas.
+        """
+        keys = cell_range.cell[0] if cell_range.is_location_range() else cell_range.row
+        return not (isinstance(keys, slice) and (keys.step or 1) < 0)
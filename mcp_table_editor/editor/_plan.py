@@ -0,0 +1,420 @@
+import io
+import re
+import tokenize
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Sequence
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor._range import Range
+from mcp_table_editor.editor._top_k import key_code, top_k_positions
+
+if TYPE_CHECKING:
+    from mcp_table_editor.editor._in_memory_editor import InMemoryEditor
+
+
+@dataclass(frozen=True)
+class Scan:
+    """Read the rows and columns of a range of the table, all of them if None."""
+
+    range: Range | None = None
+    # The columns read, after pruning the columns which are never used.
+    columns: tuple[Any, ...] | None = None
+
+    def __str__(self) -> str:
+        keys = []
+        if self.range is not None:
+            if self.range.is_location_range():
+                keys.append(f"cell={self.range.cell!r}")
+            if self.range.is_index_range():
+                keys.append(f"rows={self.range.row!r}")
+            if self.range.is_column_range():
+                keys.append(f"columns={self.range.column!r}")
+        if self.columns is not None:
+            keys.append(f"read={list(self.columns)}")
+        return f"Scan({', '.join(keys)})"
+
+
+@dataclass(frozen=True)
+class Filter:
+    """Keep the rows matching a query expression, see `DataFrame.query`."""
+
+    expr: str
+    # The columns the expression refers to.
+    columns: tuple[Any, ...] = ()
+
+    def __str__(self) -> str:
+        if not self.columns:
+            return f"Filter({self.expr!r})"
+        return f"Filter({self.expr!r}, columns={list(self.columns)})"
+
+
+@dataclass(frozen=True)
+class Sort:
+    """Sort the rows stably by columns, with the missing values last."""
+
+    by: tuple[Any, ...]
+    ascending: tuple[bool, ...]
+
+    def __str__(self) -> str:
+        return f"Sort(by={list(self.by)}, ascending={list(self.ascending)})"
+
+
+@dataclass(frozen=True)
+class Project:
+    """Keep some of the columns, in the given order."""
+
+    columns: tuple[Any, ...]
+
+    def __str__(self) -> str:
+        return f"Project({list(self.columns)})"
+
+
+@dataclass(frozen=True)
+class Limit:
+    """Keep the first rows."""
+
+    n: int
+
+    def __str__(self) -> str:
+        return f"Limit({self.n})"
+
+
+@dataclass(frozen=True)
+class TopK:
+    """Keep the first rows in sorted order without sorting all the rows."""
+
+    by: tuple[Any, ...]
+    ascending: tuple[bool, ...]
+    k: int
+
+    def __str__(self) -> str:
+        return f"TopK(by={list(self.by)}, ascending={list(self.ascending)}, k={self.k})"
+
+
+Operator = Scan | Filter | Sort | Project | Limit | TopK
+
+
+class QueryPlan:
+    """
+    A lazy query of the table of an editor: a scan of a range followed by
+    filters, sorts, projections and limits, which are only recorded until the
+    plan is collected.
+
+    Collecting the plan optimizes it first: filters are moved before the sorts
+    and projections and adjacent ones are fused, limits are moved before the
+    projections and fused with a preceding sort into a top-k, and only the
+    columns used by the operators or returned are read. The optimized plan is
+    run on the row positions of the table, a slice of them as long as no
+    operator reorders or drops rows, reading only the columns each operator
+    needs, and the result is taken from the table once at the end.
+
+    Plans are immutable, each method returns a new plan.
+    """
+
+    def __init__(
+        self, editor: "InMemoryEditor", operators: tuple[Operator, ...] = (Scan(),)
+    ) -> None:
+        self.editor = editor
+        self.operators = operators
+
+    def _then(self, operator: Operator) -> "QueryPlan":
+        return QueryPlan(self.editor, self.operators + (operator,))
+
+    def select(self, range: Range) -> "QueryPlan":
+        """
+        Read only a range of the table, like `InMemoryEditor.select`.
+
+        Raises
+        ------
+        ValueError
+            If the plan has other operators already.
+        """
+        if len(self.operators) > 1:
+            raise ValueError("select must be the first operator of a plan.")
+        return QueryPlan(self.editor, (Scan(range),))
+
+    def filter(self, expr: str) -> "QueryPlan":
+        """Keep the rows matching a query expression, see `DataFrame.query`."""
+        return self._then(Filter(expr))
+
+    def sort(
+        self, by: str | Sequence[str], ascending: bool | Sequence[bool] = True
+    ) -> "QueryPlan":
+        """
+        Sort the rows stably by one or more columns, with the missing values last.
+
+        Raises
+        ------
+        ValueError
+            If there is no column, or not one order per column.
+        """
+        by = (by,) if isinstance(by, str) else tuple(by)
+        if not by:
+            raise ValueError("At least one column to sort by is required.")
+        if isinstance(ascending, bool):
+            ascending = (ascending,) * len(by)
+        if len(ascending) != len(by):
+            raise ValueError(
+                f"Expected {len(by)} orders for {list(by)}, got {len(ascending)}."
+            )
+        return self._then(Sort(by, tuple(ascending)))
+
+    def project(self, columns: str | Sequence[str]) -> "QueryPlan":
+        """Keep some of the columns, in the given order."""
+        columns = (columns,) if isinstance(columns, str) else tuple(columns)
+        return self._then(Project(columns))
+
+    def limit(self, n: int) -> "QueryPlan":
+        """
+        Keep the first `n` rows.
+
+        Raises
+        ------
+        ValueError
+            If `n` is negative.
+        """
+        if n < 0:
+            raise ValueError(f"n must not be negative, got {n}.")
+        return self._then(Limit(n))
+
+    def optimize(self) -> "QueryPlan":
+        """
+        Get the optimized plan, see `QueryPlan`.
+
+        Raises
+        ------
+        KeyError
+            If an operator uses a column which is not in its input.
+        """
+        return QueryPlan(self.editor, optimize(self.operators, self.editor.columns))
+
+    def explain(self) -> str:
+        """Describe the plan and the optimized plan, one operator per line."""
+        optimized = self.optimize()
+        return (
+            "Logical plan:\n"
+            + _describe(self.operators)
+            + "\nOptimized plan:\n"
+            + _describe(optimized.operators)
+        )
+
+    def collect(self) -> pd.DataFrame:
+        """
+        Optimize and run the plan.
+
+        Returns
+        -------
+        pd.DataFrame
+            The rows and columns of the result, with their labels in the table.
+        """
+        table = self.editor.table
+        return execute(optimize(self.operators, table.columns), table)
+
+    def __repr__(self) -> str:
+        return "QueryPlan(" + " -> ".join(str(op) for op in self.operators) + ")"
+
+
+def optimize(operators: Sequence[Operator], columns: pd.Index) -> tuple[Operator, ...]:
+    """
+    Optimize the operators of a plan on a table with the given columns,
+    see `QueryPlan`.
+    """
+    scan, steps = operators[0], list(operators[1:])
+    selected = _scan_columns(scan, columns)
+    output = _check(steps, selected, columns)
+    # The columns each filter reads to evaluate its expression.
+    steps = [
+        (
+            Filter(step.expr, referenced_columns(step.expr, columns))
+            if isinstance(step, Filter)
+            else step
+        )
+        for step in steps
+    ]
+    steps = _rewrite(steps)
+    # The columns are selected once at the end, after pruning the scan.
+    steps = [step for step in steps if not isinstance(step, Project)]
+    used = set(output)
+    for step in steps:
+        if isinstance(step, Filter):
+            used.update(step.columns)
+        elif isinstance(step, (Sort, TopK)):
+            used.update(step.by)
+    read = tuple(column for column in selected if column in used)
+    if list(output) != list(read):
+        steps.append(Project(tuple(output)))
+    return (Scan(scan.range, read), *steps)
+
+
+def _rewrite(steps: list[Operator]) -> list[Operator]:
+    """
+    Apply the rewriting rules on pairs of adjacent operators until none applies.
+    """
+    changed = True
+    while changed:
+        changed = False
+        for i in range(1, len(steps)):
+            rewritten = _rewrite_pair(steps[i - 1], steps[i])
+            if rewritten is not None:
+                steps[i - 1 : i + 1] = rewritten
+                changed = True
+                break
+    return steps
+
+
+def _rewrite_pair(first: Operator, second: Operator) -> list[Operator] | None:
+    if isinstance(second, Filter):
+        if isinstance(first, (Sort, Project)):
+            # Filtering before sorting sorts fewer rows.
+            return [second, first]
+        if isinstance(first, Filter):
+            columns = tuple(dict.fromkeys(first.columns + second.columns))
+            return [Filter(f"({first.expr}) and ({second.expr})", columns)]
+    if isinstance(second, Limit):
+        if isinstance(first, Project):
+            return [second, first]
+        if isinstance(first, Limit):
+            return [Limit(min(first.n, second.n))]
+        if isinstance(first, Sort):
+            return [TopK(first.by, first.ascending, second.n)]
+        if isinstance(first, TopK):
+            return [TopK(first.by, first.ascending, min(first.k, second.n))]
+    return None
+
+
+def _check(
+    steps: Sequence[Operator], columns: list[Any], table_columns: pd.Index
+) -> list[Any]:
+    """
+    Check each operator uses only the columns of its input, and get the
+    columns of the result.
+    """
+    for step in steps:
+        if isinstance(step, Sort):
+            used = list(step.by)
+        elif isinstance(step, Project):
+            used = list(step.columns)
+        elif isinstance(step, Filter):
+            used = list(referenced_columns(step.expr, table_columns))
+        else:
+            continue
+        missing = [column for column in used if column not in columns]
+        if missing:
+            raise KeyError(f"Columns not in the table: {missing}")
+        if isinstance(step, Project):
+            columns = list(step.columns)
+    return columns
+
+
+def referenced_columns(expr: str, columns: pd.Index) -> tuple[Any, ...]:
+    """
+    Get the columns a query expression refers to, by their names or quoted in
+    backticks. All the columns if the expression cannot be tokenized.
+    """
+    names = set(re.findall(r"`([^`]*)`", expr))
+    try:
+        tokens = tokenize.generate_tokens(
+            io.StringIO(re.sub(r"`[^`]*`", " ", expr)).readline
+        )
+        names.update(token.string for token in tokens if token.type == tokenize.NAME)
+    except (tokenize.TokenError, SyntaxError):
+        return tuple(columns)
+    return tuple(column for column in columns if column in names)
+
+
+def execute(operators: Sequence[Operator], table: pd.DataFrame) -> pd.DataFrame:
+    """
+    Run optimized operators on the table, on the positions of its rows.
+    """
+    scan = operators[0]
+    positions = _scan_positions(scan, table.index)
+    columns = scan.columns if scan.columns is not None else tuple(table.columns)
+    for step in operators[1:]:
+        if isinstance(step, Filter):
+            frame = _rows(table, positions, step.columns)
+            mask = np.asarray(frame.eval(step.expr), dtype=bool)
+            positions = _subset(positions, len(table), np.flatnonzero(mask))
+        elif isinstance(step, (Sort, TopK)):
+            frame = _rows(table, positions, step.by)
+            codes = [
+                key_code(frame[column], order)
+                for column, order in zip(step.by, step.ascending)
+            ]
+            if isinstance(step, TopK):
+                order = top_k_positions(codes, step.k)
+            elif len(codes) == 1:
+                order = np.argsort(codes[0], kind="stable")
+            else:
+                # np.lexsort sorts by the last key first, and is stable.
+                order = np.lexsort(codes[::-1])
+            positions = _subset(positions, len(table), order)
+        elif isinstance(step, Limit):
+            if isinstance(positions, slice):
+                kept = range(len(table))[positions][: step.n]
+                positions = np.arange(kept.start, kept.stop, kept.step)
+            else:
+                positions = positions[: step.n]
+        elif isinstance(step, Project):
+            columns = step.columns
+    return table.iloc[positions, table.columns.get_indexer(list(columns))]
+
+
+def _scan_columns(scan: Scan, columns: pd.Index) -> list[Any]:
+    """Get the columns of the range of a scan."""
+    if scan.range is None:
+        return list(columns)
+    if scan.range.is_location_range():
+        return list(scan.range.get_location(None, columns)[1])
+    if scan.range.is_column_range():
+        return list(scan.range.get_columns(columns))
+    return list(columns)
+
+
+def _scan_positions(scan: Scan, index: pd.Index) -> slice | np.ndarray:
+    """Get the positions of the rows of the range of a scan."""
+    if scan.range is None:
+        return slice(None)
+    if scan.range.is_location_range():
+        keys = scan.range.cell[0]
+        labels = scan.range.get_location(index, None)[0]
+    elif scan.range.is_index_range():
+        keys = scan.range.row
+        labels = scan.range.get_index(index)
+    else:
+        return slice(None)
+    positions = Range(row=keys).get_index_positions(index)
+    if positions is not None:
+        return positions
+    found = index.get_indexer_for(labels)
+    if (found == -1).any():
+        missing = labels.difference(index).tolist()
+        raise KeyError(f"Rows not in the table: {missing}")
+    return found
+
+
+def _rows(
+    table: pd.DataFrame, positions: slice | np.ndarray, columns: Sequence[Any]
+) -> pd.DataFrame:
+    """Get some columns of the rows at the positions."""
+    return table.iloc[positions, table.columns.get_indexer(list(columns))]
+
+
+def _subset(
+    positions: slice | np.ndarray, length: int, selected: np.ndarray
+) -> np.ndarray:
+    """Get the positions at the selected indices of the positions."""
+    if isinstance(positions, slice):
+        start, _, step = positions.indices(length)
+        return start + step * selected
+    return positions[selected]
+
+
+def _describe(operators: Sequence[Operator]) -> str:
+    """Describe the operators as a tree, the last one at the root."""
+    lines = [
+        "  " * (depth + 1) + str(operator)
+        for depth, operator in enumerate(reversed(operators))
+    ]
+    return "\n".join(lines)
@@ -1,9 +1,25 @@
-from typing import Any, Sequence, TypeAlias
+from dataclasses import dataclass
+from typing import Any, Sequence
 
 import pandas as pd
 
+from mcp_table_editor.misc import span
+
 Key = Any
-KeyRange = tuple[Key, Key]
+
+
+@dataclass(frozen=True)
+class KeyRange:
+    """
+    The labels from `start` to `stop`, both included, like a slice of `.loc`.
+    Either bound may be None for an open-ended range.
+    """
+
+    start: Key = None
+    stop: Key = None
+
+
+# A slice selects positions, like `.iloc`.
 AnyKeys = Key | KeyRange | Sequence[Key] | slice
 
 
@@ -19,33 +35,142 @@ class Range:
         self.row = row
         self.cell = cell
 
-    def _get_index(self, keys: AnyKeys | None) -> pd.Index:
+    def _get_index(self, keys: AnyKeys | None, axis: pd.Index | None) -> pd.Index:
+        with span("range"):
+            return self._resolve(keys, axis)
+
+    def _resolve(self, keys: AnyKeys | None, axis: pd.Index | None) -> pd.Index:
         if keys is None:
             return pd.Index([])
+        if isinstance(keys, slice):
+            if axis is not None:
+                return axis[keys]
+            if keys.stop is None or (keys.start or 0) < 0 or keys.stop < 0:
+                raise ValueError(
+                    f"Slice {keys} is relative to the end of the table, "
+                    "which needs the labels to resolve."
+                )
+            # Without the labels, the positions are the labels of a default index.
+            return pd.RangeIndex(keys.start or 0, keys.stop, keys.step or 1)
+        if _is_key_range(keys):
+            if axis is None:
+                raise ValueError(
+                    f"Label range {keys} needs the labels of the table to resolve."
+                )
+            return axis[_key_range_positions(keys, axis)]
         if isinstance(keys, (list, tuple)):
             return pd.Index(keys)
-        if isinstance(keys, slice):
-            return pd.Index(range(keys.start, keys.stop, keys.step))
         if isinstance(keys, pd.Index):
             return keys
         return pd.Index([keys])
 
+    def _get_positions(self, keys: AnyKeys | None, axis: pd.Index) -> slice | None:
+        if isinstance(keys, slice):
+            return slice(*keys.indices(len(axis)))
+        if _is_key_range(keys):
+            return _key_range_positions(keys, axis)
+        return None
+
     def is_column_range(self) -> bool:
         return self.column is not None
 
-    def get_columns(self) -> pd.Index:
-        return self._get_index(self.column)
+    def get_columns(self, columns: pd.Index | None = None) -> pd.Index:
+        """
+        Get the labels of the selected columns.
+        Slices and label ranges are resolved against `columns`, if given.
+        """
+        return self._get_index(self.column, columns)
+
+    def get_column_positions(self, columns: pd.Index) -> slice | None:
+        """
+        Get the positions of the selected columns as a slice,
+        or None if they are not a slice or a label range.
+        """
+        return self._get_positions(self.column, columns)
 
     def is_index_range(self) -> bool:
         return self.row is not None
 
-    def get_index(self) -> pd.Index:
-        return self._get_index(self.row)
+    def get_index(self, index: pd.Index | None = None) -> pd.Index:
+        """
+        Get the labels of the selected rows.
+        Slices and label ranges are resolved against `index`, if given.
+        """
+        return self._get_index(self.row, index)
+
+    def get_index_positions(self, index: pd.Index) -> slice | None:
+        """
+        Get the positions of the selected rows as a slice,
+        or None if they are not a slice or a label range.
+        """
+        return self._get_positions(self.row, index)
 
     def is_location_range(self) -> bool:
         return self.cell is not None
 
-    def get_location(self) -> tuple[pd.Index, pd.Index]:
+    def get_location(
+        self, index: pd.Index | None = None, columns: pd.Index | None = None
+    ) -> tuple[pd.Index, pd.Index]:
         if self.cell is None:
             return pd.Index([]), pd.Index([])
-        return self._get_index(self.cell[0]), self._get_index(self.cell[1])
+        return self._get_index(self.cell[0], index), self._get_index(
+            self.cell[1], columns
+        )
+
+    def get_location_positions(
+        self, index: pd.Index, columns: pd.Index
+    ) -> tuple[slice, slice] | None:
+        """
+        Get the positions of the selected cells as slices,
+        or None if either of their keys is not a slice or a label range.
+        """
+        if self.cell is None:
+            return None
+        rows = self._get_positions(self.cell[0], index)
+        columns_positions = self._get_positions(self.cell[1], columns)
+        if rows is None or columns_positions is None:
+            return None
+        return rows, columns_positions
+
+
+def _is_key_range(keys: Any) -> bool:
+    return isinstance(keys, KeyRange)
+
+
+def _key_range_positions(keys: KeyRange, axis: pd.Index) -> slice:
+    """
+    Find the positions from the start label to the stop label, like `.loc`.
+    On sorted labels the bounds are found by binary search and need not be in
+    the axis, otherwise they must be unique labels of the axis.
+
+    Raises
+    ------
+    KeyError
+        If the labels are not sorted and a bound is not a unique label of the axis.
+    ValueError
+        If a bound cannot be compared with the labels.
+    """
+    if len(axis) and (axis.is_monotonic_increasing or axis.is_monotonic_decreasing):
+        # Checked first, as pandas may try to read a string bound as a dtype.
+        for bound in (keys.start, keys.stop):
+            if bound is not None and not _is_comparable(axis[0], bound):
+                raise ValueError(
+                    f"Label range {keys} cannot be compared with labels of "
+                    f"{axis.dtype}."
+                )
+    try:
+        positions = axis.slice_indexer(keys.start, keys.stop)
+    except TypeError as e:
+        raise ValueError(
+            f"Label range {keys} cannot be compared with labels of {axis.dtype}."
+        ) from e
+    return slice(*positions.indices(len(axis)))
+
+
+def _is_comparable(label: Any, bound: Any) -> bool:
+    """Check whether a label of an axis can be ordered against a bound."""
+    try:
+        result = label <= bound
+    except TypeError:
+        return False
+    return result is not NotImplemented
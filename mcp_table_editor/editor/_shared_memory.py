@@ -0,0 +1,282 @@
+import atexit
+import multiprocessing
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Hashable, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Number of sampled values of the first key used to choose the bucket bounds.
+_SAMPLE_SIZE = 10_000
+
+_pools: dict[int, ProcessPoolExecutor] = {}
+
+
+@dataclass(frozen=True)
+class SharedColumn:
+    """
+    A column stored in a shared memory block, which other processes can attach to.
+    """
+
+    name: str
+    dtype: str
+    length: int
+
+    def attach(self) -> tuple[SharedMemory, np.ndarray]:
+        """
+        Attach to the block and view it as an array without copying.
+        """
+        # The workers share the resource tracker of the process which created the
+        # block, so attaching does not make them own it.
+        shm = SharedMemory(name=self.name)
+        return shm, np.ndarray(self.length, dtype=self.dtype, buffer=shm.buf)
+
+
+class SharedTable:
+    """
+    Numeric columns of a version of a table copied into shared memory blocks.
+    A column is copied once, on its first use, and shared by the later sorts until
+    the table is closed, which happens when it is garbage collected at the latest.
+    """
+
+    def __init__(self) -> None:
+        self._blocks: dict[Hashable, SharedMemory] = {}
+        self.columns: dict[Hashable, SharedColumn] = {}
+        self._finalizer = weakref.finalize(self, _release, self._blocks)
+
+    def __enter__(self) -> "SharedTable":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def share(self, key: Hashable, values: Callable[[], np.ndarray]) -> SharedColumn:
+        """
+        Get a column by its key, copying the values into a new block if it is missing.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of the column, e.g. its name.
+        values : Callable[[], np.ndarray]
+            Function computing the values of the column, called only if it is missing.
+        """
+        if key not in self.columns:
+            array = values()
+            shm = _create_block(array)
+            self._blocks[key] = shm
+            self.columns[key] = SharedColumn(shm.name, array.dtype.str, len(array))
+        return self.columns[key]
+
+    def allocate(self, key: Hashable, dtype: np.dtype, length: int) -> SharedColumn:
+        """
+        Add an uninitialized column, replacing the column of the same key if any.
+        """
+        if key in self._blocks:
+            shm = self._blocks.pop(key)
+            shm.close()
+            shm.unlink()
+        shm = SharedMemory(create=True, size=max(dtype.itemsize * length, 1))
+        self._blocks[key] = shm
+        self.columns[key] = SharedColumn(shm.name, dtype.str, length)
+        return self.columns[key]
+
+    def array(self, key: Hashable) -> np.ndarray:
+        """
+        View a shared column as an array without copying.
+        """
+        column = self.columns[key]
+        return np.ndarray(
+            column.length, dtype=column.dtype, buffer=self._blocks[key].buf
+        )
+
+    def close(self) -> None:
+        self.columns.clear()
+        self._finalizer()
+
+
+def _create_block(array: np.ndarray) -> SharedMemory:
+    shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+    return shm
+
+
+def _release(blocks: dict[Hashable, SharedMemory]) -> None:
+    for shm in blocks.values():
+        shm.close()
+        shm.unlink()
+    blocks.clear()
+
+
+def is_shareable(series: pd.Series) -> bool:
+    """
+    Whether a column can be sorted in shared memory.
+    """
+    return isinstance(series.dtype, np.dtype) and series.dtype.kind in "biuf"
+
+
+def get_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Get the process pool with the given number of workers, starting it on first use.
+    """
+    if workers not in _pools:
+        _pools[workers] = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pools[workers]
+
+
+@atexit.register
+def _shutdown_pools() -> None:
+    for pool in _pools.values():
+        pool.shutdown(wait=False, cancel_futures=True)
+    _pools.clear()
+
+
+def parallel_argsort(
+    table: SharedTable,
+    keys: Sequence[Hashable],
+    ascending: bool | Sequence[bool] = True,
+    workers: int = 2,
+    out: SharedTable | None = None,
+) -> np.ndarray:
+    """
+    Get the stable sorting permutation of the rows by the given keys in a process pool.
+
+    The rows are split into buckets by ranges of the first key, and their positions
+    are grouped by bucket in a shared block. Each worker attaches to the keys and
+    the positions of one bucket in shared memory, sorts those rows and returns their
+    positions. Concatenating the buckets in order gives the permutation, which
+    matches ``sort_values(kind="stable", na_position="last")``.
+    The workers also write the keys in sorted order to `out`, if it is given, so
+    that the next sort of the sorted table does not copy them again.
+
+    Parameters
+    ----------
+    table : SharedTable
+        The shared columns of the table.
+    keys : Sequence[Hashable]
+        Keys of the numeric columns to sort by, the first one is the primary key.
+    ascending : bool | Sequence[bool]
+        Sort order of each key.
+    workers : int
+        Number of worker processes.
+    out : SharedTable | None
+        The shared table receiving the sorted keys, under the same keys.
+
+    Returns
+    -------
+    np.ndarray
+        The positions of the rows in sorted order.
+    """
+    if isinstance(ascending, bool):
+        ascending = [ascending] * len(keys)
+    ascending = list(ascending)
+    columns = [table.columns[key] for key in keys]
+    sorted_columns = None
+    if out is not None:
+        sorted_columns = [
+            out.allocate(key, np.dtype(column.dtype), column.length)
+            for key, column in zip(keys, columns)
+        ]
+    buckets = _bucket_codes(table.array(keys[0]), ascending[0], workers)
+    # A stable sort of the small bucket codes is a radix sort, in linear time.
+    positions = np.argsort(buckets, kind="stable")
+    bounds = np.cumsum(np.bincount(buckets))
+    del buckets
+
+    pool = get_pool(workers)
+    shm = _create_block(positions)
+    try:
+        shared = SharedColumn(shm.name, positions.dtype.str, len(positions))
+        futures = [
+            pool.submit(
+                _sort_bucket, columns, ascending, shared, start, stop, sorted_columns
+            )
+            for start, stop in zip([0, *bounds[:-1].tolist()], bounds.tolist())
+            if start < stop
+        ]
+        parts = [future.result() for future in futures]
+    finally:
+        shm.close()
+        shm.unlink()
+    return np.concatenate(parts) if parts else np.arange(0)
+
+
+def _bucket_codes(first: np.ndarray, ascending: bool, workers: int) -> np.ndarray:
+    """
+    Get the bucket of each row, numbered in the sort order of the first key.
+    The rows whose first key is missing are in the last bucket.
+    """
+    missing = np.isnan(first) if first.dtype.kind == "f" else None
+    valid = first if missing is None else first[~missing]
+    bounds = _bucket_bounds(valid, workers)
+    codes = np.searchsorted(bounds, first, side="right").astype(np.uint16)
+    if not ascending:
+        codes = len(bounds) - codes
+    if missing is not None:
+        codes[missing] = len(bounds) + 1
+    return codes
+
+
+def _bucket_bounds(values: np.ndarray, buckets: int) -> np.ndarray:
+    """
+    Choose the inner bounds of the buckets from a sample of the values.
+    The bucket i holds the values in [bounds[i - 1], bounds[i]).
+    """
+    if len(values) == 0 or buckets <= 1:
+        return values[:0]
+    step = max(len(values) // _SAMPLE_SIZE, 1)
+    sample = np.sort(values[::step])
+    quantiles = sample[np.linspace(0, len(sample) - 1, buckets + 1).astype(int)[1:-1]]
+    return np.unique(quantiles)
+
+
+def _sort_bucket(
+    columns: list[SharedColumn],
+    ascending: list[bool],
+    positions: SharedColumn,
+    start: int,
+    stop: int,
+    out: list[SharedColumn] | None = None,
+) -> np.ndarray:
+    """
+    Sort the rows of a bucket, whose positions are positions[start:stop], in a worker,
+    and write their keys in sorted order to out[start:stop] if it is given.
+    """
+    attached = [column.attach() for column in [positions, *columns, *(out or [])]]
+    blocks, arrays = zip(*attached)
+    keys = arrays[1 : len(columns) + 1]
+    try:
+        rows = arrays[0][start:stop]
+        # np.lexsort sorts by the last key first, and is stable.
+        sort_keys = [
+            _ordered(key[rows], order)
+            for key, order in zip(reversed(keys), reversed(ascending))
+        ]
+        rows = rows[np.lexsort(sort_keys)]
+        for key, sorted_key in zip(keys, arrays[len(columns) + 1 :]):
+            sorted_key[start:stop] = key[rows]
+        return rows
+    finally:
+        for shm in blocks:
+            shm.close()
+
+
+def _ordered(values: np.ndarray, ascending: bool) -> np.ndarray:
+    """
+    Transform the values so that sorting them ascending gives the requested order,
+    keeping missing values last.
+    """
+    if ascending:
+        return values
+    if values.dtype.kind == "f":
+        return -values
+    if values.dtype.kind == "b":
+        return ~values
+    if values.dtype.kind == "u":
+        return np.iinfo(values.dtype).max - values
+    return ~values  # -x - 1 for signed integers, without overflow
@@ -0,0 +1,139 @@
+from bisect import bisect_right
+from typing import Any, Sequence
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor._merge_sort import _pack
+from mcp_table_editor.editor._top_k import key_code
+
+# Number of moved rows up to which they are placed one by one by binary search
+# over the rows, instead of encoding the keys of the whole table.
+_BISECT_ROWS = 64
+# Number of labels up to which they are found by comparing them with the index,
+# instead of hashing the index.
+_SCAN_LABELS = 16
+
+
+def restore_order(
+    before: pd.DataFrame,
+    table: pd.DataFrame,
+    rows: pd.Index,
+    by: Sequence[str],
+    ascending: bool,
+) -> pd.DataFrame:
+    """
+    Sort an edited table again, moving only the rows of the edit.
+
+    The rows which are neither new nor have their key changed by the edit are
+    still sorted, so that the other rows are sorted and placed among them by
+    binary search, after the rows with equal keys.
+
+    Parameters
+    ----------
+    before : pd.DataFrame
+        The table before the edit, sorted by the key.
+    table : pd.DataFrame
+        The edited table.
+    rows : pd.Index
+        The labels of the rows which may have been changed by the edit.
+    by : Sequence[str]
+        The columns of the sort key.
+    ascending : bool
+        Whether the table is sorted in ascending order.
+
+    Returns
+    -------
+    pd.DataFrame
+        The edited table in sorted order, or the table itself if no row moved.
+    """
+    moved = [_changed_keys(before, table, rows, by)]
+    if len(table) > len(before):
+        if table.index[: len(before)].equals(before.index):
+            # Rows appended at the end.
+            moved.append(np.arange(len(before), len(table)))
+        else:
+            moved.append(np.flatnonzero(~table.index.isin(before.index)))
+    placed = np.unique(np.concatenate(moved))
+    if len(placed) == 0:
+        return table
+    kept = np.delete(np.arange(len(table)), placed)
+    if len(placed) <= _BISECT_ROWS:
+        try:
+            return table.take(_bisect(table, kept, placed, by, ascending))
+        except TypeError:
+            # Values of different types, which only the encoded keys order.
+            pass
+    codes = _pack([key_code(table[column], ascending) for column in by])
+    placed = placed[np.argsort(codes[placed], kind="stable")]
+    at = np.searchsorted(codes[kept], codes[placed], side="right")
+    return table.take(np.insert(kept, at, placed))
+
+
+def _bisect(
+    table: pd.DataFrame,
+    kept: np.ndarray,
+    placed: np.ndarray,
+    by: Sequence[str],
+    ascending: bool,
+) -> np.ndarray:
+    """
+    Place the rows one by one by binary search over the sorted rows, reading the
+    keys of only the rows compared with them.
+    """
+    keys = [table[column].to_numpy() for column in by]
+
+    def row_key(position: int) -> tuple:
+        return tuple(_order_key(key[position], ascending) for key in keys)
+
+    placed = np.array(sorted(placed, key=row_key), dtype=np.intp)
+    at = [bisect_right(kept, row_key(position), key=row_key) for position in placed]
+    return np.insert(kept, at, placed)
+
+
+def _changed_keys(
+    before: pd.DataFrame, table: pd.DataFrame, rows: pd.Index, by: Sequence[str]
+) -> np.ndarray:
+    """Get the positions of the rows of the edit whose key was changed."""
+    if len(rows) == 0:
+        return np.arange(0)
+    old = _label_positions(before.index, rows)
+    new = _label_positions(table.index, before.index[old])
+    if len(new) != len(old):
+        # Duplicated labels, whose rows cannot be matched.
+        return _label_positions(table.index, rows)
+    old_keys = before.iloc[old][by].reset_index(drop=True)
+    new_keys = table.iloc[new][by].reset_index(drop=True)
+    same = (old_keys.eq(new_keys) | (old_keys.isna() & new_keys.isna())).all(axis=1)
+    return new[~same.to_numpy()]
+
+
+def _label_positions(index: pd.Index, labels: pd.Index) -> np.ndarray:
+    """Get the positions of the labels in the index, in the order of the index."""
+    if len(labels) > _SCAN_LABELS:
+        return np.flatnonzero(index.isin(labels))
+    values = index.to_numpy()
+    found = [np.flatnonzero(values == label) for label in labels]
+    return np.unique(np.concatenate(found)) if found else np.arange(0)
+
+
+class _Descending:
+    """A value which compares in reverse order."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.value == other.value
+
+
+def _order_key(value: Any, ascending: bool) -> tuple:
+    """Key of a value comparing in the sort order, with the missing values last."""
+    if pd.isna(value):
+        return (True, 0)
+    return (False, value if ascending else _Descending(value))
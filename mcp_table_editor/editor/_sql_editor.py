@@ -2,6 +2,8 @@ import pandas as pd
 import sqlalchemy as sa
 
 from mcp_table_editor.editor._base import BaseEditor
+from mcp_table_editor.editor._range import Range
+from mcp_table_editor.editor._sql_selector import SqlSelector
 
 
 class SqlEditor(BaseEditor):
@@ -51,4 +53,18 @@ class SqlEditor(BaseEditor):
             "Expression query is not implemented yet. Please use query_sql instead."
         )
 
-    def select(self, range: str) -> SqlSelector:
+    def select(self, range: Range) -> SqlSelector:
+        """
+        Select a range in the table.
+
+        Parameters
+        ----------
+        range : Range
+            The range to select in the table.
+
+        Returns
+        -------
+        SqlSelector
+            A SqlSelector object that represents the selected range.
+        """
+        return SqlSelector(self.engine, range)
@@ -0,0 +1,77 @@
+from typing import Any, Sequence
+
+import numpy as np
+import pandas as pd
+
+from mcp_table_editor.editor._merge_sort import _sort_code, is_sortable
+
+
+def key_code(
+    column: pd.Series, ascending: bool = True, values: Sequence[Any] | None = None
+) -> np.ndarray:
+    """
+    Encode a sort key as unsigned integers which sort ascending in the requested
+    order, with the missing values last.
+
+    Parameters
+    ----------
+    column : pd.Series
+        The column to sort by.
+    ascending : bool
+        Whether to sort in ascending order.
+    values : Sequence[Any] | None
+        If given, the values are ordered by their position in this list, and the
+        values not in the list after all the listed ones, like `sort_by_values`.
+    """
+    if values is not None:
+        order = pd.Index(values).drop_duplicates().get_indexer(column)
+        order[order == -1] = len(values)
+        return _sort_code(order, ascending)
+    if is_sortable(column):
+        return _sort_code(column.to_numpy(), ascending)
+    # Other columns are ranked by their sorted unique values, missing ones as NaN.
+    codes, _ = pd.factorize(column, sort=True, use_na_sentinel=True)
+    ranks = codes.astype(np.float64)
+    ranks[codes == -1] = np.nan
+    return _sort_code(ranks, ascending)
+
+
+def top_k_positions(codes: Sequence[np.ndarray], k: int) -> np.ndarray:
+    """
+    Get the positions of the first `k` rows in the order of the encoded keys,
+    without sorting all the rows.
+
+    The rows whose first key is at most the k-th smallest one are selected by
+    partitioning, which keeps every row of the top `k`. Only these candidates are
+    sorted, stably, so that ties keep the order of the rows like a stable sort.
+
+    Parameters
+    ----------
+    codes : Sequence[np.ndarray]
+        The keys encoded by `key_code`, the first one is the primary key.
+    k : int
+        The number of rows.
+
+    Returns
+    -------
+    np.ndarray
+        The positions of the rows in sorted order.
+    """
+    if k < 0:
+        raise ValueError(f"k must not be negative, got {k}.")
+    rows = len(codes[0]) if codes else 0
+    k = min(k, rows)
+    if k == 0:
+        return np.arange(0)
+    first = codes[0]
+    if k < rows:
+        threshold = np.partition(first, k - 1)[k - 1]
+        candidates = np.flatnonzero(first <= threshold)
+    else:
+        candidates = np.arange(rows)
+    if len(codes) == 1:
+        order = np.argsort(first[candidates], kind="stable")
+    else:
+        # np.lexsort sorts by the last key first, and is stable.
+        order = np.lexsort([code[candidates] for code in reversed(codes)])
+    return candidates[order[:k]]
@@ -0,0 +1,354 @@
+import threading
+from collections import deque
+from dataclasses import dataclass
+from logging import getLogger
+from typing import Any, Sequence
+
+import pandas as pd
+import sqlalchemy as sa
+
+from mcp_table_editor.editor._config import EditorConfig
+from mcp_table_editor.editor._in_memory_editor import InMemoryEditor
+from mcp_table_editor.editor._selector import InsertRule
+from mcp_table_editor.editor._sql_editor import SqlEditor
+from mcp_table_editor.misc import changed_index
+
+_logger = getLogger(__name__)
+
+ID_COLUMN = "_id"
+
+
+@dataclass
+class _Change:
+    """
+    A change of the table waiting to be written to the store.
+    Either `table` is set for a full snapshot, or the row-level fields are set.
+    """
+
+    version: int
+    table: pd.DataFrame | None = None
+    updates: pd.DataFrame | None = None
+    inserts: pd.DataFrame | None = None
+    deletes: pd.Index | None = None
+
+    @property
+    def rows(self) -> int:
+        if self.table is not None:
+            return len(self.table)
+        return sum(
+            len(part)
+            for part in (self.updates, self.inserts, self.deletes)
+            if part is not None
+        )
+
+
+class WriteBehindEditor(InMemoryEditor):
+    """
+    InMemoryEditor which persists the table to a SQL store in the background.
+
+    Reads and edits are served from memory. Committed edits are queued as dirty
+    rows and written by a background thread every `config.flush_interval` seconds,
+    or as soon as `config.flush_rows` rows are pending, so that the database writes
+    are not part of the edit latency.
+    Queued changes are written in version order, each batch in a single
+    transaction together with the version it reaches, so that the store always
+    holds the table as of some committed version. A failed write is retried
+    after `config.flush_interval` seconds, doubled after each failure up to
+    `config.flush_max_backoff`, and its error is raised by `flush`.
+    The store must be a SQLite database, whose rowid keeps the order of the rows.
+    """
+
+    def __init__(
+        self,
+        table: pd.DataFrame | None = None,
+        config: EditorConfig | None = None,
+        url: str = "sqlite:///mcp_table_editor.db",
+        table_name: str = "data",
+    ) -> None:
+        backend = sa.make_url(url).get_backend_name()
+        if backend != "sqlite":
+            raise ValueError(
+                f"The write-behind store must be a SQLite database, got {backend!r}."
+            )
+        super().__init__(table, config)
+        self.store = SqlEditor(url)
+        self.table_name = table_name
+
+        self._condition = threading.Condition()
+        self._pending: deque[_Change] = deque()
+        self._pending_rows = 0
+        self._flush_requested = False
+        self._closed = False
+        # The error of the last write, if it failed, and the number of failures
+        # in a row, which sets the time before the next retry.
+        self._error: Exception | None = None
+        self._failures = 0
+
+        stored = self._load() if table is None else None
+        if stored is not None:
+            self.table, self.version = stored
+            self._flushed_version = self.version
+        else:
+            self._flushed_version = -1
+            self._enqueue(_Change(self.version, table=self.table.copy()))
+
+        self._thread = threading.Thread(
+            target=self._run, name=f"write-behind-{self.id}", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def flushed_version(self) -> int:
+        """The latest version of the table written to the store."""
+        return self._flushed_version
+
+    def commit(self, table: pd.DataFrame, rows: pd.Index | None = None) -> None:
+        self._check_open()
+        before = self.table
+        super().commit(table, rows)
+        # The committed table may be compacted, see `InMemoryEditor.commit`.
+        self._enqueue(self._diff(before, self.table, rows))
+
+    def append(
+        self,
+        index: Sequence[Any] | pd.Index,
+        value: Any = pd.NA,
+        insert_rule: InsertRule = InsertRule.ABOVE,
+    ) -> list[list[Any]]:
+        self._check_open()
+        if self._commits_appends():
+            # The rows are committed, which queues them.
+            return super().append(index, value, insert_rule)
+        index = list(index)
+        rows = super().append(index, value, insert_rule)
+        inserts = pd.DataFrame(rows, index=index, columns=self.columns)
+        self._enqueue(_Change(self.version, inserts=inserts))
+        return rows
+
+    def sort(
+        self,
+        by: str | Sequence[str] | None = None,
+        ascending: bool = True,
+        keep_sorted: bool = False,
+    ) -> None:
+        self._check_open()
+        super().sort(by=by, ascending=ascending, keep_sorted=keep_sorted)
+        self._enqueue(_Change(self.version, table=self.table.copy()))
+
+    def sort_by_values(
+        self, columns: str | list[str], values: Sequence[str] | Sequence[Sequence[str]]
+    ) -> None:
+        self._check_open()
+        super().sort_by_values(columns, values)
+        self._enqueue(_Change(self.version, table=self.table.copy()))
+
+    def flush(self, timeout: float | None = None) -> int:
+        """
+        Write all pending changes to the store and wait until they are written.
+
+        Parameters
+        ----------
+        timeout : float | None
+            Maximum time to wait in seconds. If None, wait until the changes are written.
+
+        Returns
+        -------
+        int
+            The latest version of the table written to the store.
+
+        Raises
+        ------
+        Exception
+            The error of the last write, if it failed and the changes are not
+            written yet. The writer keeps retrying them in the background.
+        """
+        with self._condition:
+            version = self.version
+            self._flush_requested = True
+            self._condition.notify_all()
+            self._condition.wait_for(
+                lambda: self._flushed_version >= version
+                or self._error is not None
+                or not self._thread.is_alive(),
+                timeout=timeout,
+            )
+            if self._flushed_version < version and self._error is not None:
+                raise self._error
+            return self._flushed_version
+
+    def close(self) -> None:
+        """Write all pending changes and stop the background writer."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        super().close()
+
+    def _check_open(self) -> None:
+        """Raise before an edit of a closed editor, which could not be written."""
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The editor is already closed.")
+
+    def _enqueue(self, change: _Change) -> None:
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The editor is already closed.")
+            if change.table is not None:
+                # A snapshot supersedes all the changes before it.
+                self._pending.clear()
+                self._pending_rows = 0
+            self._pending.append(change)
+            self._pending_rows += change.rows
+            if self._pending_rows >= self.config.flush_rows:
+                self._condition.notify_all()
+
+    def _diff(
+        self, before: pd.DataFrame, after: pd.DataFrame, rows: pd.Index | None
+    ) -> _Change:
+        """Get the row-level change between two versions of the table."""
+        if not before.columns.equals(after.columns):
+            return _Change(self.version, table=after.copy())
+        deletes = before.index.difference(after.index, sort=False)
+        inserts = after.index.difference(before.index, sort=False)
+        kept = after.index[: len(after) - len(inserts)]
+        if not (
+            after.index[len(kept) :].equals(inserts)
+            and kept.equals(before.index.drop(deletes))
+        ):
+            # Rows are reordered, which is not expressible as row-level changes.
+            return _Change(self.version, table=after.copy())
+        updates = changed_index(before, after, rows)
+        return _Change(
+            self.version,
+            updates=after.loc[updates],
+            inserts=after.loc[inserts],
+            deletes=deletes,
+        )
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if self._failures:
+                    # Retry a failed write only after the backoff, even if
+                    # enough rows are pending or a flush is requested.
+                    self._condition.wait_for(
+                        lambda: self._closed, timeout=self._backoff()
+                    )
+                else:
+                    self._condition.wait_for(
+                        lambda: self._closed
+                        or self._flush_requested
+                        or self._pending_rows >= self.config.flush_rows,
+                        timeout=self.config.flush_interval,
+                    )
+                changes = list(self._pending)
+                self._pending.clear()
+                self._pending_rows = 0
+                self._flush_requested = False
+                closed = self._closed
+            if changes:
+                try:
+                    self._write(changes)
+                except Exception as e:
+                    _logger.exception("Failed to write changes to the store.")
+                    with self._condition:
+                        # Put the changes back in front to retry in the same order.
+                        self._pending.extendleft(reversed(changes))
+                        self._pending_rows += sum(change.rows for change in changes)
+                        self._error = e
+                        self._failures += 1
+                        self._condition.notify_all()
+                    if closed:
+                        return
+                    continue
+                with self._condition:
+                    self._flushed_version = changes[-1].version
+                    self._error = None
+                    self._failures = 0
+                    self._condition.notify_all()
+            if closed:
+                return
+
+    def _backoff(self) -> float:
+        """Time in seconds to wait before retrying a failed write."""
+        delay = self.config.flush_interval * 2 ** min(self._failures - 1, 30)
+        return min(delay, self.config.flush_max_backoff)
+
+    def _write(self, changes: list[_Change]) -> None:
+        table = _quote(self.table_name)
+        with self.store.engine.begin() as conn:
+            for change in changes:
+                if change.table is not None:
+                    change.table.to_sql(
+                        self.table_name,
+                        conn,
+                        if_exists="replace",
+                        index=True,
+                        index_label=ID_COLUMN,
+                    )
+                    continue
+                if change.deletes is not None and len(change.deletes) > 0:
+                    conn.execute(
+                        sa.text(f"DELETE FROM {table} WHERE {ID_COLUMN} = :id"),
+                        [{"id": key} for key in change.deletes.tolist()],
+                    )
+                if change.updates is not None and len(change.updates) > 0:
+                    assignments = ", ".join(
+                        f"{_quote(column)} = :c{i}"
+                        for i, column in enumerate(change.updates.columns)
+                    )
+                    conn.execute(
+                        sa.text(
+                            f"UPDATE {table} SET {assignments} WHERE {ID_COLUMN} = :id"
+                        ),
+                        _parameters(change.updates),
+                    )
+                if change.inserts is not None and len(change.inserts) > 0:
+                    change.inserts.to_sql(
+                        self.table_name,
+                        conn,
+                        if_exists="append",
+                        index=True,
+                        index_label=ID_COLUMN,
+                    )
+            meta = _quote(f"{self.table_name}__meta")
+            conn.execute(
+                sa.text(f"CREATE TABLE IF NOT EXISTS {meta} (version INTEGER)")
+            )
+            conn.execute(sa.text(f"DELETE FROM {meta}"))
+            conn.execute(
+                sa.text(f"INSERT INTO {meta} (version) VALUES (:version)"),
+                {"version": changes[-1].version},
+            )
+
+    def _load(self) -> tuple[pd.DataFrame, int] | None:
+        """Load the table and its version from the store, if it exists."""
+        inspector = sa.inspect(self.store.engine)
+        meta = f"{self.table_name}__meta"
+        if not (inspector.has_table(self.table_name) and inspector.has_table(meta)):
+            return None
+        with self.store.engine.connect() as conn:
+            table = pd.read_sql_query(
+                f"SELECT * FROM {_quote(self.table_name)} ORDER BY rowid",
+                conn,
+                index_col=ID_COLUMN,
+            )
+            version = conn.execute(
+                sa.text(f"SELECT version FROM {_quote(meta)}")
+            ).scalar_one()
+        table.index.name = None
+        return table, version
+
+
+def _quote(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _parameters(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """Get the rows of a dataframe as the parameters of the UPDATE statement."""
+    values = df.astype(object).where(df.notna(), None)
+    return [
+        {"id": key, **{f"c{i}": value for i, value in enumerate(row)}}
+        for key, row in zip(df.index.tolist(), values.itertuples(index=False))
+    ]
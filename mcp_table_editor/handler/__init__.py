@@ -1,12 +1,18 @@
+from mcp_table_editor.handler._aggregate_handler import AggregateHandler
 from mcp_table_editor.handler._base_handler import BaseHandler
+from mcp_table_editor.handler._batch_handler import BatchHandler
 from mcp_table_editor.handler._crud_handler import CrudHandler
 from mcp_table_editor.handler._delete_content_handler import DeleteContentHandler
 from mcp_table_editor.handler._drop_content_handler import DropContentHandler
+from mcp_table_editor.handler._flush_handler import FlushHandler
 from mcp_table_editor.handler._get_content_handler import GetContentHandler
+from mcp_table_editor.handler._query_handler import QueryHandler
 from mcp_table_editor.handler._insert_cell_handler import InsertContentHandler
 from mcp_table_editor.handler._remove_content_handler import RemoveContentHandler
 from mcp_table_editor.handler._sort_by_value_handler import SortByValueHandler
 from mcp_table_editor.handler._sort_handler import SortHandler
+from mcp_table_editor.handler._top_k_handler import TopKHandler
+from mcp_table_editor.handler._trace_handler import TraceHandler
 from mcp_table_editor.handler._update_content_handler import UpdateContentHandler
 
 TOOL_HANDLERS: list[type[BaseHandler]] = [
@@ -19,6 +25,12 @@ TOOL_HANDLERS: list[type[BaseHandler]] = [
     DropContentHandler,
     SortHandler,
     SortByValueHandler,
+    TopKHandler,
+    AggregateHandler,
+    QueryHandler,
+    FlushHandler,
+    BatchHandler,
+    TraceHandler,
 ]
 
 TOOL_HANDLERS_DICT: dict[str, type[BaseHandler]] = {
@@ -36,5 +48,11 @@ __all__ = [
     "DropContentHandler",
     "SortHandler",
     "SortByValueHandler",
+    "TopKHandler",
+    "AggregateHandler",
+    "QueryHandler",
+    "FlushHandler",
+    "BatchHandler",
+    "TraceHandler",
     "TOOL_HANDLERS",
 ]
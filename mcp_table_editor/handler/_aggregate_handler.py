@@ -0,0 +1,92 @@
+from pydantic import BaseModel, Field
+
+from mcp_table_editor.editor import InMemoryEditor
+from mcp_table_editor.handler._base_handler import BaseHandler, BaseOutputSchema
+from mcp_table_editor.misc import span
+
+
+class AggregateInputSchema(BaseModel):
+    """
+    Input model for the AggregateHandler.
+    """
+
+    by: list[str] = Field(
+        default_factory=list,
+        description="The column(s) grouping the rows. If empty, aggregate the whole table.",
+    )
+    aggregations: dict[str, list[str]] = Field(
+        default=...,
+        description=(
+            "The aggregations of each column, e.g. {'revenue': ['sum', 'mean']}. "
+            "Supported: sum, mean, count, min, max, nunique."
+        ),
+    )
+    limit: int | None = Field(
+        default=1000,
+        ge=0,
+        description="Maximum number of groups to return. If None, return all of them.",
+    )
+
+
+class AggregateOutputSchema(BaseOutputSchema):
+    """
+    Output model for the AggregateHandler.
+    The content holds a row per group, with the keys and the aggregated values.
+    """
+
+    groups: int = Field(
+        ...,
+        description="Number of groups, including those beyond the limit.",
+    )
+    version: int = Field(
+        ...,
+        description="The version of the table which was aggregated.",
+    )
+
+
+class AggregateHandler(BaseHandler[AggregateInputSchema, AggregateOutputSchema]):
+    """
+    Handler for aggregating columns of a table by groups of rows.
+    """
+
+    name: str = "aggregate"
+    input_schema: type[AggregateInputSchema] = AggregateInputSchema
+    output_schema: type[AggregateOutputSchema] = AggregateOutputSchema
+    description: str = (
+        "Aggregate columns of the table by groups of rows, e.g. the sum of a column "
+        "per value of another one, and return only the aggregated values. "
+        "Prefer it over reading the table to compute totals, counts or averages."
+    )
+
+    def __init__(self, editor: InMemoryEditor) -> None:
+        self.editor = editor
+
+    def is_read_only(self, args: AggregateInputSchema) -> bool:
+        return True
+
+    def handle(self, args: AggregateInputSchema) -> AggregateOutputSchema:
+        """
+        Handle the aggregate operation.
+
+        Parameters
+        ----------
+        args : AggregateInputSchema
+            The arguments for the aggregate operation.
+
+        Returns
+        -------
+        AggregateOutputSchema
+            The aggregated values of each group.
+        """
+        version = self.editor.version
+        with span("pandas_op"):
+            result = self.editor.group_by(args.by, args.aggregations)
+        groups = len(result)
+        if args.limit is not None:
+            result = result.head(args.limit)
+        return AggregateOutputSchema.from_dataframe(
+            result,
+            groups=groups,
+            version=version,
+            memory_usage=self.editor.memory_usage,
+        )
@@ -4,6 +4,7 @@ from typing import Any, Protocol, Self, TypeVar
 from pydantic import BaseModel, Field
 
 from mcp_table_editor.editor._in_memory_editor import InMemoryEditor
+from mcp_table_editor.misc import serializing
 
 InputSchema = TypeVar("InputSchema", bound=BaseModel)
 OutputSchema = TypeVar("OutputSchema", bound=BaseModel)
@@ -19,6 +20,10 @@ class BaseOutputSchema(BaseModel):
         None,
         description="JSON representation of the result. a result contains the selection of the table.",
     )
+    memory_usage: int | None = Field(
+        None,
+        description="Estimated memory used by the table in bytes.",
+    )
 
     @classmethod
     def from_dataframe(
@@ -29,11 +34,12 @@ class BaseOutputSchema(BaseModel):
         """
         Create a BaseOutputSchema from a DataFrame.
         """
-        return cls(
-            content=df.to_csv(index=True),
-            json_content=df.to_dict(orient="records"),
-            **kwargs,
-        )
+        with serializing("from_dataframe"):
+            return cls(
+                content=df.to_csv(index=True),
+                json_content=df.to_dict(orient="records"),
+                **kwargs,
+            )
 
 
 class BaseHandler[
@@ -56,3 +62,17 @@ class BaseHandler[
         Handle the request.
         """
         ...
+
+    def is_read_only(self, args: InputSchema) -> bool:
+        """
+        Whether handling the request leaves the table unchanged.
+        Read-only requests on the same table may be handled concurrently.
+        """
+        return False
+
+    def is_lock_free(self, args: InputSchema) -> bool:
+        """
+        Whether handling the request does not access the table, so that it is
+        handled without holding the lock of the table, e.g. waiting for a store.
+        """
+        return False
@@ -0,0 +1,184 @@
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from mcp_table_editor.editor import InMemoryEditor
+from mcp_table_editor.handler._base_handler import BaseHandler, BaseOutputSchema
+from mcp_table_editor.handler._crud_handler import CrudHandler
+from mcp_table_editor.handler._delete_content_handler import DeleteContentHandler
+from mcp_table_editor.handler._drop_content_handler import DropContentHandler
+from mcp_table_editor.handler._get_content_handler import GetContentHandler
+from mcp_table_editor.handler._insert_cell_handler import InsertContentHandler
+from mcp_table_editor.handler._remove_content_handler import RemoveContentHandler
+from mcp_table_editor.handler._sort_by_value_handler import SortByValueHandler
+from mcp_table_editor.handler._sort_handler import SortHandler
+from mcp_table_editor.handler._update_content_handler import UpdateContentHandler
+
+_BATCH_HANDLERS: dict[str, type[BaseHandler]] = {
+    handler.name: handler
+    for handler in (
+        CrudHandler,
+        GetContentHandler,
+        UpdateContentHandler,
+        InsertContentHandler,
+        DeleteContentHandler,
+        RemoveContentHandler,
+        DropContentHandler,
+        SortHandler,
+        SortByValueHandler,
+    )
+}
+
+
+class BatchOperation(BaseModel):
+    """
+    An operation in a batch.
+    """
+
+    tool: str = Field(
+        ...,
+        description="Name of the tool to run. One of: "
+        + ", ".join(f"`{name}`" for name in _BATCH_HANDLERS),
+    )
+    args: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Arguments of the tool, as they would be passed to the tool itself.",
+    )
+
+
+class BatchInputSchema(BaseModel):
+    """
+    Input model for the BatchHandler.
+    """
+
+    operations: list[BatchOperation] = Field(
+        ...,
+        description="The operations to run, in order. "
+        "Each operation sees the table as left by the previous ones.",
+    )
+    commit: bool = Field(
+        True,
+        description=(
+            "Whether to write the result of the operations back to the table. "
+            "If false, the table is left unchanged and only the result is returned."
+        ),
+    )
+
+
+class BatchOutputSchema(BaseOutputSchema):
+    """
+    Output model for the BatchHandler.
+    The content is limited to the first rows and columns of the resulting table.
+    """
+
+    applied: int = Field(
+        ...,
+        description="Number of operations applied.",
+    )
+    rows: int = Field(
+        ...,
+        description="Number of rows of the resulting table.",
+    )
+    columns: int = Field(
+        ...,
+        description="Number of columns of the resulting table.",
+    )
+    version: int = Field(
+        ...,
+        description="The version of the table after the operations.",
+    )
+
+
+class BatchHandler(BaseHandler[BatchInputSchema, BatchOutputSchema]):
+    """
+    Handler for running multiple operations in a single call.
+    """
+
+    name: str = "batch"
+    input_schema: type[BatchInputSchema] = BatchInputSchema
+    output_schema: type[BatchOutputSchema] = BatchOutputSchema
+    description: str = (
+        "Run a list of table operations in a single call. "
+        "The operations are applied in order and atomically: "
+        "if any of them fails, the table is left unchanged."
+    )
+
+    def __init__(self, editor: InMemoryEditor) -> None:
+        self.editor = editor
+
+    def is_read_only(self, args: BatchInputSchema) -> bool:
+        return not args.commit
+
+    def handle(self, args: BatchInputSchema) -> BatchOutputSchema:
+        """
+        Handle the batch operation.
+
+        Parameters
+        ----------
+        args : BatchInputSchema
+            The arguments for the batch operation.
+
+        Returns
+        -------
+        BatchOutputSchema
+            The head of the resulting table and its shape.
+
+        Raises
+        ------
+        ValueError
+            If an operation is unknown or fails. No operation is applied then.
+        """
+        # Work on a copy so that a failing operation rolls back the whole batch.
+        working = InMemoryEditor(self.editor.table.copy(), self.editor.config)
+        # Edits keep the order of the table, and sorts in the batch replace it.
+        working.sort_key = _copy_sort_key(self.editor.sort_key)
+        for i, operation in enumerate(args.operations):
+            if operation.tool not in _BATCH_HANDLERS:
+                raise ValueError(
+                    f"Operation {i}: tool {operation.tool} is not supported in a batch."
+                )
+            handler = _BATCH_HANDLERS[operation.tool]
+            try:
+                operation_args = handler.input_schema.model_validate(operation.args)
+                if issubclass(handler, CrudHandler):
+                    # Each operation works on the result of the previous ones.
+                    operation_args = operation_args.model_copy(update={"commit": True})
+                handler(working).apply(operation_args)
+            except Exception as e:
+                raise ValueError(
+                    f"Operation {i} ({operation.tool}) failed, "
+                    f"no operation is applied: {e}"
+                ) from e
+
+        table = working.table
+        version = self.editor.version
+        if args.commit and args.operations:
+            # The table is committed in the order of the batch, which is kept
+            # on later edits if the batch left the table sorted.
+            sort_key = self.editor.sort_key
+            self.editor.sort_key = working.sort_key
+            try:
+                self.editor.commit(table)
+            except Exception:
+                self.editor.sort_key = sort_key
+                raise
+            version = self.editor.version
+
+        config = self.editor.config
+        return BatchOutputSchema.from_dataframe(
+            table.iloc[: config.max_rows, : config.max_columns],
+            applied=len(args.operations),
+            rows=table.shape[0],
+            columns=table.shape[1],
+            version=version,
+            memory_usage=self.editor.memory_usage,
+        )
+
+
+def _copy_sort_key(
+    sort_key: tuple[list[str], bool] | None,
+) -> tuple[list[str], bool] | None:
+    if sort_key is None:
+        return None
+    by, ascending = sort_key
+    return list(by), ascending
@@ -1,11 +1,21 @@
 from enum import Enum
 from typing import Any
 
+import numpy as np
+import pandas as pd
 from pydantic import BaseModel, Field
 
-from mcp_table_editor.editor import InMemoryEditor, InsertRule, Range
+from mcp_table_editor.editor import (
+    InMemoryEditor,
+    InsertRule,
+    PartitionedEditor,
+    Range,
+    Selector,
+)
+from mcp_table_editor.editor._in_memory_selector import InMemorySelector
 from mcp_table_editor.editor._range import Range
 from mcp_table_editor.handler._base_handler import BaseHandler, BaseOutputSchema
+from mcp_table_editor.misc import DataFrameDiff, diff_dataframe, span
 
 
 class Operation(str, Enum):
@@ -37,6 +47,19 @@ _MAPPING_OPERATION_DESCRIPTION = {
     Operation.REMOVE: "Drop data from the table.",
 }
 
+
+class ResponseMode(str, Enum):
+    """
+    Enum for the content of the response to a CRUD operation.
+    """
+
+    TABLE = "table"  # Return the table after the operation
+    DIFF = "diff"  # Return only the cells changed by the operation
+
+    def __str__(self) -> str:
+        return self.value
+
+
 _OPERATION_SHAPE_CHANGES = (
     Operation.INSERT,
     Operation.UPDATE,
@@ -90,6 +113,68 @@ class CrudInputSchema(BaseModel):
             "If str, it will be used as a column name."
         ),
     )
+    commit: bool = Field(
+        False,
+        description=(
+            "Whether to write the result of the operation back to the table. "
+            "If false, the table is left unchanged and only the result is returned."
+        ),
+    )
+    response_mode: ResponseMode = Field(
+        ResponseMode.TABLE,
+        description=(
+            "Content of the response to insert, update, delete and drop operations.\n"
+            "- table: the table after the operation.\n"
+            "- diff: only the cells, rows and columns changed by the operation."
+        ),
+    )
+
+
+class CellChange(BaseModel):
+    """
+    A cell changed by an operation.
+    """
+
+    row: Any = Field(..., description="Row index of the cell.")
+    column: Any = Field(..., description="Column name of the cell.")
+    old: Any = Field(None, description="Value before the operation.")
+    new: Any = Field(None, description="Value after the operation.")
+
+
+class TablePatch(BaseModel):
+    """
+    Changes of the table made by an operation.
+    """
+
+    cells: list[CellChange] = Field(
+        default_factory=list,
+        description="Changed cells, including the cells of added rows and columns.",
+    )
+    added_rows: list[Any] = Field(default_factory=list)
+    removed_rows: list[Any] = Field(default_factory=list)
+    added_columns: list[Any] = Field(default_factory=list)
+    removed_columns: list[Any] = Field(default_factory=list)
+
+    @classmethod
+    def from_diff(cls, diff: DataFrameDiff) -> "TablePatch":
+        """
+        Create a TablePatch from the difference between two dataframes.
+        """
+        return cls(
+            cells=[
+                CellChange(
+                    row=_to_native(row),
+                    column=_to_native(column),
+                    old=_to_native(old),
+                    new=_to_native(new),
+                )
+                for row, column, old, new in diff.cells.itertuples(index=False)
+            ],
+            added_rows=[_to_native(row) for row in diff.added_rows],
+            removed_rows=[_to_native(row) for row in diff.removed_rows],
+            added_columns=[_to_native(column) for column in diff.added_columns],
+            removed_columns=[_to_native(column) for column in diff.removed_columns],
+        )
 
 
 class CrudOutputSchema(BaseOutputSchema):
@@ -101,6 +186,79 @@ class CrudOutputSchema(BaseOutputSchema):
         ...,
         description="CRUD method to be performed.",
     )
+    patch: TablePatch | None = Field(
+        None,
+        description="Changes made by the operation, returned in the diff response mode.",
+    )
+    shape: tuple[int, int] | None = Field(
+        None,
+        description="Number of rows and columns of the table after the operation.",
+    )
+    version: int | None = Field(
+        None,
+        description="Version of the table after the operation.",
+    )
+
+
+def _to_native(value: Any) -> Any:
+    """Convert a value of a dataframe to a JSON serializable value."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return None
+    return value
+
+
+def _cell_range(args: CrudInputSchema) -> Range:
+    """
+    Get the range of cells of the operation.
+    """
+    if args.columns and args.rows:
+        return Range(cell=(args.rows, args.columns))
+    if args.columns:
+        return Range(column=args.columns)
+    if args.rows:
+        return Range(row=args.rows)
+    raise ValueError("Either column or row must be provided.")
+
+
+def _changed_rows(args: CrudInputSchema) -> pd.Index | None:
+    """
+    Get the labels of the existing rows whose values may be changed by the operation.
+    None if any row may be changed.
+    """
+    if args.method in (Operation.UPDATE, Operation.DELETE) and args.rows:
+        return pd.Index(args.rows)
+    if args.method in (Operation.DROP, Operation.REMOVE) and not args.columns:
+        return pd.Index([])
+    if args.method == Operation.INSERT:
+        # Inserts fill only the new rows or columns.
+        return pd.Index([])
+    return None
+
+
+def _appends_rows(args: CrudInputSchema) -> bool:
+    """
+    Whether the operation only appends rows filled with a scalar to the table,
+    which the editor buffers instead of copying the table, see `InMemoryEditor.append`.
+    """
+    return (
+        args.method == Operation.INSERT
+        and args.commit
+        and bool(args.rows)
+        and not args.columns
+        and (args.value is None or pd.api.types.is_scalar(args.value))
+    )
+
+
+def _changed_columns(args: CrudInputSchema) -> pd.Index | None:
+    """
+    Get the existing columns whose values may be changed by the operation.
+    None if any column may be changed.
+    """
+    if args.method in (Operation.UPDATE, Operation.DELETE) and args.columns:
+        return pd.Index(args.columns)
+    return None
 
 
 class CrudHandler(BaseHandler[CrudInputSchema, CrudOutputSchema]):
@@ -117,40 +275,125 @@ class CrudHandler(BaseHandler[CrudInputSchema, CrudOutputSchema]):
     def __init__(self, editor: InMemoryEditor, **kwargs):
         self.editor = editor
 
-    def handle(self, args: CrudInputSchema) -> CrudOutputSchema:
+    def is_read_only(self, args: CrudInputSchema) -> bool:
+        return args.method in _OPERATION_GETTER_METHOD or not args.commit
+
+    def apply(self, args: CrudInputSchema) -> Selector:
         """
-        Handle the CRUD operation based on the input data.
+        Perform the CRUD operation based on the input data without building a response.
+
+        Returns
+        -------
+        Selector
+            The selector holding the result of the operation.
         """
-        if args.columns and args.rows:
-            # Create a range object based on the input data
-            cell_range = Range(
-                cell=(args.rows, args.columns),
+        cell_range = _cell_range(args)
+
+        if _appends_rows(args):
+            appended = pd.DataFrame(
+                self._append(args), index=args.rows, columns=self.editor.columns
             )
-        elif args.columns:
-            # Create a range object based on the input data
-            cell_range = Range(column=args.columns)
-        elif args.rows:
-            # Create a range object based on the input data
-            cell_range = Range(row=args.rows)
-        else:
-            raise ValueError("Either column or row must be provided.")
+            return InMemorySelector(appended, cell_range, self.editor.config)
+
+        if self._edits_partitions(args, cell_range):
+            # Only the chunks overlapping the range are copied.
+            with span("pandas_op"):
+                if args.method == Operation.UPDATE:
+                    self.editor.update(cell_range, args.value)
+                else:
+                    self.editor.delete(cell_range)
+            return self.editor.select(cell_range)
 
         # Perform the CRUD operation based on the method
         selector = self.editor.select(cell_range)
-        if args.method in (Operation.GET, Operation.RETRIEVE):
-            selector.get()
-        elif args.method == Operation.INSERT:
-            selector.insert(
-                value=args.value, pos=args.insert_offset, insert_rule=args.insert_rule
+        with span("pandas_op"):
+            if args.method in (Operation.GET, Operation.RETRIEVE):
+                selector.get()
+            elif args.method == Operation.INSERT:
+                selector.insert(
+                    value=args.value,
+                    pos=args.insert_offset,
+                    insert_rule=args.insert_rule,
+                )
+            elif args.method == Operation.UPDATE:
+                selector.update(args.value)
+            elif args.method == Operation.DELETE:
+                selector.delete()
+            elif args.method in (Operation.DROP, Operation.REMOVE):
+                selector.drop()
+            else:
+                raise ValueError(f"Unsupported method: {args.method}")
+
+        if args.commit and args.method not in _OPERATION_GETTER_METHOD:
+            self.editor.commit(selector.df, rows=_changed_rows(args))
+        return selector
+
+    def _edits_partitions(self, args: CrudInputSchema, cell_range: Range) -> bool:
+        """
+        Whether the operation sets existing cells of a partitioned table to a
+        scalar, which is run on its chunks instead of the whole table.
+        """
+        return (
+            isinstance(self.editor, PartitionedEditor)
+            and args.commit
+            and (
+                args.method == Operation.DELETE
+                or (
+                    args.method == Operation.UPDATE
+                    and args.value is not None
+                    and pd.api.types.is_scalar(args.value)
+                )
             )
-        elif args.method == Operation.UPDATE:
-            selector.update(args.value)
-        elif args.method == Operation.DELETE:
-            selector.delete()
-        elif args.method in (Operation.DROP, Operation.REMOVE):
-            selector.drop()
+            and self.editor.partitions.contains(cell_range)
+        )
+
+    def handle(self, args: CrudInputSchema) -> CrudOutputSchema:
+        """
+        Handle the CRUD operation based on the input data.
+        """
+        if _appends_rows(args):
+            return self._handle_append(args)
+        diff_response = (
+            args.response_mode == ResponseMode.DIFF
+            and args.method not in _OPERATION_GETTER_METHOD
+        )
+        cell_range = _cell_range(args)
+        # Edits of the chunks of a partitioned table are compared on the chunks of
+        # the range only, other edits need the whole table, which getters must
+        # not load.
+        in_partitions = self._edits_partitions(args, cell_range)
+        before = None
+        if diff_response:
+            before = (
+                self.editor.partitions.select(cell_range)
+                if in_partitions
+                else self.editor.table
+            )
+        selector = self.apply(args)
+        if args.commit or args.method not in _OPERATION_SHAPE_CHANGES:
+            shape = self.editor.shape
         else:
-            raise ValueError(f"Unsupported method: {args.method}")
+            shape = selector.df.shape
+        if diff_response:
+            after = (
+                self.editor.partitions.select(cell_range)
+                if in_partitions
+                else selector.df
+            )
+            with span("diff"):
+                diff = diff_dataframe(
+                    before,
+                    after,
+                    rows=_changed_rows(args),
+                    columns=_changed_columns(args),
+                )
+            return CrudOutputSchema(
+                method=args.method,
+                patch=TablePatch.from_diff(diff),
+                shape=shape,
+                version=self.editor.version,
+                memory_usage=self.editor.memory_usage,
+            )
 
         if args.return_columns is not None:
             # If return_columns is provided, filter the response to include only those columns
@@ -168,4 +411,56 @@ class CrudHandler(BaseHandler[CrudInputSchema, CrudOutputSchema]):
         return CrudOutputSchema.from_dataframe(
             response,
             method=args.method,
+            shape=shape,
+            version=self.editor.version,
+            memory_usage=self.editor.memory_usage,
+        )
+
+    def _append(self, args: CrudInputSchema) -> list[list[Any]]:
+        """
+        Append the rows of an insert to the table of the editor.
+        """
+        with span("pandas_op"):
+            return self.editor.append(
+                args.rows,
+                pd.NA if args.value is None else args.value,
+                args.insert_rule,
+            )
+
+    def _handle_append(self, args: CrudInputSchema) -> CrudOutputSchema:
+        """
+        Handle an insert appending rows, without reading the whole table
+        unless the response is the table.
+        """
+        rows = self._append(args)
+        if args.response_mode == ResponseMode.DIFF:
+            columns = [_to_native(column) for column in self.editor.columns]
+            patch = TablePatch(
+                cells=[
+                    CellChange(
+                        row=_to_native(label), column=column, new=_to_native(new)
+                    )
+                    for label, values in zip(args.rows, rows)
+                    for column, new in zip(columns, values)
+                ],
+                added_rows=[_to_native(label) for label in args.rows],
+            )
+            return CrudOutputSchema(
+                method=args.method,
+                patch=patch,
+                shape=self.editor.shape,
+                version=self.editor.version,
+                memory_usage=self.editor.memory_usage,
+            )
+
+        selector = self.editor.select(Range(row=args.rows))
+        columns = (
+            self.editor.columns if args.return_columns is None else args.return_columns
+        )
+        return CrudOutputSchema.from_dataframe(
+            selector.display_dataframe(columns, self.editor.index),
+            method=args.method,
+            shape=self.editor.shape,
+            version=self.editor.version,
+            memory_usage=self.editor.memory_usage,
         )
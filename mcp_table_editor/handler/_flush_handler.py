@@ -0,0 +1,74 @@
+from pydantic import BaseModel, Field
+
+from mcp_table_editor.editor import InMemoryEditor
+from mcp_table_editor.handler._base_handler import BaseHandler
+
+
+class FlushInputSchema(BaseModel):
+    """
+    Input model for the FlushHandler.
+    """
+
+    timeout: float | None = Field(
+        default=None,
+        description="Maximum time to wait in seconds. If None, wait until the changes are written.",
+    )
+
+
+class FlushOutputSchema(BaseModel):
+    """
+    Output model for the FlushHandler.
+    """
+
+    version: int = Field(
+        ...,
+        description="The current version of the table.",
+    )
+    flushed_version: int = Field(
+        ...,
+        description="The latest version of the table written to the store.",
+    )
+
+
+class FlushHandler(BaseHandler[FlushInputSchema, FlushOutputSchema]):
+    """
+    Handler for writing pending changes of the table to its store.
+    """
+
+    name: str = "flush"
+    input_schema: type[FlushInputSchema] = FlushInputSchema
+    output_schema: type[FlushOutputSchema] = FlushOutputSchema
+    description: str = (
+        "Write the pending changes of the table to the persistent store "
+        "and wait until they are written."
+    )
+
+    def __init__(self, editor: InMemoryEditor) -> None:
+        self.editor = editor
+
+    def is_read_only(self, args: FlushInputSchema) -> bool:
+        return True
+
+    def is_lock_free(self, args: FlushInputSchema) -> bool:
+        # The writer thread has its own lock, and waiting for it while holding the
+        # lock of the table would block the writers and, behind them, the readers.
+        return True
+
+    def handle(self, args: FlushInputSchema) -> FlushOutputSchema:
+        """
+        Handle the flush operation.
+
+        Parameters
+        ----------
+        args : FlushInputSchema
+            The arguments for the flush operation.
+
+        Returns
+        -------
+        FlushOutputSchema
+            The versions of the table after the flush.
+        """
+        flushed_version = self.editor.flush(timeout=args.timeout)
+        return FlushOutputSchema(
+            version=self.editor.version, flushed_version=flushed_version
+        )
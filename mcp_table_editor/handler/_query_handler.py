@@ -0,0 +1,112 @@
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from mcp_table_editor.editor import InMemoryEditor, Range
+from mcp_table_editor.handler._base_handler import BaseHandler, BaseOutputSchema
+from mcp_table_editor.misc import span
+
+
+class QueryInputSchema(BaseModel):
+    """
+    Input model for the QueryHandler.
+    """
+
+    rows: list[Any] | None = Field(
+        default=None,
+        description="The labels of the rows to read. If None, read all the rows.",
+    )
+    filter: str | None = Field(
+        default=None,
+        description=(
+            "A pandas query expression the rows must match, e.g. "
+            "\"price > 10 and region == 'north'\"."
+        ),
+    )
+    sort_by: list[str] | None = Field(
+        default=None,
+        description="The column(s) to sort the matching rows by.",
+    )
+    ascending: bool | list[bool] = Field(
+        default=True,
+        description="Whether to sort in ascending order, for all or each column.",
+    )
+    columns: list[str] | None = Field(
+        default=None,
+        description="The columns to return. If None, return all the columns.",
+    )
+    limit: int | None = Field(
+        default=1000,
+        ge=0,
+        description="Maximum number of rows to return. If None, return all of them.",
+    )
+    explain: bool = Field(
+        default=False,
+        description="Whether to return the optimized query plan with the result.",
+    )
+
+
+class QueryOutputSchema(BaseOutputSchema):
+    """
+    Output model for the QueryHandler.
+    """
+
+    plan: str | None = Field(
+        default=None,
+        description="The query plan and its optimized version, if requested.",
+    )
+
+
+class QueryHandler(BaseHandler[QueryInputSchema, QueryOutputSchema]):
+    """
+    Handler for reading the rows of a table matching a filter, in sorted order.
+    """
+
+    name: str = "query"
+    input_schema: type[QueryInputSchema] = QueryInputSchema
+    output_schema: type[QueryOutputSchema] = QueryOutputSchema
+    description: str = (
+        "Read the rows of the table matching a filter expression, optionally "
+        "sorted, with only some columns and a limit on the number of rows. "
+        "The query is optimized and run at once without copying the table, "
+        "and the table itself is not changed."
+    )
+
+    def __init__(self, editor: InMemoryEditor) -> None:
+        self.editor = editor
+
+    def is_read_only(self, args: QueryInputSchema) -> bool:
+        return True
+
+    def handle(self, args: QueryInputSchema) -> QueryOutputSchema:
+        """
+        Handle the query operation.
+
+        Parameters
+        ----------
+        args : QueryInputSchema
+            The arguments for the query operation.
+
+        Returns
+        -------
+        QueryOutputSchema
+            The rows and columns of the result.
+        """
+        plan = self.editor.plan()
+        if args.rows is not None:
+            plan = plan.select(Range(row=args.rows))
+        if args.filter:
+            plan = plan.filter(args.filter)
+        if args.sort_by:
+            plan = plan.sort(args.sort_by, args.ascending)
+        if args.columns is not None:
+            plan = plan.project(args.columns)
+        if args.limit is not None:
+            plan = plan.limit(args.limit)
+        with span("pandas_op"):
+            df = plan.collect()
+        return QueryOutputSchema.from_dataframe(
+            df,
+            plan=plan.explain() if args.explain else None,
+            memory_usage=self.editor.memory_usage,
+        )
@@ -4,6 +4,7 @@ from pydantic import BaseModel, Field
 
 from mcp_table_editor.editor import InMemoryEditor
 from mcp_table_editor.handler._base_handler import BaseHandler, BaseOutputSchema
+from mcp_table_editor.misc import span
 
 
 class SortByValueInputSchema(BaseModel):
@@ -40,6 +41,18 @@ class SortByValueHandler(BaseHandler[SortByValueInputSchema, SortByValueOutputSc
     def __init__(self, editor: InMemoryEditor) -> None:
         self.editor = editor
 
+    def apply(self, args: SortByValueInputSchema) -> None:
+        """
+        Sort the table without building a response.
+
+        Parameters
+        ----------
+        args : SortByValueInputSchema
+            The arguments for the sort operation.
+        """
+        with span("pandas_op"):
+            self.editor.sort_by_values(args.by, values=args.values)
+
     def handle(self, args: SortByValueInputSchema) -> SortByValueOutputSchema:
         """
         Handle the sort operation.
@@ -54,6 +67,8 @@ class SortByValueHandler(BaseHandler[SortByValueInputSchema, SortByValueOutputSc
         SortOutputSchema
             The result of the sort operation.
         """
-        self.editor.sort_by_values(args.by, values=args.values)
+        self.apply(args)
         df = self.editor.get_table()
-        return SortByValueOutputSchema.from_dataframe(df)
+        return SortByValueOutputSchema.from_dataframe(
+            df, memory_usage=self.editor.memory_usage
+        )
@@ -4,6 +4,7 @@ from pydantic import BaseModel, Field
 
 from mcp_table_editor.editor import InMemoryEditor
 from mcp_table_editor.handler._base_handler import BaseHandler, BaseOutputSchema
+from mcp_table_editor.misc import span
 
 
 class SortInputSchema(BaseModel):
@@ -19,6 +20,13 @@ class SortInputSchema(BaseModel):
         default=True,
         description="Whether to sort in ascending order. If False, sort in descending order.",
     )
+    keep_sorted: bool = Field(
+        default=False,
+        description=(
+            "Whether to keep the table sorted by the column(s) on later edits: "
+            "inserted and updated rows are moved to their place in the order."
+        ),
+    )
 
 
 SortOutputSchema = BaseOutputSchema
@@ -39,6 +47,20 @@ class SortHandler(BaseHandler[SortInputSchema, SortOutputSchema]):
     def __init__(self, editor: InMemoryEditor) -> None:
         self.editor = editor
 
+    def apply(self, args: SortInputSchema) -> None:
+        """
+        Sort the table without building a response.
+
+        Parameters
+        ----------
+        args : SortInputSchema
+            The arguments for the sort operation.
+        """
+        with span("pandas_op"):
+            self.editor.sort(
+                by=args.by, ascending=args.ascending, keep_sorted=args.keep_sorted
+            )
+
     def handle(self, args: SortInputSchema) -> SortOutputSchema:
         """
         Handle the sort operation.
@@ -53,6 +75,8 @@ class SortHandler(BaseHandler[SortInputSchema, SortOutputSchema]):
         SortOutputSchema
             The result of the sort operation.
         """
-        self.editor.sort(by=args.by, ascending=args.ascending)
+        self.apply(args)
         df = self.editor.get_table()
-        return SortOutputSchema.from_dataframe(df)
+        return SortOutputSchema.from_dataframe(
+            df, memory_usage=self.editor.memory_usage
+        )
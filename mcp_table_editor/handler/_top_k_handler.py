@@ -0,0 +1,82 @@
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from mcp_table_editor.editor import InMemoryEditor
+from mcp_table_editor.handler._base_handler import BaseHandler, BaseOutputSchema
+from mcp_table_editor.misc import span
+
+
+class TopKInputSchema(BaseModel):
+    """
+    Input model for the TopKHandler.
+    """
+
+    by: list[str] = Field(
+        default=...,
+        description="The column(s) to sort by.",
+    )
+    k: int = Field(
+        default=20,
+        ge=0,
+        description="The number of rows to return.",
+    )
+    ascending: bool | list[bool] = Field(
+        default=False,
+        description=(
+            "Whether to sort in ascending order, for all the columns or for each "
+            "column in 'by'. The default returns the largest values."
+        ),
+    )
+    values: dict[str, list[Any]] | None = Field(
+        default=None,
+        description=(
+            "Custom order of the values of some of the columns in 'by', as in "
+            "sort_by_value. Values not listed come after the listed ones."
+        ),
+    )
+
+
+TopKOutputSchema = BaseOutputSchema
+
+
+class TopKHandler(BaseHandler[TopKInputSchema, TopKOutputSchema]):
+    """
+    Handler for getting the first rows of a table in sorted order.
+    """
+
+    name: str = "top_k"
+    input_schema: type[TopKInputSchema] = TopKInputSchema
+    output_schema: type[TopKOutputSchema] = TopKOutputSchema
+    description: str = (
+        "Get the first k rows of the table sorted by the specified column(s), "
+        "e.g. the top 20 by a column. The table itself is not reordered."
+    )
+
+    def __init__(self, editor: InMemoryEditor) -> None:
+        self.editor = editor
+
+    def is_read_only(self, args: TopKInputSchema) -> bool:
+        return True
+
+    def handle(self, args: TopKInputSchema) -> TopKOutputSchema:
+        """
+        Handle the top-k operation.
+
+        Parameters
+        ----------
+        args : TopKInputSchema
+            The arguments for the top-k operation.
+
+        Returns
+        -------
+        TopKOutputSchema
+            The first k rows in sorted order.
+        """
+        with span("pandas_op"):
+            df = self.editor.top_k(
+                args.by, args.k, ascending=args.ascending, values=args.values
+            )
+        return TopKOutputSchema.from_dataframe(
+            df, memory_usage=self.editor.memory_usage
+        )
@@ -0,0 +1,116 @@
+from pydantic import BaseModel, Field
+
+from mcp_table_editor.editor import InMemoryEditor
+from mcp_table_editor.handler._base_handler import BaseHandler
+from mcp_table_editor.misc import CallTrace, tracer
+
+
+class TraceInputSchema(BaseModel):
+    """
+    Input model for the TraceHandler.
+    """
+
+    last: int = Field(
+        10,
+        description="Number of the last traced calls to return.",
+    )
+    enable: bool | None = Field(
+        None,
+        description="Enable or disable the tracing of the next calls. If None, leave it as is.",
+    )
+    export_path: str | None = Field(
+        None,
+        description=(
+            "Name of a JSON file to write the returned calls to, in the Chrome "
+            "trace format, relative to the trace directory of the server."
+        ),
+    )
+
+
+class CallBreakdown(BaseModel):
+    """
+    Time spent in each phase of a call.
+    """
+
+    tool: str = Field(..., description="Name of the tool called.")
+    duration_ms: float = Field(..., description="Duration of the call in milliseconds.")
+    phases_ms: dict[str, float] = Field(
+        ...,
+        description=(
+            "Total time of each phase in milliseconds: validate, lock, handle, range, "
+            "selector_copy, pandas_op, diff, from_dataframe and encode. "
+            "Nested phases are counted in their parent too."
+        ),
+    )
+
+    @classmethod
+    def from_trace(cls, trace: CallTrace) -> "CallBreakdown":
+        return cls(
+            tool=trace.name,
+            duration_ms=trace.duration * 1000,
+            phases_ms={
+                name: seconds * 1000 for name, seconds in trace.breakdown().items()
+            },
+        )
+
+
+class TraceOutputSchema(BaseModel):
+    """
+    Output model for the TraceHandler.
+    """
+
+    enabled: bool = Field(..., description="Whether the next calls are traced.")
+    calls: list[CallBreakdown] = Field(
+        ..., description="The last traced calls, the oldest first."
+    )
+    export_path: str | None = Field(
+        None, description="Path of the written Chrome trace file, if any."
+    )
+
+
+class TraceHandler(BaseHandler[TraceInputSchema, TraceOutputSchema]):
+    """
+    Handler for inspecting the time spent in the phases of the last tool calls.
+    """
+
+    name: str = "trace"
+    input_schema: type[TraceInputSchema] = TraceInputSchema
+    output_schema: type[TraceOutputSchema] = TraceOutputSchema
+    description: str = (
+        "Debug tool returning the time spent in each phase of the last tool calls, "
+        "such as validation, range resolution, copies, the pandas operation and "
+        "serialization. Tracing is off unless enabled here or by the server settings."
+    )
+
+    def __init__(self, editor: InMemoryEditor) -> None:
+        self.editor = editor
+
+    def is_read_only(self, args: TraceInputSchema) -> bool:
+        return True
+
+    def handle(self, args: TraceInputSchema) -> TraceOutputSchema:
+        """
+        Handle the trace operation.
+
+        Parameters
+        ----------
+        args : TraceInputSchema
+            The arguments for the trace operation.
+
+        Returns
+        -------
+        TraceOutputSchema
+            The breakdown of the last traced calls.
+        """
+        traces = tracer.last(args.last)
+        export_path = None
+        if args.export_path is not None:
+            export_path = tracer.export_path(args.export_path)
+            tracer.export(export_path, traces)
+        if args.enable is not None:
+            tracer.enabled = args.enable
+        return TraceOutputSchema(
+            enabled=tracer.enabled,
+            calls=[CallBreakdown.from_trace(trace) for trace in traces],
+            export_path=export_path,
+        )
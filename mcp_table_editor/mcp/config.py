@@ -40,3 +40,45 @@ class McpSettings(BaseSettings):
         "INFO",
         description="The log level for the MCP server.",
     )
+
+    max_workers: int = Field(
+        4,
+        description="The number of threads running the tools.",
+    )
+    trace: bool = Field(
+        False,
+        description="Whether to trace the phases of the tool calls, see the trace tool.",
+    )
+    trace_dir: str | None = Field(
+        None,
+        description=(
+            "The directory the trace tool may export traces to. "
+            "If not set, traces cannot be exported."
+        ),
+    )
+
+    # Storage settings
+    partitioned: bool = Field(
+        False,
+        description=(
+            "Whether to store the table in chunks of rows, which operators visit "
+            "in parallel. Not used with a store URL."
+        ),
+    )
+    out_of_core_csv: str | None = Field(
+        None,
+        description=(
+            "A CSV file larger than memory, streamed into an on-disk columnar "
+            "cache and served read-only from it. Takes precedence over the "
+            "other storage settings."
+        ),
+    )
+
+    # Persistence settings
+    store_url: str | None = Field(
+        None,
+        description=(
+            "The SQLAlchemy URL of the SQLite store the table is written to in the "
+            "background. If not set, the table is kept only in memory."
+        ),
+    )
@@ -0,0 +1,70 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Sequence, TypeVar
+
+from mcp.types import TextContent
+
+from mcp_table_editor.mcp.handler_tool import HandlerTool
+from mcp_table_editor.misc import ReadWriteLock
+
+if TYPE_CHECKING:
+    from mcp_table_editor.editor import InMemoryEditor
+
+T = TypeVar("T")
+
+
+class ToolExecutor:
+    """
+    Run tools in a bounded thread pool, off the event loop.
+
+    Each table is guarded by a reader/writer lock, so that read-only calls on a table
+    run in parallel while calls changing it run alone.
+    Pandas releases the GIL in many of its kernels, so calls on different tables,
+    or reads of the same table, can make progress at the same time.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="mcp-table-editor"
+        )
+        self._locks: dict[str, ReadWriteLock] = {}
+        self._locks_guard = threading.Lock()
+
+    def lock(self, editor: "InMemoryEditor") -> ReadWriteLock:
+        """
+        Get the lock of the table of an editor.
+        """
+        lock = self._locks.get(editor.id)
+        if lock is None:
+            with self._locks_guard:
+                lock = self._locks.setdefault(editor.id, ReadWriteLock())
+        return lock
+
+    def release(self, editor: "InMemoryEditor") -> None:
+        """
+        Forget the lock of the table of an editor which is no longer used.
+        """
+        with self._locks_guard:
+            self._locks.pop(editor.id, None)
+
+    async def run(
+        self, tool: HandlerTool, editor: "InMemoryEditor", args: dict[str, Any]
+    ) -> Sequence[TextContent]:
+        """
+        Run the tool in the thread pool while holding the lock of the table.
+        """
+        return await self.call(tool.run, editor, args, self.lock(editor))
+
+    async def call(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a blocking function in the thread pool.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, func, *args)
+
+    def shutdown(self) -> None:
+        """
+        Wait for the running tools and stop the thread pool.
+        """
+        self._pool.shutdown(wait=True)
@@ -1,18 +1,67 @@
-from typing import Any, Sequence
+import json
+import threading
+import time
+from contextlib import ExitStack, nullcontext
+from typing import TYPE_CHECKING, Any, Callable, Sequence
 
 from mcp.types import TextContent, Tool
-from pydantic import BaseModel, Field, create_model
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_jsonable_python
 
-from mcp_table_editor.editor import InMemoryEditor
-from mcp_table_editor.handler._base_handler import BaseHandler
+from mcp_table_editor.mcp.metrics import ToolMetrics, metrics
+from mcp_table_editor.misc import (
+    ReadWriteLock,
+    Tracer,
+    serialization_time,
+    span,
+    tracer,
+)
+
+if TYPE_CHECKING:
+    from mcp_table_editor.editor import InMemoryEditor
+    from mcp_table_editor.handler import BaseHandler
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def _dump_json(response: BaseModel) -> str:
+    """
+    Serialize a response as compact JSON, with orjson if it is installed.
+    """
+    if orjson is None:
+        return response.model_dump_json()
+    return orjson.dumps(response.model_dump(), default=to_jsonable_python).decode()
+
+
+def _json_size(args: dict[str, Any]) -> int:
+    """
+    Get the size of the arguments of a call as JSON.
+    """
+    if orjson is None:
+        return len(json.dumps(args, default=str, separators=(",", ":")))
+    return len(orjson.dumps(args, default=str))
 
 
 class HandlerTool:
     def __init__(
         self,
-        handler: type[BaseHandler[BaseModel, BaseModel]],
+        handler: "type[BaseHandler[BaseModel, BaseModel]]",
+        encoder: Callable[[BaseModel], str] = _dump_json,
+        metrics: ToolMetrics | None = metrics,
+        tracer: Tracer = tracer,
     ) -> None:
         self.handler = handler
+        self.encoder = encoder
+        self.metrics = metrics
+        self.tracer = tracer
+        # Built once per tool, so that a call only runs the compiled validator.
+        self._adapter = TypeAdapter(handler.input_schema)
+        self._instances: "dict[str, BaseHandler[BaseModel, BaseModel]]" = {}
+        self._instances_guard = threading.Lock()
+        self._mcp_tool: Tool | None = None
 
     @property
     def name(self) -> str:
@@ -24,19 +73,93 @@ class HandlerTool:
     def get_mcp_tool(self) -> Tool:
         """
         Get the mcp tool.
+        The JSON schema of the input is generated on first use and then reused.
         """
-        return Tool(
-            name=self.handler.name,
-            description=self.handler.description,
-            inputSchema=self.handler.input_schema.model_json_schema(),
-        )
+        if self._mcp_tool is None:
+            self._mcp_tool = Tool(
+                name=self.handler.name,
+                description=self.handler.description,
+                inputSchema=self.handler.input_schema.model_json_schema(),
+            )
+        return self._mcp_tool
+
+    def get_handler(
+        self, editor: "InMemoryEditor"
+    ) -> "BaseHandler[BaseModel, BaseModel]":
+        """
+        Get the handler instance of an editor, creating it on first use.
+        Handlers hold no state besides the editor, so the instance is shared by calls.
+        """
+        handler_instance = self._instances.get(editor.id)
+        if handler_instance is None:
+            with self._instances_guard:
+                handler_instance = self._instances.setdefault(
+                    editor.id, self.handler(editor)
+                )
+        return handler_instance
+
+    def release(self, editor: "InMemoryEditor") -> None:
+        """
+        Forget the handler instance of an editor which is no longer used.
+        """
+        with self._instances_guard:
+            self._instances.pop(editor.id, None)
 
     def run(
-        self, editor: InMemoryEditor, args: dict[str, Any]
+        self,
+        editor: "InMemoryEditor",
+        args: dict[str, Any],
+        lock: ReadWriteLock | None = None,
     ) -> Sequence[TextContent]:
         """
         Run the tool with the given input arguments.
+        If a lock of the table is given, the handler runs while holding it,
+        for reading if the request leaves the table unchanged, for writing otherwise,
+        unless the request does not access the table.
+        The call is recorded in the metrics of the tool, if any,
+        and its phases are traced if the tracer is enabled.
         """
-        handler_instance = self.handler(editor)
-        response = handler_instance.handle(**args)
-        return [TextContent(type="text", text=response.model_dump_json(indent=2))]
+        start = time.perf_counter()
+        try:
+            with self.tracer.trace(self.name) as trace:
+                with span("validate"):
+                    input_args = self._adapter.validate_python(args)
+                handler_instance = self.get_handler(editor)
+                if lock is None or handler_instance.is_lock_free(input_args):
+                    context = nullcontext()
+                elif handler_instance.is_read_only(input_args):
+                    context = lock.read()
+                else:
+                    context = lock.write()
+                with ExitStack() as stack:
+                    with span("lock"):
+                        stack.enter_context(context)
+                    # Read under the lock, as writers may change the table meanwhile.
+                    rows, columns = editor.shape
+                    if trace is not None:
+                        trace.args.update(rows=rows, columns=columns)
+                    handle_start = time.perf_counter()
+                    # Responses built from dataframes are serialized by the handler.
+                    with span("handle"), serialization_time() as handler_serialization:
+                        response = handler_instance.handle(input_args)
+                serialize_start = time.perf_counter()
+                with span("encode"):
+                    text = self.encoder(response)
+        except Exception:
+            if self.metrics is not None:
+                self.metrics.observe_error(self.name)
+            raise
+        end = time.perf_counter()
+        if self.metrics is not None:
+            serialize_seconds = end - serialize_start + handler_serialization.seconds
+            self.metrics.observe(
+                self.name,
+                latency=end - start,
+                handle_seconds=end - handle_start - serialize_seconds,
+                serialize_seconds=serialize_seconds,
+                request_bytes=_json_size(args),
+                response_bytes=len(text),
+                rows=rows,
+                columns=columns,
+            )
+        return [TextContent(type="text", text=text)]
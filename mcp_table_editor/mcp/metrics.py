@@ -0,0 +1,271 @@
+import threading
+from bisect import bisect_left
+from typing import Iterable
+
+# Upper bounds of the latency buckets, in seconds.
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+# Upper bounds of the table size buckets, in rows or columns.
+SIZE_BUCKETS = (10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+PREFIX = "mcp_table_editor"
+
+
+class _Histogram:
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        # The last count is for the values above all the bounds.
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    def merge(self, other: "_Histogram") -> None:
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.sum += other.sum
+
+
+class _ToolStats:
+    """Statistics of the calls of a tool, in a single thread."""
+
+    __slots__ = (
+        "calls",
+        "errors",
+        "latency",
+        "handle_seconds",
+        "serialize_seconds",
+        "request_bytes",
+        "response_bytes",
+        "rows",
+        "columns",
+    )
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.latency = _Histogram(LATENCY_BUCKETS)
+        self.handle_seconds = 0.0
+        self.serialize_seconds = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.rows = _Histogram(SIZE_BUCKETS)
+        self.columns = _Histogram(SIZE_BUCKETS)
+
+    def merge(self, other: "_ToolStats") -> None:
+        self.calls += other.calls
+        self.errors += other.errors
+        self.latency.merge(other.latency)
+        self.handle_seconds += other.handle_seconds
+        self.serialize_seconds += other.serialize_seconds
+        self.request_bytes += other.request_bytes
+        self.response_bytes += other.response_bytes
+        self.rows.merge(other.rows)
+        self.columns.merge(other.columns)
+
+
+class ToolMetrics:
+    """
+    Metrics of the tool calls, rendered in the Prometheus text format.
+
+    Each thread records into its own shard, so that recording a call takes no lock;
+    the shards are summed up when the metrics are rendered.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: list[dict[str, _ToolStats]] = []
+        self._shards_guard = threading.Lock()
+
+    def _stats(self, tool: str) -> _ToolStats:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._shards_guard:
+                self._shards.append(shard)
+        stats = shard.get(tool)
+        if stats is None:
+            stats = shard[tool] = _ToolStats()
+        return stats
+
+    def observe(
+        self,
+        tool: str,
+        latency: float,
+        handle_seconds: float,
+        serialize_seconds: float,
+        request_bytes: int,
+        response_bytes: int,
+        rows: int,
+        columns: int,
+    ) -> None:
+        """
+        Record a successful call of a tool.
+
+        Parameters
+        ----------
+        tool : str
+            Name of the tool.
+        latency : float
+            Time of the whole call in seconds, including waiting for the table lock.
+        handle_seconds : float
+            Time spent by the handler on the table in seconds.
+        serialize_seconds : float
+            Time spent serializing the response in seconds.
+        request_bytes : int
+            Size of the arguments as JSON.
+        response_bytes : int
+            Size of the response.
+        rows : int
+            Number of rows of the table at the time of the call.
+        columns : int
+            Number of columns of the table at the time of the call.
+        """
+        stats = self._stats(tool)
+        stats.calls += 1
+        stats.latency.observe(latency)
+        stats.handle_seconds += handle_seconds
+        stats.serialize_seconds += serialize_seconds
+        stats.request_bytes += request_bytes
+        stats.response_bytes += response_bytes
+        stats.rows.observe(rows)
+        stats.columns.observe(columns)
+
+    def observe_error(self, tool: str) -> None:
+        """
+        Record a failed call of a tool.
+        """
+        self._stats(tool).errors += 1
+
+    def collect(self) -> dict[str, _ToolStats]:
+        """
+        Sum up the statistics of all the threads by tool.
+        """
+        with self._shards_guard:
+            shards = list(self._shards)
+        total: dict[str, _ToolStats] = {}
+        for shard in shards:
+            for tool, stats in list(shard.items()):
+                total.setdefault(tool, _ToolStats()).merge(stats)
+        return total
+
+    def render(self) -> str:
+        """
+        Render the metrics in the Prometheus text format.
+        """
+        tools = sorted(self.collect().items())
+        lines: list[str] = []
+        _histogram(
+            lines,
+            "tool_latency_seconds",
+            "Latency of the tool calls.",
+            ((tool, stats.latency) for tool, stats in tools),
+        )
+        for name, help, attribute in (
+            ("tool_calls_total", "Number of successful tool calls.", "calls"),
+            ("tool_errors_total", "Number of failed tool calls.", "errors"),
+            (
+                "tool_handle_seconds_total",
+                "Time spent by the handlers on the table.",
+                "handle_seconds",
+            ),
+            (
+                "tool_serialize_seconds_total",
+                "Time spent serializing the responses.",
+                "serialize_seconds",
+            ),
+            (
+                "tool_request_bytes_total",
+                "Size of the arguments of the tool calls.",
+                "request_bytes",
+            ),
+            (
+                "tool_response_bytes_total",
+                "Size of the responses of the tool calls.",
+                "response_bytes",
+            ),
+        ):
+            lines.append(f"# HELP {PREFIX}_{name} {help}")
+            lines.append(f"# TYPE {PREFIX}_{name} counter")
+            for tool, stats in tools:
+                lines.append(
+                    f"{PREFIX}_{name}{{tool={_quote(tool)}}} "
+                    f"{_number(getattr(stats, attribute))}"
+                )
+        _histogram(
+            lines,
+            "tool_table_rows",
+            "Number of rows of the table at the time of the tool calls.",
+            ((tool, stats.rows) for tool, stats in tools),
+        )
+        _histogram(
+            lines,
+            "tool_table_columns",
+            "Number of columns of the table at the time of the tool calls.",
+            ((tool, stats.columns) for tool, stats in tools),
+        )
+        return "\n".join(lines) + "\n"
+
+
+def gauge(name: str, help: str, value: float) -> str:
+    """
+    Render a gauge without labels in the Prometheus text format.
+    """
+    return (
+        f"# HELP {PREFIX}_{name} {help}\n"
+        f"# TYPE {PREFIX}_{name} gauge\n"
+        f"{PREFIX}_{name} {_number(value)}\n"
+    )
+
+
+def _histogram(
+    lines: list[str],
+    name: str,
+    help: str,
+    histograms: Iterable[tuple[str, _Histogram]],
+) -> None:
+    lines.append(f"# HELP {PREFIX}_{name} {help}")
+    lines.append(f"# TYPE {PREFIX}_{name} histogram")
+    for tool, histogram in histograms:
+        label = f"tool={_quote(tool)}"
+        cumulative = 0
+        for bound, count in zip(histogram.bounds, histogram.counts):
+            cumulative += count
+            lines.append(
+                f'{PREFIX}_{name}_bucket{{{label},le="{bound:g}"}} {cumulative}'
+            )
+        cumulative += histogram.counts[-1]
+        lines.append(f'{PREFIX}_{name}_bucket{{{label},le="+Inf"}} {cumulative}')
+        lines.append(f"{PREFIX}_{name}_sum{{{label}}} {_number(histogram.sum)}")
+        lines.append(f"{PREFIX}_{name}_count{{{label}}} {cumulative}")
+
+
+def _quote(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{escaped}"'
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+# Metrics of the tool calls of the server.
+metrics = ToolMetrics()
@@ -1,6 +1,7 @@
+import asyncio
 from contextlib import asynccontextmanager
 from logging import basicConfig, getLogger
-from typing import AsyncIterator
+from typing import TYPE_CHECKING, Any, AsyncIterator
 
 import mcp
 import mcp.server.stdio
@@ -12,24 +13,133 @@ from mcp.server.models import InitializationOptions
 from mcp.types import TextContent, Tool
 
 from mcp_table_editor._version import __version__
-from mcp_table_editor.editor import InMemoryEditor
-from mcp_table_editor.handler import TOOL_HANDLERS
+from mcp_table_editor.mcp.config import McpSettings
+from mcp_table_editor.mcp.executor import ToolExecutor
 from mcp_table_editor.mcp.handler_tool import HandlerTool
+from mcp_table_editor.misc import tracer
+
+if TYPE_CHECKING:
+    from mcp_table_editor.editor import InMemoryEditor
+    from mcp_table_editor.handler import BaseHandler
 
 basicConfig(
     level="INFO",
 )
 _logger = getLogger(__name__)
 
-TOOLS: dict[str, HandlerTool] = {
-    handler.name: HandlerTool(handler) for handler in TOOL_HANDLERS  #  type: ignore
-}
+# The handlers, and pandas with them, are imported on the first use of the tools,
+# so that the server answers `initialize` without loading them.
+_tools: dict[str, HandlerTool] | None = None
+# Tools listed to the clients, built on first use and reset when the tools change.
+_tool_list: list[Tool] | None = None
+
+
+def get_tools() -> dict[str, HandlerTool]:
+    """
+    Get the tools by their names, importing the handlers on first use.
+    """
+    global _tools
+    if _tools is None:
+        from mcp_table_editor.handler import TOOL_HANDLERS
+
+        _tools = {
+            handler.name: HandlerTool(handler) for handler in TOOL_HANDLERS  #  type: ignore
+        }
+    return _tools
+
+
+def __getattr__(name: str) -> Any:
+    if name == "TOOLS":
+        return get_tools()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def register_tool(handler: "type[BaseHandler]") -> HandlerTool:
+    """
+    Register a handler as a tool, replacing the tool of the same name if any.
+    """
+    global _tool_list
+    tool = HandlerTool(handler)
+    get_tools()[tool.name] = tool
+    _tool_list = None
+    return tool
+
+
+def unregister_tool(name: str) -> None:
+    """
+    Remove a tool by its name.
+    """
+    global _tool_list
+    tools = get_tools()
+    if name not in tools:
+        raise ValueError(f"Tool {name} not found.")
+    del tools[name]
+    _tool_list = None
+
+
+executor = ToolExecutor(max_workers=McpSettings().max_workers)
+tracer.enabled = McpSettings().trace
+tracer.export_dir = McpSettings().trace_dir
+
+
+class EditorSession:
+    """
+    The editor of a server session, created on the first tool call.
+    """
+
+    def __init__(self, settings: McpSettings) -> None:
+        self.settings = settings
+        self._editor: "InMemoryEditor | None" = None
+        self._guard = asyncio.Lock()
+
+    async def get_editor(self) -> "InMemoryEditor":
+        """
+        Get the editor, created in the executor on first use, since ingesting
+        a CSV file or loading the table from a store blocks.
+        """
+        if self._editor is None:
+            async with self._guard:
+                if self._editor is None:
+                    self._editor = await executor.call(self._create_editor)
+        return self._editor
+
+    def _create_editor(self) -> "InMemoryEditor":
+        if self.settings.out_of_core_csv is not None:
+            from mcp_table_editor.editor import OutOfCoreEditor
+
+            return OutOfCoreEditor.from_csv(self.settings.out_of_core_csv)
+        if self.settings.store_url is None and self.settings.partitioned:
+            from mcp_table_editor.editor import PartitionedEditor
+
+            return PartitionedEditor()
+        if self.settings.store_url is None:
+            from mcp_table_editor.editor import InMemoryEditor
+
+            return InMemoryEditor()
+        from mcp_table_editor.editor import WriteBehindEditor
+
+        return WriteBehindEditor(url=self.settings.store_url)
+
+    def close(self) -> None:
+        """
+        Release the editor, if it was created.
+        """
+        editor, self._editor = self._editor, None
+        if editor is None:
+            return
+        executor.release(editor)
+        for tool in get_tools().values():
+            tool.release(editor)
+        editor.close()
 
 
 @asynccontextmanager
-async def editor_context(server: Server) -> AsyncIterator[InMemoryEditor]:
-    editor = InMemoryEditor()
-    yield editor
+async def editor_context(server: Server) -> AsyncIterator[EditorSession]:
+    session = EditorSession(McpSettings())
+    try:
+        yield session
+    finally:
+        session.close()
 
 
 app: Server = Server("mcp-table-editor", __version__, lifespan=editor_context)
@@ -43,7 +153,10 @@ async def list_tools() -> list[Tool]:
     """
     List all tools.
     """
-    return [tool.get_mcp_tool() for tool in TOOLS.values()]
+    global _tool_list
+    if _tool_list is None:
+        _tool_list = [tool.get_mcp_tool() for tool in get_tools().values()]
+    return _tool_list
 
 
 @app.call_tool()
@@ -51,12 +164,13 @@ async def call_tool(name: str, args: dict) -> list[TextContent]:
     """
     Call a tool with the given name and arguments.
     """
-    editor: InMemoryEditor = app.request_context.lifespan_context
-    if name not in TOOLS:
+    session: EditorSession = app.request_context.lifespan_context
+    tools = get_tools()
+    if name not in tools:
         raise ValueError(f"Tool {name} not found.")
     _logger.info(f"Calling tool: {name} with args: {args}")
-    tool = TOOLS[name]
-    return tool.run(editor, args)
+    tool = tools[name]
+    return list(await executor.run(tool, await session.get_editor(), args))
 
 
 async def run_server():
@@ -76,9 +190,16 @@ async def run_server():
         )
 
 
-if __name__ == "__main__":
+def main() -> None:
+    """
+    Run the server over stdio, the entry point of the `mcp-table-editor` script.
+    """
     import asyncio
 
     _logger.info("Starting MCP Table Editor server...")
     # asyncio.run(run())
     asyncio.run(run_server())
+
+
+if __name__ == "__main__":
+    main()
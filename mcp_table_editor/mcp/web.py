@@ -3,6 +3,7 @@ from logging import basicConfig, getLogger
 from typing import AsyncIterator
 
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 from starlette.applications import Starlette
 from starlette.routing import Mount
@@ -10,6 +11,7 @@ from starlette.types import Receive, Scope, Send
 
 from mcp_table_editor.mcp.config import McpSettings
 from mcp_table_editor.mcp.event_store import InMemoryEventStore
+from mcp_table_editor.mcp.metrics import gauge, metrics
 from mcp_table_editor.mcp.server import app as mcp_app
 
 basicConfig(
@@ -68,6 +70,25 @@ async def get_table(id: str):
         return {"error": "Table not found"}, 404
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics() -> PlainTextResponse:
+    """Metrics of the tool calls and the event store in the Prometheus text format."""
+    body = (
+        metrics.render()
+        + gauge(
+            "event_store_streams",
+            "Number of streams in the event store.",
+            len(event_store.streams),
+        )
+        + gauge(
+            "event_store_events",
+            "Number of events kept in the event store.",
+            len(event_store.event_index),
+        )
+    )
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -1,5 +1,54 @@
-from mcp_table_editor.misc.pandas_utils import merge_index
+from typing import TYPE_CHECKING, Any
+
+from mcp_table_editor.misc.locks import ReadWriteLock
+from mcp_table_editor.misc.tracing import (
+    CallTrace,
+    Span,
+    Tracer,
+    serialization_time,
+    serializing,
+    span,
+    tracer,
+)
+
+if TYPE_CHECKING:
+    from mcp_table_editor.misc.pandas_utils import (
+        DataFrameDiff,
+        changed_index,
+        diff_dataframe,
+        merge_index,
+    )
+
+# Names loaded on first access, so that importing the package does not import pandas.
+_LAZY_ATTRIBUTES = {
+    "DataFrameDiff": "mcp_table_editor.misc.pandas_utils",
+    "changed_index": "mcp_table_editor.misc.pandas_utils",
+    "diff_dataframe": "mcp_table_editor.misc.pandas_utils",
+    "merge_index": "mcp_table_editor.misc.pandas_utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
+    "CallTrace",
+    "DataFrameDiff",
+    "ReadWriteLock",
+    "Span",
+    "Tracer",
+    "changed_index",
+    "diff_dataframe",
     "merge_index",
+    "serialization_time",
+    "serializing",
+    "span",
+    "tracer",
 ]
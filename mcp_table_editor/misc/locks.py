@@ -0,0 +1,50 @@
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class ReadWriteLock:
+    """A lock which allows either many readers or a single writer.
+    Waiting writers take precedence over new readers so that writers are not starved.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Hold the lock for reading."""
+        with self._condition:
+            self._condition.wait_for(
+                lambda: not self._writer and self._waiting_writers == 0
+            )
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Hold the lock for writing."""
+        with self._condition:
+            self._waiting_writers += 1
+            try:
+                self._condition.wait_for(
+                    lambda: not self._writer and self._readers == 0
+                )
+            finally:
+                self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer = False
+                self._condition.notify_all()
@@ -1,3 +1,6 @@
+from dataclasses import dataclass
+
+import numpy as np
 import pandas as pd
 
 
@@ -12,3 +15,155 @@ def merge_index(df_index: pd.DataFrame, *indexes: pd.Index) -> pd.Index:
     if orders is None:
         return df_index
     return merged_index[list(filter(lambda x: x != -1, orders))]
+
+
+def changed_index(
+    before: pd.DataFrame,
+    after: pd.DataFrame,
+    candidates: pd.Index | None = None,
+) -> pd.Index:
+    """Get the labels of the rows whose values differ between two dataframes.
+    Only rows and columns present in both dataframes are compared, and the result
+    is ordered by the index of `after`.
+    If `candidates` is given, only those rows are compared.
+    """
+    index = after.index.intersection(before.index, sort=False)
+    if candidates is not None:
+        index = index.intersection(candidates, sort=False)
+    columns = after.columns.intersection(before.columns, sort=False)
+    if len(index) == 0 or len(columns) == 0:
+        return index[:0]
+    old = before.loc[index, columns]
+    new = after.loc[index, columns]
+    differs = np.zeros(len(index), dtype=bool)
+    for column in range(len(columns)):
+        differs |= _differs(old.iloc[:, column], new.iloc[:, column])
+    return index[differs]
+
+
+@dataclass
+class DataFrameDiff:
+    """Difference between two versions of a dataframe."""
+
+    # Changed cells with the columns "row", "column", "old" and "new".
+    # The cells of added rows and columns are included with a missing old value.
+    cells: pd.DataFrame
+    added_rows: pd.Index
+    removed_rows: pd.Index
+    added_columns: pd.Index
+    removed_columns: pd.Index
+
+
+def diff_dataframe(
+    before: pd.DataFrame,
+    after: pd.DataFrame,
+    rows: pd.Index | None = None,
+    columns: pd.Index | None = None,
+) -> DataFrameDiff:
+    """Get the difference between two versions of a dataframe.
+    If `rows` or `columns` is given, only those of the common rows and columns are
+    compared, so that the cost is proportional to the size of the change.
+    """
+    if not (before.index.is_unique and after.index.is_unique):
+        return _diff_duplicated_rows(before, after, rows, columns)
+
+    added_rows = after.index.difference(before.index, sort=False)
+    removed_rows = before.index.difference(after.index, sort=False)
+    added_columns = after.columns.difference(before.columns, sort=False)
+    removed_columns = before.columns.difference(after.columns, sort=False)
+
+    common_rows = after.index.intersection(before.index, sort=False)
+    common_columns = after.columns.intersection(before.columns, sort=False)
+    compared_rows = (
+        common_rows if rows is None else common_rows.intersection(rows, sort=False)
+    )
+    compared_columns = (
+        common_columns
+        if columns is None
+        else common_columns.intersection(columns, sort=False)
+    )
+
+    parts = []
+    if len(compared_rows) > 0 and len(compared_columns) > 0:
+        old = before.loc[compared_rows, compared_columns]
+        new = after.loc[compared_rows, compared_columns]
+        for i, column in enumerate(compared_columns):
+            differs = _differs(old.iloc[:, i], new.iloc[:, i])
+            if differs.any():
+                parts.append(
+                    _cells(
+                        compared_rows[differs],
+                        column,
+                        old.iloc[:, i].to_numpy()[differs],
+                        new.iloc[:, i].to_numpy()[differs],
+                    )
+                )
+    if len(added_rows) > 0:
+        added = after.loc[added_rows]
+        for i, column in enumerate(after.columns):
+            parts.append(_cells(added_rows, column, None, added.iloc[:, i].to_numpy()))
+    if len(added_columns) > 0:
+        added = after.loc[common_rows, added_columns]
+        for i, column in enumerate(added_columns):
+            parts.append(_cells(common_rows, column, None, added.iloc[:, i].to_numpy()))
+
+    cells = (
+        pd.concat(parts, ignore_index=True)
+        if parts
+        else pd.DataFrame({"row": [], "column": [], "old": [], "new": []})
+    )
+    return DataFrameDiff(
+        cells=cells,
+        added_rows=added_rows,
+        removed_rows=removed_rows,
+        added_columns=added_columns,
+        removed_columns=removed_columns,
+    )
+
+
+def _diff_duplicated_rows(
+    before: pd.DataFrame,
+    after: pd.DataFrame,
+    rows: pd.Index | None,
+    columns: pd.Index | None,
+) -> DataFrameDiff:
+    """Get the difference between two dataframes whose row labels are not unique.
+    The n-th row of a label is compared with the n-th row of the same label.
+    """
+    before = before.set_axis(_occurrences(before.index), axis=0)
+    after = after.set_axis(_occurrences(after.index), axis=0)
+    if rows is not None:
+        rows = after.index[after.index.get_level_values(0).isin(rows)]
+    diff = diff_dataframe(before, after, rows, columns)
+    diff.cells["row"] = [row for row, _ in diff.cells["row"]]
+    diff.added_rows = diff.added_rows.get_level_values(0)
+    diff.removed_rows = diff.removed_rows.get_level_values(0)
+    return diff
+
+
+def _occurrences(index: pd.Index) -> pd.MultiIndex:
+    """Pair each label with the number of times it appeared before."""
+    labels = pd.Series(index)
+    occurrence = labels.groupby(labels, dropna=False, sort=False).cumcount()
+    return pd.MultiIndex.from_arrays([index, occurrence.to_numpy()])
+
+
+def _cells(rows: pd.Index, column, old: np.ndarray | None, new: np.ndarray):
+    return pd.DataFrame(
+        {
+            "row": rows.to_numpy(),
+            "column": [column] * len(rows),
+            "old": old if old is not None else [None] * len(rows),
+            "new": new,
+        }
+    )
+
+
+def _differs(old: pd.Series, new: pd.Series) -> np.ndarray:
+    """Compare two series element-wise, treating missing values as equal."""
+    old_na = old.isna().to_numpy()
+    new_na = new.isna().to_numpy()
+    differs = old_na != new_na
+    valid = ~(old_na | new_na)
+    differs[valid] = old.to_numpy()[valid] != new.to_numpy()[valid]
+    return differs
@@ -0,0 +1,281 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import PurePath
+from typing import Any, ContextManager
+
+_NULL_CONTEXT = nullcontext()
+
+
+@dataclass
+class Span:
+    """
+    A phase of a call, with its start and end in nanoseconds of `time.perf_counter_ns`.
+    """
+
+    name: str
+    start: int
+    end: int = 0
+    thread_id: int = 0
+
+    @property
+    def duration(self) -> float:
+        """Duration of the phase in seconds."""
+        return (self.end - self.start) / 1e9
+
+
+@dataclass
+class CallTrace:
+    """
+    The phases of a tool call.
+    """
+
+    name: str
+    start: int
+    end: int = 0
+    thread_id: int = 0
+    args: dict[str, Any] = field(default_factory=dict)
+    spans: list[Span] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        """Duration of the call in seconds."""
+        return (self.end - self.start) / 1e9
+
+    def breakdown(self) -> dict[str, float]:
+        """
+        Get the total time of each phase in seconds.
+        Nested phases are counted in their parent too.
+        """
+        phases: dict[str, float] = {}
+        for span in self.spans:
+            phases[span.name] = phases.get(span.name, 0.0) + span.duration
+        return phases
+
+
+_current: ContextVar[CallTrace | None] = ContextVar("current_trace", default=None)
+
+
+class _SpanContext:
+    __slots__ = ("trace", "span")
+
+    def __init__(self, trace: CallTrace, name: str) -> None:
+        self.trace = trace
+        self.span = Span(name, 0, thread_id=threading.get_ident())
+
+    def __enter__(self) -> Span:
+        self.span.start = time.perf_counter_ns()
+        return self.span
+
+    def __exit__(self, *exc) -> None:
+        self.span.end = time.perf_counter_ns()
+        self.trace.spans.append(self.span)
+
+
+def span(name: str) -> ContextManager[Any]:
+    """
+    Measure a phase of the traced call running in the current context.
+    If no call is traced, nothing is measured.
+    """
+    trace = _current.get()
+    if trace is None:
+        return _NULL_CONTEXT
+    return _SpanContext(trace, name)
+
+
+# Nanoseconds spent serializing the response of the call running in the current
+# context, see `serialization_time`.
+_serialization: ContextVar[list[int] | None] = ContextVar("serialization", default=None)
+
+
+class _SerializationContext:
+    __slots__ = ("total", "span", "start")
+
+    def __init__(self, total: list[int], name: str) -> None:
+        self.total = total
+        self.span = span(name)
+
+    def __enter__(self) -> Any:
+        self.start = time.perf_counter_ns()
+        return self.span.__enter__()
+
+    def __exit__(self, *exc) -> None:
+        self.span.__exit__(*exc)
+        self.total[0] += time.perf_counter_ns() - self.start
+
+
+def serializing(name: str) -> ContextManager[Any]:
+    """
+    Measure a phase serializing a response, as a span of the traced call and
+    in the serialization time of the call, see `serialization_time`.
+    """
+    total = _serialization.get()
+    if total is None:
+        return span(name)
+    return _SerializationContext(total, name)
+
+
+class serialization_time:
+    """
+    Count the time spent in the `serializing` phases of a call while the context
+    is entered, in nanoseconds, whether or not the call is traced.
+    """
+
+    __slots__ = ("total", "token")
+
+    def __init__(self) -> None:
+        self.total = [0]
+
+    def __enter__(self) -> "serialization_time":
+        self.token = _serialization.set(self.total)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        _serialization.reset(self.token)
+
+    @property
+    def seconds(self) -> float:
+        return self.total[0] / 1e9
+
+
+class Tracer:
+    """
+    Opt-in tracer of the phases of tool calls.
+    The traces of the last calls are kept in memory, and can be exported as
+    a JSON file in the Chrome trace format, e.g. for chrome://tracing or Perfetto.
+    Tools may only export them to `export_dir`, see `export_path`.
+    """
+
+    def __init__(
+        self,
+        max_traces: int = 100,
+        enabled: bool = False,
+        export_dir: str | None = None,
+    ) -> None:
+        self.enabled = enabled
+        self.export_dir = export_dir
+        self._traces: deque[CallTrace] = deque(maxlen=max_traces)
+
+    def trace(self, name: str, **args: Any) -> ContextManager[Any]:
+        """
+        Trace a call, collecting the spans measured while it runs.
+        If the tracer is disabled, nothing is traced.
+        """
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return _TraceContext(self, CallTrace(name, 0, args=args))
+
+    def last(self, n: int | None = None) -> list[CallTrace]:
+        """
+        Get the traces of the last `n` calls, the oldest first.
+        """
+        traces = list(self._traces)
+        if n is None:
+            return traces
+        return traces[max(len(traces) - n, 0) :] if n > 0 else []
+
+    def clear(self) -> None:
+        self._traces.clear()
+
+    def to_chrome(self, traces: list[CallTrace] | None = None) -> dict[str, Any]:
+        """
+        Convert traces to the Chrome trace format, with timestamps in microseconds.
+        """
+        pid = os.getpid()
+        events = []
+        for trace in self.last() if traces is None else traces:
+            events.append(
+                _chrome_event(
+                    trace.name, trace.start, trace.end, pid, trace.thread_id, trace.args
+                )
+            )
+            for item in trace.spans:
+                events.append(
+                    _chrome_event(item.name, item.start, item.end, pid, item.thread_id)
+                )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_path(self, name: str) -> str:
+        """
+        Resolve the path of a trace file given by a tool, inside `export_dir`.
+
+        Raises
+        ------
+        ValueError
+            If no export directory is set, or the name is absolute or leaves the
+            directory, e.g. with "..".
+        """
+        if self.export_dir is None:
+            raise ValueError(
+                "Trace exports are disabled. Set the trace directory of the "
+                "server, e.g. with MTE_TRACE_DIR, to enable them."
+            )
+        relative = PurePath(name)
+        if relative.is_absolute() or relative.drive or ".." in relative.parts:
+            raise ValueError(
+                f"Trace path {name!r} must be relative to the trace directory, "
+                "without '..'."
+            )
+        root = os.path.realpath(self.export_dir)
+        path = os.path.realpath(os.path.join(root, relative))
+        if path == root or os.path.commonpath([root, path]) != root:
+            raise ValueError(f"Trace path {name!r} is outside the trace directory.")
+        return path
+
+    def export(self, path: str, traces: list[CallTrace] | None = None) -> None:
+        """
+        Write traces to a JSON file in the Chrome trace format, creating its
+        directory if needed.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_chrome(traces), f, default=str)
+
+
+class _TraceContext:
+    __slots__ = ("tracer", "trace", "token")
+
+    def __init__(self, tracer: Tracer, trace: CallTrace) -> None:
+        self.tracer = tracer
+        self.trace = trace
+
+    def __enter__(self) -> CallTrace:
+        self.token = _current.set(self.trace)
+        self.trace.thread_id = threading.get_ident()
+        self.trace.start = time.perf_counter_ns()
+        return self.trace
+
+    def __exit__(self, *exc) -> None:
+        self.trace.end = time.perf_counter_ns()
+        _current.reset(self.token)
+        self.tracer._traces.append(self.trace)
+
+
+def _chrome_event(
+    name: str,
+    start: int,
+    end: int,
+    pid: int,
+    thread_id: int,
+    args: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    event = {
+        "name": name,
+        "ph": "X",
+        "ts": start / 1000,
+        "dur": (end - start) / 1000,
+        "pid": pid,
+        "tid": thread_id,
+    }
+    if args:
+        event["args"] = args
+    return event
+
+
+# Tracer of the tool calls of the server.
+tracer = Tracer()
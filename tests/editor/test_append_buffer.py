@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mcp_table_editor.editor import EditorConfig, InMemoryEditor, InsertRule
+from mcp_table_editor.handler._crud_handler import (
+    CrudHandler,
+    CrudInputSchema,
+    Operation,
+    ResponseMode,
+)
+
+
+@pytest.fixture
+def sample_df() -> pd.DataFrame:
+    """Fixture for a small DataFrame with numeric and object columns."""
+    return pd.DataFrame({"i": [1, 2, 3], "s": ["a", "b", "c"]})
+
+
+def test_append_matches_concat(sample_df):
+    """Test appended rows are joined to the table like a concat, across chunks."""
+    editor = InMemoryEditor(sample_df, EditorConfig(append_chunk_rows=4))
+    for label in range(3, 20):
+        editor.append([label], label * 10, InsertRule.EMPTY)
+    assert editor.shape == (20, 2)
+    assert editor.version == 17
+
+    values = list(range(30, 200, 10))
+    expected = pd.concat(
+        [sample_df, pd.DataFrame({"i": values, "s": values}, index=range(3, 20))]
+    )
+    pd.testing.assert_frame_equal(editor.table, expected, check_dtype=False)
+    # Reading the table joins all the buffered rows.
+    assert editor.shape == editor.table.shape
+
+
+def test_append_joins_chunks_when_they_double_the_table(sample_df):
+    """Test the chunks are joined only once they are as large as the table."""
+    editor = InMemoryEditor(sample_df, EditorConfig(append_chunk_rows=2))
+    base = editor._table
+    editor.append([3, 4], 0)
+    assert editor._table is base
+    editor.append([5, 6], 0)
+    assert editor._table is not base
+    assert len(editor._table) == 7
+    assert editor._chunks == [] and editor._tail_index == []
+
+
+def test_append_above_copies_last_row(sample_df):
+    """Test a missing value with the ABOVE rule copies the last row."""
+    editor = InMemoryEditor(sample_df)
+    rows = editor.append([3, 4], pd.NA, InsertRule.ABOVE)
+    assert rows == [[3, "c"], [3, "c"]]
+    assert editor.table.loc[4].tolist() == [3, "c"]
+
+    rows = editor.append([5], pd.NA, InsertRule.EMPTY)
+    assert pd.isna(rows[0]).all()
+
+
+def test_append_checks_memory_limit(sample_df):
+    """Test appended rows are committed at once when a memory limit is set."""
+    usage = InMemoryEditor(sample_df).memory_usage
+    editor = InMemoryEditor(sample_df, EditorConfig(memory_hard_limit=usage + 100))
+    with pytest.raises(ValueError, match="memory limit"):
+        editor.append(list(range(3, 1000)), 0)
+    assert editor.shape == (3, 2)
+
+
+def test_crud_insert_appends_rows(sample_df):
+    """Test inserting rows with the CRUD handler goes through the append buffer."""
+    editor = InMemoryEditor(sample_df)
+    handler = CrudHandler(editor)
+    response = handler.handle(
+        CrudInputSchema(
+            method=Operation.INSERT,
+            rows=[3],
+            value=7,
+            commit=True,
+            response_mode=ResponseMode.DIFF,
+        )
+    )
+    assert editor._tail_index == [3]
+    assert response.shape == (4, 2)
+    assert response.patch.added_rows == [3]
+    assert {(cell.column, cell.new) for cell in response.patch.cells} == {
+        ("i", 7),
+        ("s", 7),
+    }
+
+    response = handler.handle(
+        CrudInputSchema(method=Operation.INSERT, rows=[4], commit=True)
+    )
+    assert response.shape == (5, 2)
+    assert editor.table.loc[4].tolist() == [7, 7]
+    assert np.array_equal(editor.table.index, [0, 1, 2, 3, 4])
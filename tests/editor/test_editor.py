@@ -1,3 +1,5 @@
+import warnings
+
 import pandas as pd
 import pytest
 
@@ -288,42 +290,68 @@ def test_selector_insert_location_range_raises_error(
 def test_selector_insert_column_with_ffill(
     sample_df: pd.DataFrame, editor_config: EditorConfig
 ):
-    """Test inserting a column with ffill rule."""
+    """Test inserting a column with ffill rule fills only the new column."""
     df_with_na = sample_df.copy()
-    df_with_na.loc["Y", "A"] = pd.NA  # Introduce NA for ffill test
+    df_with_na.loc["Y", "A"] = pd.NA  # The NA of an existing column is kept
     original_df = df_with_na.copy()
 
     cell_range = Range(column=["D"])
     selector = InMemorySelector(original_df, cell_range, editor_config)
-    # Insert with default NA, then ffill
-    result_df = selector.insert(pos=1, value=pd.NA, insert_rule=InsertRule.ABOVE)
+    result_df = selector.insert(pos=1, value=[1, None, 3], insert_rule=InsertRule.ABOVE)
 
     expected_df = original_df.copy()
-    expected_df.insert(1, "D", pd.NA)
-    expected_df = expected_df.ffill(axis=0)
+    expected_df.insert(1, "D", [1.0, 1.0, 3.0])
 
     pd.testing.assert_frame_equal(result_df, expected_df)
     pd.testing.assert_frame_equal(selector.df, expected_df)
+    assert pd.isna(result_df.loc["Y", "A"])
 
 
 def test_selector_insert_row_with_ffill(
     sample_df: pd.DataFrame, editor_config: EditorConfig
 ):
-    """Test inserting a row with ffill rule."""
-    original_df = sample_df.copy()
+    """Test inserting a row with ffill rule copies the row above it."""
+    original_df = sample_df.astype(float)
+    original_df.loc["Y", "A"] = pd.NA  # The NA of an existing row is kept
+    original_df.loc["Z", "B"] = pd.NA  # and so is the one copied to the new row
     new_index_label = "W"
     cell_range = Range(row=[new_index_label])
     selector = InMemorySelector(original_df, cell_range, editor_config)
-    # Insert row with NAs, then ffill
-    insert_value = pd.NA
-    result_df = selector.insert(value=insert_value, insert_rule=InsertRule.ABOVE)
+    result_df = selector.insert(value=pd.NA, insert_rule=InsertRule.ABOVE)
 
-    expected_df = original_df.copy()
     new_row = pd.DataFrame(
-        insert_value, index=[new_index_label], columns=original_df.columns
+        {"A": [3.0], "B": [float("nan")], "C": [9.0]}, index=[new_index_label]
     )
-    expected_df = pd.concat([expected_df, new_row], axis=0)
-    expected_df = expected_df.ffill(axis=0)
+    expected_df = pd.concat([original_df, new_row], axis=0)
 
     pd.testing.assert_frame_equal(result_df, expected_df)
     pd.testing.assert_frame_equal(selector.df, expected_df)
+    assert pd.isna(result_df.loc["Y", "A"])
+
+
+def test_selector_insert_many_columns_in_one_block(
+    sample_df: pd.DataFrame, editor_config: EditorConfig
+):
+    """Test inserting many columns adds them as one block at the position."""
+    new_columns = [f"N{i}" for i in range(200)]
+    selector = InMemorySelector(
+        sample_df.copy(), Range(column=new_columns), editor_config
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", pd.errors.PerformanceWarning)
+        result_df = selector.insert(pos=1, value=0, insert_rule=InsertRule.EMPTY)
+
+    assert result_df.columns.tolist() == ["A", *new_columns, "B", "C"]
+    assert (result_df[new_columns] == 0).all().all()
+    pd.testing.assert_frame_equal(result_df[["A", "B", "C"]], sample_df)
+    assert result_df._mgr.nblocks <= 4
+
+
+def test_selector_insert_existing_column_raises_error(
+    sample_df: pd.DataFrame, editor_config: EditorConfig
+):
+    """Test inserting a column which already exists raises ValueError."""
+    selector = InMemorySelector(sample_df, Range(column=["D", "B"]), editor_config)
+    with pytest.raises(ValueError, match="cannot insert B, already exists"):
+        selector.insert(value=1)
+    pd.testing.assert_frame_equal(selector.df, sample_df)
@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+import pytest
+import sqlalchemy as sa
+
+from mcp_table_editor.editor import (
+    EditorConfig,
+    InMemoryEditor,
+    InsertRule,
+    WriteBehindEditor,
+)
+from mcp_table_editor.handler import CrudHandler
+from mcp_table_editor.handler._crud_handler import CrudInputSchema
+
+
+@pytest.fixture
+def sample_df() -> pd.DataFrame:
+    """Fixture for a DataFrame with ties and missing values."""
+    rng = np.random.default_rng(0)
+    n = 500
+    df = pd.DataFrame(
+        {
+            "k": rng.integers(0, 50, n).astype(float),
+            "s": rng.choice(list("abc"), n),
+            "v": rng.random(n),
+        }
+    )
+    df.loc[df.sample(20, random_state=1).index, "k"] = np.nan
+    return df
+
+
+@pytest.fixture
+def editor(sample_df: pd.DataFrame) -> InMemoryEditor:
+    editor = InMemoryEditor(sample_df.copy(), EditorConfig())
+    editor.sort(by=["k", "s"], ascending=False, keep_sorted=True)
+    return editor
+
+
+def assert_sorted(table: pd.DataFrame) -> None:
+    expected = table.sort_values(by=["k", "s"], ascending=False, kind="stable")
+    pd.testing.assert_frame_equal(table, expected)
+
+
+def test_keep_sorted_places_appended_rows(editor: InMemoryEditor):
+    """Test appended rows are placed in the order instead of at the end."""
+    editor.append([1000, 1001], 25.0)
+    editor.append([1002], pd.NA, InsertRule.EMPTY)
+    assert_sorted(editor.table)
+    assert editor.table.index[-1] == 1002
+    assert editor.version == 3
+
+
+def test_keep_sorted_moves_updated_rows(editor: InMemoryEditor):
+    """Test rows whose key is updated are moved, and the others stay in place."""
+    before = editor.table
+    handler = CrudHandler(editor)
+    handler.handle(
+        CrudInputSchema(
+            method="update", rows=[3, 7], columns=["k"], value=100, commit=True
+        )
+    )
+    table = editor.table
+    assert_sorted(table)
+    assert set(table.index[:2]) == {3, 7}
+    pd.testing.assert_index_equal(table.index[2:], before.index.drop([3, 7]))
+
+    # Updating other columns moves nothing.
+    handler.handle(
+        CrudInputSchema(method="update", rows=[3], columns=["v"], value=0, commit=True)
+    )
+    pd.testing.assert_index_equal(editor.table.index, table.index)
+
+
+def test_keep_sorted_handler_insert_and_delete(editor: InMemoryEditor):
+    """Test rows inserted and deleted through the handler keep the table sorted."""
+    handler = CrudHandler(editor)
+    handler.handle(CrudInputSchema(method="insert", rows=[2000], value=-1, commit=True))
+    handler.handle(CrudInputSchema(method="delete", rows=[5, 6], commit=True))
+    handler.handle(CrudInputSchema(method="remove", rows=[8, 9], commit=True))
+    table = editor.table
+    assert_sorted(table)
+    assert 2000 in table.index and 8 not in table.index
+
+
+def test_keep_sorted_is_forgotten(editor: InMemoryEditor, sample_df: pd.DataFrame):
+    """Test a sort without keep_sorted or dropping a key column forgets the order."""
+    editor.sort(by="v")
+    assert editor.sort_key is None
+    editor.append([1000], 1000.0)
+    assert editor.table.index[-1] == 1000
+
+    editor.sort(by=["k", "s"], keep_sorted=True)
+    editor.commit(editor.table.drop(columns=["s"]), rows=pd.Index([]))
+    assert editor.sort_key is None
+
+
+def test_failed_sort_keeps_sort_key(editor: InMemoryEditor):
+    """Test a sort that fails keeps the previous sort key."""
+    with pytest.raises(KeyError):
+        editor.sort(by="missing", keep_sorted=True)
+    assert editor.sort_key == (["k", "s"], False)
+    with pytest.raises(KeyError):
+        editor.sort_by_values("missing", ["a"])
+    assert editor.sort_key == (["k", "s"], False)
+
+
+def test_keep_sorted_write_behind(sample_df: pd.DataFrame, tmp_path):
+    """Test the write-behind editor commits appended rows to place them."""
+    url = f"sqlite:///{tmp_path / 'table.db'}"
+    editor = WriteBehindEditor(sample_df.copy(), EditorConfig(), url=url)
+    try:
+        editor.sort(by=["k", "s"], ascending=False, keep_sorted=True)
+        editor.append([1000], 25.0)
+        assert_sorted(editor.table)
+        editor.flush()
+        with sa.create_engine(url).connect() as conn:
+            stored = pd.read_sql_query("SELECT _id FROM data ORDER BY rowid", conn)
+        assert stored["_id"].tolist() == editor.table.index.tolist()
+    finally:
+        editor.close()
@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mcp_table_editor.editor import EditorConfig, InMemoryEditor, PartitionedEditor
+from mcp_table_editor.editor._range import Range
+from mcp_table_editor.handler import CrudHandler
+from mcp_table_editor.handler._crud_handler import CrudInputSchema
+
+AGGREGATIONS = {"v": ["sum", "mean", "count", "min", "max"], "n": ["sum", "max"]}
+
+
+@pytest.fixture
+def sample_df() -> pd.DataFrame:
+    """Fixture for a DataFrame with missing values and keys."""
+    rng = np.random.default_rng(0)
+    n = 300
+    df = pd.DataFrame(
+        {
+            "g": rng.integers(0, 6, n).astype(float),
+            "s": rng.choice(list("ab"), n),
+            "v": rng.normal(size=n),
+            "n": rng.integers(0, 100, n),
+        }
+    )
+    df.loc[df.sample(10, random_state=1).index, "g"] = np.nan
+    df.loc[df.sample(10, random_state=2).index, "v"] = np.nan
+    return df
+
+
+@pytest.fixture
+def editor(sample_df: pd.DataFrame) -> InMemoryEditor:
+    editor = InMemoryEditor(sample_df.copy(), EditorConfig())
+    editor.register_aggregate("by_g_s", ["g", "s"], AGGREGATIONS)
+    editor.register_aggregate("total", [], {"n": ["min", "mean"]})
+    return editor
+
+
+def assert_live(editor: InMemoryEditor) -> None:
+    """Check the live aggregates against aggregations computed from scratch."""
+    for name, by, aggregations in [
+        ("by_g_s", ["g", "s"], AGGREGATIONS),
+        ("total", [], {"n": ["min", "mean"]}),
+    ]:
+        pd.testing.assert_frame_equal(
+            editor.live_aggregate(name),
+            editor.group_by(by, aggregations),
+            check_dtype=False,
+            check_categorical=False,
+        )
+
+
+def test_live_aggregate_matches_group_by(editor: InMemoryEditor):
+    """Test the registered aggregates match group_by, and unsupported ones fail."""
+    assert_live(editor)
+    with pytest.raises(ValueError):
+        editor.register_aggregate("bad", "g", {"v": "nunique"})
+    with pytest.raises(KeyError):
+        editor.register_aggregate("bad", "missing", {"v": "sum"})
+    with pytest.raises(KeyError):
+        editor.live_aggregate("bad")
+
+
+def test_live_aggregate_follows_handler_edits(editor: InMemoryEditor):
+    """Test updates, deletes, inserts and removed rows update the aggregates."""
+    handler = CrudHandler(editor)
+    edits = [
+        dict(method="update", rows=[0, 1, 2], columns=["v"], value=100),
+        dict(method="update", rows=[3, 4], columns=["g"], value=7),
+        dict(method="delete", rows=[5, 6, 7]),
+        dict(method="insert", rows=[1000, 1001], value=2),
+        dict(method="remove", rows=[8, 9, 1000]),
+        dict(method="update", columns=["n"], value=1),
+    ]
+    for edit in edits:
+        handler.handle(CrudInputSchema(**edit, commit=True))
+        assert_live(editor)
+
+
+def test_live_aggregate_updates_changed_groups_only(editor: InMemoryEditor):
+    """Test an edit of known rows updates the groups without a recompute."""
+    aggregate = editor._live_aggregates["by_g_s"]
+    table = editor.table.copy()
+    table.loc[[10, 11], "v"] = -1000.0
+    editor.commit(table, rows=pd.Index([10, 11]))
+    assert not aggregate._stale
+    # The removed values may have been extremes, the new ones are minimums.
+    result = editor.live_aggregate("by_g_s")
+    assert result["v_min"].min() == -1000.0
+    assert_live(editor)
+
+    editor.commit(editor.table.copy(), rows=None)
+    assert aggregate._stale
+    assert_live(editor)
+
+
+def test_live_aggregate_appended_rows(editor: InMemoryEditor):
+    """Test buffered appended rows are added to the aggregates."""
+    editor.append([1000, 1001], 3.0)
+    editor.append(range(2000, 2100), 1.0)
+    assert editor._tail_index
+    assert_live(editor)
+
+
+def test_live_aggregate_is_forgotten_with_its_columns(editor: InMemoryEditor):
+    """Test dropping a column of an aggregate forgets it, and keeps the others."""
+    editor.commit(editor.table.drop(columns=["v"]), rows=pd.Index([]))
+    with pytest.raises(KeyError):
+        editor.live_aggregate("by_g_s")
+    pd.testing.assert_frame_equal(
+        editor.live_aggregate("total"),
+        editor.group_by([], {"n": ["min", "mean"]}),
+        check_dtype=False,
+    )
+    editor.unregister_aggregate("total")
+    assert not editor._live_aggregates
+
+
+def test_live_aggregate_partitioned(sample_df: pd.DataFrame):
+    """Test the operators of the partitioned editor update the aggregates."""
+    editor = PartitionedEditor(sample_df.copy(), EditorConfig(partition_rows=64))
+    editor.register_aggregate("by_g_s", ["g", "s"], AGGREGATIONS)
+    editor.register_aggregate("total", [], {"n": ["min", "mean"]})
+    editor.update(Range(row=[0, 100], column="n"), 1000)
+    assert_live(editor)
+    editor.delete(Range(row=[1, 2], column="v"))
+    assert_live(editor)
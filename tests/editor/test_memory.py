@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mcp_table_editor.editor import EditorConfig, InMemoryEditor
+from mcp_table_editor.editor._memory import MemoryAccount, compact_dtypes
+from mcp_table_editor.handler._crud_handler import (
+    CrudHandler,
+    CrudInputSchema,
+    Operation,
+)
+
+
+@pytest.fixture
+def sample_df() -> pd.DataFrame:
+    """Fixture for a DataFrame with numeric and object columns."""
+    n = 10_000
+    return pd.DataFrame(
+        {
+            "i": np.arange(n),
+            "f": np.linspace(0, 1, n),
+            "s": [f"value-{i % 97}" * (1 + i % 3) for i in range(n)],
+        },
+        index=[f"row-{i}" for i in range(n)],
+    )
+
+
+def test_memory_account_estimate_close_to_deep_usage(sample_df):
+    """Test the sampled estimate is close to the deep memory usage."""
+    account = MemoryAccount(sample_rows=500)
+    expected = sample_df.memory_usage(index=True, deep=True).sum()
+    assert account.estimate(sample_df) == pytest.approx(expected, rel=0.05)
+
+
+def test_memory_account_reuses_samples(sample_df):
+    """Test the estimate of object columns is reused until they are sampled again."""
+    account = MemoryAccount(sample_rows=500, resample_interval=3)
+    first = account.estimate(sample_df)
+    longer = sample_df.assign(s=sample_df["s"] * 10)
+    assert account.estimate(longer) == first
+    # The third estimate samples the columns again.
+    assert account.estimate(longer) > first
+
+
+def test_compact_dtypes_is_lossless():
+    """Test only the columns holding their values exactly in smaller dtypes are downcast."""
+    df = pd.DataFrame(
+        {
+            "small": np.arange(10, dtype="int64"),
+            "large": np.arange(10, dtype="int64") * 10**10,
+            "halves": np.arange(10) / 2,
+            "tenths": np.arange(10) / 10,
+            "s": list("abcdefghij"),
+        }
+    )
+    compacted = compact_dtypes(df)
+    assert compacted.dtypes.to_dict() == {
+        "small": np.dtype("int8"),
+        "large": np.dtype("int64"),
+        "halves": np.dtype("float32"),
+        "tenths": np.dtype("float64"),
+        "s": np.dtype("object"),
+    }
+    pd.testing.assert_frame_equal(compacted, df, check_dtype=False)
+    assert df["small"].dtype == np.dtype("int64")
+
+
+def test_commit_over_hard_limit_is_rejected(sample_df):
+    """Test edits growing the table over the hard limit are rejected."""
+    usage = InMemoryEditor(sample_df).memory_usage
+    editor = InMemoryEditor(sample_df, EditorConfig(memory_hard_limit=int(usage * 1.5)))
+    with pytest.raises(ValueError, match="memory limit"):
+        editor.commit(pd.concat([sample_df, sample_df]))
+    assert editor.table is sample_df
+    assert editor.version == 0
+
+    # Edits which do not grow the table are accepted, even over the limit.
+    editor.config = EditorConfig(memory_hard_limit=usage // 2)
+    editor.commit(sample_df.iloc[:-1])
+    assert len(editor.table) == len(sample_df) - 1
+
+
+def test_commit_over_soft_limit_compacts(sample_df, caplog):
+    """Test the table is compacted once it grows over the soft limit, if enabled,
+    and reported in the log otherwise."""
+    editor = InMemoryEditor(sample_df, EditorConfig(memory_soft_limit=1))
+    editor.commit(sample_df.copy())
+    assert editor.table["i"].dtype == np.dtype("int64")
+    assert "over the soft memory limit of 1 bytes" in caplog.text
+
+    config = EditorConfig(memory_soft_limit=1, memory_compact_dtypes=True)
+    editor = InMemoryEditor(sample_df, config)
+    before = editor.memory_usage
+    editor.commit(sample_df.copy())
+    assert editor.table["i"].dtype == np.dtype("int16")
+    assert editor.memory_usage < before
+    assert "i: int64 -> int16" in caplog.text
+
+
+def test_crud_response_includes_memory_usage(sample_df):
+    """Test the responses of the CRUD tools include the memory usage."""
+    editor = InMemoryEditor(sample_df.reset_index(drop=True))
+    handler = CrudHandler(editor)
+    response = handler.handle(
+        CrudInputSchema(method=Operation.GET, rows=[0], columns=["i"])
+    )
+    assert response.memory_usage == editor.memory_usage > 0
@@ -0,0 +1,89 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mcp_table_editor.editor import EditorConfig, InMemoryEditor
+
+
+@pytest.fixture(scope="module")
+def sample_df() -> pd.DataFrame:
+    """Fixture for a DataFrame with ties, missing values and signed zeros."""
+    rng = np.random.default_rng(0)
+    n = 5000
+    df = pd.DataFrame(
+        {
+            "f": rng.random(n).round(2) - 0.5,
+            "i": rng.integers(-5, 5, n),
+            "u": rng.integers(0, 3, n).astype("uint8"),
+            "b": rng.random(n) > 0.5,
+            "d": pd.to_datetime(rng.integers(0, 10, n), unit="D"),
+            "s": rng.choice(list("abc"), n),
+        }
+    )
+    df.loc[df.sample(200, random_state=1).index, "f"] = np.nan
+    df.loc[df.sample(200, random_state=2).index, "d"] = pd.NaT
+    df.loc[:9, "f"] = [-0.0, 0.0] * 5
+    return df
+
+
+@pytest.fixture(scope="module", params=[False, True], ids=["memory", "spill"])
+def editor_config(request, tmp_path_factory) -> EditorConfig:
+    """Fixture for EditorConfig merge sorting every table in runs of 700 rows."""
+    return EditorConfig(
+        sort_workers=2,
+        sort_min_rows=0,
+        sort_chunk_rows=700,
+        sort_spill_bytes=0 if request.param else None,
+        sort_spill_dir=str(tmp_path_factory.mktemp("spill")),
+    )
+
+
+@pytest.mark.parametrize(
+    "by, ascending",
+    [
+        (["f"], True),
+        (["f"], False),
+        (["i", "f"], True),
+        (["u", "b", "f"], False),
+        (["d", "i"], False),
+    ],
+)
+def test_merge_sort_matches_stable_sort_values(
+    sample_df: pd.DataFrame, editor_config: EditorConfig, by, ascending
+):
+    """Test the merge sort gives the same order as a stable sort of pandas."""
+    editor = InMemoryEditor(sample_df.copy(), editor_config)
+    editor.sort(by=by, ascending=ascending)
+    expected = sample_df.sort_values(by=by, ascending=ascending, kind="stable")
+    pd.testing.assert_frame_equal(editor.table, expected)
+    assert editor.version == 1
+
+
+def test_merge_sort_falls_back_for_object_keys(
+    sample_df: pd.DataFrame, editor_config: EditorConfig
+):
+    """Test columns of Python objects are sorted by pandas."""
+    editor = InMemoryEditor(sample_df.copy(), editor_config)
+    editor.sort(by=["s", "i"])
+    expected = sample_df.sort_values(by=["s", "i"])
+    pd.testing.assert_frame_equal(editor.table, expected)
+
+
+def test_merge_sort_by_values(sample_df: pd.DataFrame, editor_config: EditorConfig):
+    """Test sorting by the order of listed values with the merge sort."""
+    editor = InMemoryEditor(sample_df.copy(), editor_config)
+    editor.sort_by_values(["s"], [["c", "a"]])
+    order = sample_df["s"].map({"c": 0, "a": 1, "b": 2})
+    expected = sample_df.iloc[np.argsort(order.to_numpy(), kind="stable")]
+    pd.testing.assert_frame_equal(editor.table, expected)
+
+
+def test_merge_sort_removes_spilled_runs(
+    sample_df: pd.DataFrame, editor_config: EditorConfig
+):
+    """Test no temporary file is left in the spill directory."""
+    editor = InMemoryEditor(sample_df.copy(), editor_config)
+    editor.sort(by=["i", "f"])
+    assert os.listdir(editor_config.sort_spill_dir) == []
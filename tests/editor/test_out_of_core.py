@@ -0,0 +1,157 @@
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mcp_table_editor.editor import EditorConfig, KeyRange, Range
+from mcp_table_editor.handler import CrudHandler
+from mcp_table_editor.handler._crud_handler import CrudInputSchema, Operation
+from mcp_table_editor.handler._sort_by_value_handler import (
+    SortByValueHandler,
+    SortByValueInputSchema,
+)
+from mcp_table_editor.handler._sort_handler import SortHandler, SortInputSchema
+
+pytest.importorskip("pyarrow")
+
+from mcp_table_editor.editor._out_of_core import (  # noqa: E402
+    OutOfCoreEditor,
+    parse_conditions,
+)
+
+
+@pytest.fixture
+def sample_df() -> pd.DataFrame:
+    """Fixture for a DataFrame sorted by its id, with missing values."""
+    rng = np.random.default_rng(0)
+    n = 5000
+    df = pd.DataFrame(
+        {
+            "id": np.arange(n),
+            "region": rng.choice(["north", "south", "east"], n),
+            "price": rng.random(n).round(3),
+            "units": rng.integers(0, 20, n),
+        }
+    )
+    df.loc[df.sample(100, random_state=1).index, "price"] = np.nan
+    return df
+
+
+@pytest.fixture
+def editor(tmp_path, sample_df: pd.DataFrame) -> OutOfCoreEditor:
+    sample_df.to_csv(tmp_path / "table.csv", index=False)
+    config = EditorConfig(
+        out_of_core_block_bytes=8 * 1024,
+        out_of_core_memory_limit=256 * 1024,
+        out_of_core_dir=str(tmp_path),
+    )
+    editor = OutOfCoreEditor.from_csv(tmp_path / "table.csv", config)
+    yield editor
+    editor.close()
+
+
+def test_out_of_core_get(editor: OutOfCoreEditor, sample_df: pd.DataFrame):
+    """Test cells are read from the row groups holding them."""
+    assert editor.store.row_groups > 10
+    assert editor.shape == sample_df.shape
+    assert editor.columns.tolist() == sample_df.columns.tolist()
+
+    result = CrudHandler(editor).handle(
+        CrudInputSchema(method=Operation.GET, rows=[4000, 7, 2500], columns=None)
+    )
+    expected = sample_df.loc[[4000, 7, 2500]]
+    pd.testing.assert_frame_equal(
+        pd.read_csv(StringIO(result.content), index_col=0), expected
+    )
+    assert editor.store.row_groups_read == 3
+
+    selected = editor.select(Range(cell=(KeyRange(100, 120), ["price", "id"]))).df
+    pd.testing.assert_frame_equal(
+        selected, sample_df.loc[100:120, ["price", "id"]], check_index_type=False
+    )
+    with pytest.raises(KeyError):
+        editor.select(Range(row=[len(sample_df)]))
+
+
+def test_out_of_core_filter(editor: OutOfCoreEditor, sample_df: pd.DataFrame):
+    """Test filters match pandas and skip row groups by their statistics."""
+    query = "id >= 4500 and region == 'north' and price < 0.5"
+    pd.testing.assert_frame_equal(
+        editor.query_expr(query), sample_df.query(query), check_index_type=False
+    )
+    # Only the row groups holding ids from 4500 are read.
+    last = np.searchsorted(editor.store.offsets, 4500, side="right") - 1
+    assert editor.store.row_groups_read <= 2 * (editor.store.row_groups - last)
+
+    assert editor.query_expr("id < 0").empty
+    pd.testing.assert_frame_equal(
+        editor.query_expr("units * 2 > 30 or price != price"),
+        sample_df.query("units * 2 > 30 or price != price"),
+        check_index_type=False,
+    )
+    assert parse_conditions("(10 < id) & (x == 'a' or y > 1) and z <= 3.5") == [
+        ("z", "<=", 3.5),
+        ("id", ">", 10),
+    ]
+
+
+def test_out_of_core_group_by(editor: OutOfCoreEditor, sample_df: pd.DataFrame):
+    """Test aggregations combine the partial aggregates of the row groups."""
+    result = editor.group_by("region", {"price": ["sum", "mean", "max"]})
+    expected = (
+        sample_df.groupby("region")
+        .agg(
+            price_sum=("price", "sum"),
+            price_mean=("price", "mean"),
+            price_max=("price", "max"),
+        )
+        .reset_index()
+    )
+    pd.testing.assert_frame_equal(result, expected)
+    assert editor.group_by("region", {"price": ["sum", "mean", "max"]}) is result
+    with pytest.raises(ValueError):
+        editor.group_by("region", {"units": "nunique"})
+
+
+def test_out_of_core_memory_limit(editor: OutOfCoreEditor):
+    """Test reads over the memory limit and edits are rejected."""
+    with pytest.raises(ValueError):
+        editor.select(Range(row=slice(None)))
+    with pytest.raises(ValueError):
+        editor.query_expr("units >= 0")
+    with pytest.raises(ValueError):
+        editor.commit(pd.DataFrame())
+    with pytest.raises(ValueError):
+        editor.append([5000])
+    with pytest.raises(ValueError):
+        SortHandler(editor).handle(SortInputSchema(by=["price"]))
+    with pytest.raises(ValueError):
+        SortByValueHandler(editor).handle(
+            SortByValueInputSchema(by=["region"], values=[["south", "north"]])
+        )
+    assert editor.version == 0
+
+    for _ in editor.store.scan(editor.columns):
+        assert editor.memory_usage <= editor.store.memory_limit // 2
+
+
+def test_ingest_csv_blocks(tmp_path):
+    """Test blocks end at the end of records, and types are checked."""
+    lines = ["id,note"] + [f'{i},"line {i}\nnext, ""{i}"""' for i in range(200)]
+    (tmp_path / "notes.csv").write_text("\n".join(lines))
+    config = EditorConfig(out_of_core_block_bytes=256)
+    editor = OutOfCoreEditor.from_csv(tmp_path / "notes.csv", config)
+    assert editor.store.row_groups > 10
+    assert editor.select(Range(row=[199])).df.at[199, "note"] == 'line 199\nnext, "199"'
+    editor.close()
+
+    lines = ["id,value"] + [f"{i},{i}" for i in range(100)] + ["100,1.5"]
+    (tmp_path / "types.csv").write_text("\n".join(lines))
+    with pytest.raises(ValueError):
+        OutOfCoreEditor.from_csv(tmp_path / "types.csv", config)
+    editor = OutOfCoreEditor.from_csv(
+        tmp_path / "types.csv", config, column_types={"value": "float64"}
+    )
+    assert editor.query_expr("value == 1.5").index.tolist() == [100]
+    editor.close()
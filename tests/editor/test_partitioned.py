@@ -0,0 +1,260 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mcp_table_editor.editor import (
+    EditorConfig,
+    InMemoryEditor,
+    KeyRange,
+    PartitionedEditor,
+    Range,
+)
+from mcp_table_editor.editor._partitioned import PartitionedTable
+from mcp_table_editor.handler._crud_handler import (
+    CrudHandler,
+    CrudInputSchema,
+    Operation,
+)
+
+
+@pytest.fixture
+def sample_df() -> pd.DataFrame:
+    """Fixture for a DataFrame split into several chunks."""
+    n = 100
+    return pd.DataFrame(
+        {
+            "i": np.arange(n),
+            "f": np.linspace(0, 1, n),
+            "s": [f"value-{i % 7}" for i in range(n)],
+        },
+        index=np.arange(n) * 2,
+    )
+
+
+@pytest.fixture
+def editor_config() -> EditorConfig:
+    """Fixture for EditorConfig with small chunks and several threads."""
+    return EditorConfig(partition_rows=16, partition_workers=4)
+
+
+@pytest.mark.parametrize(
+    "cell_range",
+    [
+        Range(row=[40, 2, 150]),
+        Range(row=KeyRange(33, 101)),
+        Range(row=KeyRange(None, 20)),
+        Range(row=slice(10, 90, 7)),
+        Range(column=["s", "i"]),
+        Range(cell=(slice(30, 35), ["f"])),
+        Range(cell=(KeyRange(50, 60), slice(0, 2))),
+    ],
+)
+def test_partitioned_select_matches_in_memory(
+    sample_df: pd.DataFrame, editor_config: EditorConfig, cell_range: Range
+):
+    """Test selecting a range from the chunks gives the same cells as pandas."""
+    expected = InMemoryEditor(sample_df, editor_config).select(cell_range).get()
+    result = PartitionedEditor(sample_df, editor_config).select(cell_range).get()
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_partitioned_select_visits_overlapping_chunks(sample_df: pd.DataFrame):
+    """Test only the chunks overlapping the rows are visited."""
+    table = PartitionedTable.from_frame(sample_df, 16)
+    assert [i for i, _ in table.select_rows((40, 70))] == [1, 2]
+    assert [i for i, _ in table.select_rows([0, 198])] == [0, 6]
+    assert [i for i, _ in table.select_rows(slice(30, 34))] == [1, 2]
+
+
+def test_partitioned_update_copies_only_changed_chunks(
+    sample_df: pd.DataFrame, editor_config: EditorConfig
+):
+    """Test updating a range replaces only the chunks overlapping it."""
+    editor = PartitionedEditor(sample_df, editor_config)
+    before = list(editor.partitions.chunks)
+    editor.update(Range(cell=([40, 42], ["f"])), -1.0)
+
+    after = editor.partitions.chunks
+    assert [a is b for a, b in zip(before, after)] == [
+        True,
+        False,
+        True,
+        True,
+        True,
+        True,
+        True,
+    ]
+    assert editor.version == 1
+    expected = sample_df.copy()
+    expected.loc[[40, 42], "f"] = -1.0
+    pd.testing.assert_frame_equal(editor.table, expected)
+    # The original table is left unchanged.
+    assert sample_df.loc[40, "f"] != -1.0
+
+    editor.delete(Range(column=["s"]))
+    assert editor.table["s"].isna().all()
+    with pytest.raises(KeyError):
+        editor.update(Range(column=["missing"]), 1)
+
+
+def test_partitioned_aggregate_and_filter(
+    sample_df: pd.DataFrame, editor_config: EditorConfig
+):
+    """Test aggregates and filters combine the results of the chunks."""
+    editor = PartitionedEditor(sample_df, editor_config)
+    funcs = ["sum", "count", "min", "max", "mean"]
+    pd.testing.assert_frame_equal(
+        editor.aggregate(funcs, ["i", "f"]),
+        sample_df[["i", "f"]].agg(funcs),
+        check_dtype=False,
+    )
+    assert editor.aggregate("sum", ["i"])["i"] == sample_df["i"].sum()
+    with pytest.raises(ValueError, match="Unsupported aggregates"):
+        editor.aggregate("median")
+
+    pd.testing.assert_frame_equal(
+        editor.filter("i % 9 == 0 and f > 0.2"),
+        sample_df.query("i % 9 == 0 and f > 0.2"),
+    )
+
+
+def test_partitioned_editor_appends_and_sorts(
+    sample_df: pd.DataFrame, editor_config: EditorConfig
+):
+    """Test appended and sorted rows are split into chunks again."""
+    editor = PartitionedEditor(sample_df, editor_config)
+    editor.append([200, 202], 5)
+    assert editor.shape == (102, 3)
+    assert editor.select(Range(row=[202])).get()["i"].tolist() == [5]
+    assert sum(len(chunk) for chunk in editor.partitions.chunks) == 102
+
+    editor.sort("f", ascending=False)
+    # The appended rows hold the largest values.
+    assert editor.partitions.chunks[0].index.tolist()[:3] == [200, 202, 198]
+    assert max(len(chunk) for chunk in editor.partitions.chunks) == 16
+    pd.testing.assert_frame_equal(editor.partitions.to_frame(), editor.table)
+
+
+def test_partitioned_editor_with_crud_handler(
+    sample_df: pd.DataFrame, editor_config: EditorConfig
+):
+    """Test the CRUD handler works on a partitioned editor."""
+    editor = PartitionedEditor(sample_df, editor_config)
+    handler = CrudHandler(editor)
+    handler.handle(
+        CrudInputSchema(
+            method=Operation.UPDATE, rows=[4], columns=["i"], value=-5, commit=True
+        )
+    )
+    response = handler.handle(
+        CrudInputSchema(method=Operation.GET, rows=[4, 6], columns=["i"])
+    )
+    assert response.json_content == [{"i": -5}, {"i": 3}]
+    assert len(editor.partitions.chunks) == 7
+
+
+def test_partitioned_update_keeps_invariants(
+    sample_df: pd.DataFrame, editor_config: EditorConfig
+):
+    """Test chunk updates keep the sort order, live aggregates and memory limits."""
+    editor = PartitionedEditor(sample_df, editor_config)
+    editor.sort("f", ascending=False, keep_sorted=True)
+    editor.register_aggregate("by_s", "s", {"i": ["sum", "max"]})
+    editor.update(Range(cell=([40], ["f"])), 2.0)
+    editor.update(Range(cell=([42, 44], ["i"])), 1000)
+    assert editor.table.index[0] == 40
+    pd.testing.assert_frame_equal(
+        editor.table, editor.table.sort_values("f", ascending=False, kind="stable")
+    )
+    pd.testing.assert_frame_equal(
+        editor.live_aggregate("by_s"),
+        editor.group_by("s", {"i": ["sum", "max"]}),
+        check_dtype=False,
+        check_categorical=False,
+    )
+
+    limited = PartitionedEditor(
+        sample_df, editor_config.model_copy(update={"memory_hard_limit": 1})
+    )
+    with pytest.raises(ValueError):
+        limited.update(Range(column=["i"]), "x" * 1000)
+    assert limited.version == 0
+
+
+def test_partitioned_crud_update_copies_only_changed_chunks(
+    sample_df: pd.DataFrame, editor_config: EditorConfig
+):
+    """Test the CRUD handler updates and deletes cells chunk by chunk."""
+    editor = PartitionedEditor(sample_df, editor_config)
+    handler = CrudHandler(editor)
+    before = list(editor.partitions.chunks)
+    handler.handle(
+        CrudInputSchema(
+            method=Operation.UPDATE, rows=[40], columns=["f"], value=-1.0, commit=True
+        )
+    )
+    handler.handle(
+        CrudInputSchema(method=Operation.DELETE, rows=[42], columns=["s"], commit=True)
+    )
+    changed = [a is not b for a, b in zip(before, editor.partitions.chunks)]
+    assert changed == [False, True, False, False, False, False, False]
+    assert editor.table.loc[40, "f"] == -1.0
+    assert pd.isna(editor.table.loc[42, "s"])
+    assert editor.version == 2
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        CrudInputSchema(method=Operation.GET, rows=[40], columns=["f"]),
+        CrudInputSchema(
+            method=Operation.GET, rows=[40, 2], columns=["f"], return_columns=["s"]
+        ),
+        CrudInputSchema(
+            method=Operation.UPDATE,
+            rows=[40],
+            columns=["f"],
+            value=-1.0,
+            commit=True,
+            response_mode="diff",
+        ),
+        CrudInputSchema(
+            method=Operation.DELETE,
+            rows=[42],
+            columns=["s"],
+            commit=True,
+            response_mode="diff",
+        ),
+    ],
+)
+def test_partitioned_crud_does_not_join_the_table(
+    sample_df: pd.DataFrame,
+    editor_config: EditorConfig,
+    monkeypatch: pytest.MonkeyPatch,
+    args: CrudInputSchema,
+):
+    """Test getters and diffs of cells are read from the chunks of the range only."""
+    expected = CrudHandler(InMemoryEditor(sample_df.copy(), editor_config)).handle(args)
+    editor = PartitionedEditor(sample_df, editor_config)
+    editor._frame = None
+
+    def to_frame(self):
+        raise AssertionError("The table is joined from its chunks.")
+
+    monkeypatch.setattr(PartitionedTable, "to_frame", to_frame)
+    result = CrudHandler(editor).handle(args)
+    # The memory of the chunks is estimated separately.
+    exclude = {"memory_usage"}
+    assert result.model_dump(exclude=exclude) == expected.model_dump(exclude=exclude)
+
+
+def test_partitioned_label_range_on_unsorted_labels(
+    sample_df: pd.DataFrame, editor_config: EditorConfig
+):
+    """Test a label range over unsorted labels selects the positions between its
+    bounds across the chunks, like `.loc`."""
+    shuffled = sample_df.sample(frac=1, random_state=0)
+    start, stop = shuffled.index[5], shuffled.index[40]
+    editor = PartitionedEditor(shuffled, editor_config)
+    result = editor.select(Range(row=KeyRange(start, stop))).get()
+    pd.testing.assert_frame_equal(result, shuffled.loc[start:stop])
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mcp_table_editor.editor import EditorConfig, InMemoryEditor, KeyRange, Range
+from mcp_table_editor.editor._plan import Filter, Project, Scan, Sort, TopK
+
+
+@pytest.fixture
+def sample_df() -> pd.DataFrame:
+    """Fixture for a DataFrame with ties and missing values."""
+    rng = np.random.default_rng(0)
+    n = 1000
+    df = pd.DataFrame(
+        {
+            "a": rng.integers(0, 50, n),
+            "b": rng.random(n).round(2),
+            "c": rng.choice(list("xyz"), n),
+            "d": rng.random(n),
+        },
+        index=np.arange(n) * 2,
+    )
+    df.loc[df.sample(50, random_state=1).index, "b"] = np.nan
+    return df
+
+
+@pytest.fixture
+def editor(sample_df: pd.DataFrame) -> InMemoryEditor:
+    return InMemoryEditor(sample_df.copy(), EditorConfig())
+
+
+def test_plan_matches_eager_pipeline(editor: InMemoryEditor, sample_df: pd.DataFrame):
+    """Test an optimized plan returns the rows of the eager pandas pipeline."""
+    plan = (
+        editor.plan()
+        .select(Range(row=KeyRange(200, 1800)))
+        .sort(["c", "b"], ascending=[True, False])
+        .filter("a > 10 and c != 'x'")
+        .project(["b", "a"])
+        .limit(25)
+    )
+    expected = (
+        sample_df.loc[200:1800]
+        .sort_values(["c", "b"], ascending=[True, False], kind="stable")
+        .query("a > 10 and c != 'x'")[["b", "a"]]
+        .head(25)
+    )
+    pd.testing.assert_frame_equal(plan.collect(), expected)
+
+    cells = editor.plan().select(Range(cell=([10, 4, 8], ["d", "a"]))).collect()
+    pd.testing.assert_frame_equal(cells, sample_df.loc[[10, 4, 8], ["d", "a"]])
+    pd.testing.assert_frame_equal(editor.plan().collect(), sample_df)
+
+
+def test_plan_optimizations(editor: InMemoryEditor):
+    """Test filters are pushed down and fused, columns pruned and limits fused."""
+    plan = (
+        editor.plan()
+        .sort("b")
+        .filter("a > 3")
+        .project(["b"])
+        .filter("b < 0.5")
+        .limit(50)
+        .limit(10)
+    )
+    assert plan.optimize().operators == (
+        Scan(None, ("a", "b")),
+        Filter("(a > 3) and (b < 0.5)", ("a", "b")),
+        TopK(("b",), (True,), 10),
+        Project(("b",)),
+    )
+    explain = plan.explain()
+    assert explain.index("Logical plan:") < explain.index("Optimized plan:")
+    assert "TopK(by=['b'], ascending=[True], k=10)" in explain
+
+    # A sort without a limit stays a sort, and all the columns are returned.
+    operators = editor.plan().sort("a").optimize().operators
+    assert operators == (Scan(None, ("a", "b", "c", "d")), Sort(("a",), (True,)))
+
+
+def test_plan_checks_columns(editor: InMemoryEditor):
+    """Test operators using columns which are not in their input are rejected."""
+    with pytest.raises(KeyError):
+        editor.plan().project(["a"]).filter("b > 0").collect()
+    with pytest.raises(KeyError):
+        editor.plan().sort("missing").collect()
+    with pytest.raises(KeyError):
+        editor.plan().select(Range(row=[1, 2])).collect()
+    with pytest.raises(ValueError):
+        editor.plan().filter("a > 0").select(Range(row=[0]))
+    with pytest.raises(ValueError):
+        editor.plan().limit(-1)
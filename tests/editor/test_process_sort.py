@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mcp_table_editor.editor import EditorConfig, InMemoryEditor
+
+
+@pytest.fixture(scope="module")
+def sample_df() -> pd.DataFrame:
+    """Fixture for a DataFrame with ties and missing values."""
+    rng = np.random.default_rng(0)
+    n = 5000
+    df = pd.DataFrame(
+        {
+            "f": rng.random(n).round(2),
+            "i": rng.integers(-5, 5, n),
+            "u": rng.integers(0, 3, n).astype("uint8"),
+            "b": rng.random(n) > 0.5,
+            "s": rng.choice(list("abc"), n),
+        }
+    )
+    df.loc[df.sample(200, random_state=1).index, "f"] = np.nan
+    return df
+
+
+@pytest.fixture(scope="module")
+def editor_config() -> EditorConfig:
+    """Fixture for EditorConfig sorting every table in the process pool."""
+    return EditorConfig(process_workers=2, process_min_rows=0)
+
+
+@pytest.mark.parametrize(
+    "by, ascending",
+    [
+        (["f"], True),
+        (["f"], False),
+        (["i", "f"], True),
+        (["u", "b", "f"], False),
+    ],
+)
+def test_process_sort_matches_stable_sort_values(
+    sample_df: pd.DataFrame, editor_config: EditorConfig, by, ascending
+):
+    """Test sorting in the process pool gives the same order as pandas."""
+    editor = InMemoryEditor(sample_df.copy(), editor_config)
+    editor.sort(by=by, ascending=ascending)
+    expected = sample_df.sort_values(by=by, ascending=ascending, kind="stable")
+    pd.testing.assert_frame_equal(editor.table, expected)
+    assert editor.version == 1
+
+
+def test_process_sort_falls_back_for_non_numeric_keys(
+    sample_df: pd.DataFrame, editor_config: EditorConfig
+):
+    """Test columns which are not numeric are sorted in the calling thread."""
+    editor = InMemoryEditor(sample_df.copy(), editor_config)
+    editor.sort(by=["s", "i"])
+    expected = sample_df.sort_values(by=["s", "i"])
+    pd.testing.assert_frame_equal(editor.table, expected)
+
+
+def test_process_sort_by_values(sample_df: pd.DataFrame, editor_config: EditorConfig):
+    """Test sorting by the order of listed values in the process pool."""
+    editor = InMemoryEditor(sample_df.copy(), editor_config)
+    editor.sort_by_values(["s"], [["c", "a"]])
+    order = sample_df["s"].map({"c": 0, "a": 1, "b": 2})
+    expected = sample_df.iloc[np.argsort(order.to_numpy(), kind="stable")]
+    pd.testing.assert_frame_equal(editor.table, expected)
+
+
+def test_process_sort_reuses_sorted_keys(
+    sample_df: pd.DataFrame, editor_config: EditorConfig
+):
+    """Test the keys sorted by the workers are shared by the next sort."""
+    editor = InMemoryEditor(sample_df.copy(), editor_config)
+    editor.sort(by=["i", "f"])
+    shared = editor._shared_table()
+    np.testing.assert_array_equal(shared.array("i"), editor.table["i"].to_numpy())
+    np.testing.assert_array_equal(shared.array("f"), editor.table["f"].to_numpy())
+    shared.share("f", lambda: pytest.fail("The sorted keys are copied again."))
+
+    editor.sort(by=["f"], ascending=False)
+    expected = sample_df.sort_values(by=["i", "f"], kind="stable").sort_values(
+        by=["f"], ascending=False, kind="stable"
+    )
+    pd.testing.assert_frame_equal(editor.table, expected)
+
+    editor.close()
+    assert editor._shared is None
@@ -0,0 +1,67 @@
+import pandas as pd
+import pytest
+
+from mcp_table_editor.editor import InMemoryEditor, Range
+from mcp_table_editor.editor._config import EditorConfig
+
+pytest.importorskip("duckdb")
+
+
+@pytest.fixture
+def sample_df() -> pd.DataFrame:
+    """Fixture for a sample DataFrame."""
+    data = {
+        "city": ["tokyo", "osaka", "tokyo", "nagoya"],
+        "sales": [10, 20, 30, 40],
+    }
+    return pd.DataFrame(data, index=["a", "b", "c", "d"])
+
+
+@pytest.fixture
+def editor(sample_df: pd.DataFrame) -> InMemoryEditor:
+    """Fixture for Editor."""
+    return InMemoryEditor(table=sample_df.copy(), config=EditorConfig.default())
+
+
+def test_query_sql_filter_keeps_index(editor: InMemoryEditor, sample_df: pd.DataFrame):
+    """Test filtering rows returns the original index labels."""
+    result = editor.query_sql("SELECT * FROM data WHERE sales >= 20 ORDER BY _id")
+    expected = sample_df[sample_df["sales"] >= 20]
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_query_sql_aggregation(editor: InMemoryEditor):
+    """Test aggregating without the _id column returns a plain DataFrame."""
+    result = editor.query_sql(
+        "SELECT city, SUM(sales) AS total FROM data GROUP BY city ORDER BY city"
+    )
+    assert result["city"].tolist() == ["nagoya", "osaka", "tokyo"]
+    assert result["total"].tolist() == [40, 20, 40]
+
+
+def test_query_sql_join_with_other_table(editor: InMemoryEditor):
+    """Test joining the table with an additional named table."""
+    regions = pd.DataFrame(
+        {"city": ["tokyo", "osaka", "nagoya"], "region": ["kanto", "kansai", "chubu"]}
+    )
+    result = editor.query_sql(
+        "SELECT data._id, region FROM data JOIN regions USING (city) ORDER BY data._id",
+        tables={"regions": regions},
+    )
+    assert result.index.tolist() == ["a", "b", "c", "d"]
+    assert result["region"].tolist() == ["kanto", "kansai", "kanto", "chubu"]
+
+
+def test_query_sql_result_is_selectable(editor: InMemoryEditor):
+    """Test the result can be used to select rows with the existing selectors."""
+    result = editor.query_sql("SELECT _id FROM data WHERE city = 'tokyo' ORDER BY _id")
+    selected = editor.select(Range(row=result.index.tolist())).get()
+    assert selected["sales"].tolist() == [10, 30]
+
+
+def test_query_sql_does_not_modify_table(
+    editor: InMemoryEditor, sample_df: pd.DataFrame
+):
+    """Test the table is left untouched by the query."""
+    editor.query_sql("SELECT * FROM data")
+    pd.testing.assert_frame_equal(editor.table, sample_df)
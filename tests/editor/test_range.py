@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mcp_table_editor.editor._config import EditorConfig
+from mcp_table_editor.editor._in_memory_selector import InMemorySelector
+from mcp_table_editor.editor._range import KeyRange, Range
+
+
+@pytest.fixture
+def sample_df() -> pd.DataFrame:
+    """Fixture for a DataFrame with sorted labels."""
+    data = {"A": np.arange(6), "B": np.arange(6) * 10, "C": np.arange(6) * 100}
+    return pd.DataFrame(data, index=["a", "b", "c", "d", "e", "f"])
+
+
+@pytest.fixture
+def editor_config() -> EditorConfig:
+    """Fixture for EditorConfig."""
+    return EditorConfig(max_columns=100, max_rows=1000)
+
+
+@pytest.mark.parametrize(
+    "keys, expected",
+    [
+        (slice(1, 3), ["b", "c"]),
+        (slice(None, 2), ["a", "b"]),
+        (slice(4, None), ["e", "f"]),
+        (slice(None, None, 2), ["a", "c", "e"]),
+        (slice(-2, None), ["e", "f"]),
+    ],
+)
+def test_range_slice_selects_positions(sample_df, keys, expected):
+    """Test slices select rows by position, with open and negative bounds."""
+    cell_range = Range(row=keys)
+    assert cell_range.get_index(sample_df.index).tolist() == expected
+    positions = cell_range.get_index_positions(sample_df.index)
+    assert sample_df.index[positions].tolist() == expected
+
+
+def test_range_slice_without_labels_is_lazy():
+    """Test a slice is resolved to a RangeIndex without the labels."""
+    index = Range(row=slice(0, 1_000_000_000, 2)).get_index()
+    assert isinstance(index, pd.RangeIndex)
+    assert len(index) == 500_000_000
+    with pytest.raises(ValueError):
+        Range(row=slice(5, None)).get_index()
+
+
+@pytest.mark.parametrize(
+    "keys, expected",
+    [
+        (KeyRange("b", "d"), ["b", "c", "d"]),
+        (KeyRange("bb", "dd"), ["c", "d"]),
+        (KeyRange(None, "b"), ["a", "b"]),
+        (KeyRange("e", None), ["e", "f"]),
+        (KeyRange("x", "z"), []),
+    ],
+)
+def test_range_label_range_on_sorted_labels(sample_df, keys, expected):
+    """Test a label range selects the labels between its bounds by binary search."""
+    cell_range = Range(row=keys)
+    assert cell_range.get_index(sample_df.index).tolist() == expected
+    assert isinstance(cell_range.get_index_positions(sample_df.index), slice)
+
+
+def test_range_label_range_on_unsorted_labels(sample_df):
+    """Test a label range on unsorted labels selects the positions between its
+    bounds, like `.loc`."""
+    df = sample_df.iloc[[3, 0, 5, 1, 4, 2]]
+    cell_range = Range(row=KeyRange("a", "b"))
+    assert cell_range.get_index(df.index).tolist() == ["a", "f", "b"]
+    assert cell_range.get_index_positions(df.index) == slice(1, 4, 1)
+    assert cell_range.get_index(df.index).equals(df.loc["a":"b"].index)
+    with pytest.raises(KeyError):
+        Range(row=KeyRange("a", "x")).get_index(df.index)
+    with pytest.raises(ValueError):
+        cell_range.get_index()
+
+
+def test_range_tuple_is_a_list_of_labels(sample_df):
+    """Test a tuple of two labels selects those labels, not the labels between."""
+    assert Range(row=("b", "d")).get_index(sample_df.index).tolist() == ["b", "d"]
+
+
+def test_range_label_range_of_other_type(sample_df):
+    """Test a label range which cannot be compared with the labels is rejected."""
+    with pytest.raises(ValueError, match="cannot be compared"):
+        Range(row=KeyRange(1, 3)).get_index(sample_df.index)
+    # A string bound must not be read as a dtype by pandas.
+    with pytest.raises(ValueError, match="cannot be compared"):
+        Range(row=KeyRange("int64", None)).get_index(pd.RangeIndex(5))
+
+
+def test_selector_get_slice_is_a_view(sample_df, editor_config):
+    """Test selecting a positional window does not copy the data."""
+    selector = InMemorySelector(sample_df, Range(row=slice(1, 4)), editor_config)
+    result = selector.get()
+    pd.testing.assert_frame_equal(result, sample_df.iloc[1:4])
+    assert np.shares_memory(result["A"].to_numpy(), sample_df["A"].to_numpy())
+
+
+def test_selector_get_label_ranges(sample_df, editor_config):
+    """Test selecting cells with label ranges on both axes."""
+    selector = InMemorySelector(
+        sample_df, Range(cell=(KeyRange("b", "c"), KeyRange("B", None))), editor_config
+    )
+    pd.testing.assert_frame_equal(selector.get(), sample_df.loc["b":"c", "B":])
+
+
+def test_selector_update_label_range(sample_df, editor_config):
+    """Test updating a label range leaves the original dataframe unchanged."""
+    original_df = sample_df.copy()
+    selector = InMemorySelector(
+        sample_df, Range(cell=(KeyRange("b", "c"), ["A"])), editor_config
+    )
+    result = selector.update(-1)
+    assert result["A"].tolist() == [0, -1, -1, 3, 4, 5]
+    pd.testing.assert_frame_equal(sample_df, original_df)
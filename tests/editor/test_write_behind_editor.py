@@ -0,0 +1,171 @@
+import time
+
+import pandas as pd
+import pytest
+import sqlalchemy as sa
+
+from mcp_table_editor.editor import EditorConfig, Range, WriteBehindEditor
+
+
+@pytest.fixture
+def sample_df() -> pd.DataFrame:
+    """Fixture for a sample DataFrame."""
+    data = {"A": [1, 2, 3], "B": ["x", "y", "z"]}
+    return pd.DataFrame(data, index=[10, 11, 12])
+
+
+@pytest.fixture
+def editor_config() -> EditorConfig:
+    """Fixture for EditorConfig which never flushes on its own."""
+    return EditorConfig(flush_interval=3600, flush_rows=1_000_000)
+
+
+@pytest.fixture
+def url(tmp_path) -> str:
+    return f"sqlite:///{tmp_path / 'table.db'}"
+
+
+def read_store(url: str) -> pd.DataFrame:
+    engine = sa.create_engine(url)
+    with engine.connect() as conn:
+        df = pd.read_sql_query(
+            "SELECT * FROM data ORDER BY rowid", conn, index_col="_id"
+        )
+    df.index.name = None
+    return df
+
+
+def test_write_behind_defers_writes_until_flush(
+    sample_df: pd.DataFrame, editor_config: EditorConfig, url: str
+):
+    """Test edits are served from memory and written only on flush."""
+    editor = WriteBehindEditor(sample_df.copy(), editor_config, url=url)
+    editor.flush()
+    selector = editor.select(Range(cell=([11], ["A"])))
+    editor.commit(selector.update(20), rows=pd.Index([11]))
+
+    assert editor.table.loc[11, "A"] == 20
+    assert editor.flushed_version < editor.version
+    assert read_store(url).loc[11, "A"] == 2
+
+    assert editor.flush() == editor.version
+    assert read_store(url).loc[11, "A"] == 20
+    editor.close()
+
+
+def test_write_behind_row_level_changes(
+    sample_df: pd.DataFrame, editor_config: EditorConfig, url: str
+):
+    """Test inserted, updated and dropped rows are written to the store."""
+    editor = WriteBehindEditor(sample_df.copy(), editor_config, url=url)
+    editor.commit(editor.select(Range(row=[13])).insert(value=pd.NA))
+    editor.commit(editor.select(Range(row=[10])).drop(), rows=pd.Index([]))
+    editor.commit(editor.select(Range(cell=([12], ["B"]))).update("w"))
+    editor.close()
+
+    stored = read_store(url)
+    assert stored.index.tolist() == [11, 12, 13]
+    assert stored["A"].tolist() == [2, 3, 3]
+    assert stored["B"].tolist() == ["y", "w", "z"]
+
+
+def test_write_behind_snapshot_after_sort_and_column_change(
+    sample_df: pd.DataFrame, editor_config: EditorConfig, url: str
+):
+    """Test changes which are not row-level rewrite the whole table."""
+    editor = WriteBehindEditor(sample_df.copy(), editor_config, url=url)
+    editor.sort(by="A", ascending=False)
+    editor.commit(editor.select(Range(column=["C"])).insert(value=0))
+    editor.close()
+
+    stored = read_store(url)
+    pd.testing.assert_frame_equal(stored, editor.table, check_dtype=False)
+
+
+def test_write_behind_reloads_table_and_version(
+    sample_df: pd.DataFrame, editor_config: EditorConfig, url: str
+):
+    """Test a new editor on the same store starts from the flushed table."""
+    editor = WriteBehindEditor(sample_df.copy(), editor_config, url=url)
+    editor.commit(editor.select(Range(cell=([10], ["B"]))).update("v"))
+    editor.close()
+
+    reloaded = WriteBehindEditor(config=editor_config, url=url)
+    assert reloaded.version == editor.version
+    pd.testing.assert_frame_equal(reloaded.table, editor.table)
+    reloaded.close()
+
+
+def test_write_behind_flushes_when_enough_rows_are_pending(
+    sample_df: pd.DataFrame, url: str
+):
+    """Test the background writer starts once flush_rows rows are pending."""
+    config = EditorConfig(flush_interval=3600, flush_rows=1)
+    editor = WriteBehindEditor(sample_df.copy(), config, url=url)
+    editor.commit(editor.select(Range(cell=([10], ["A"]))).update(5))
+    with editor._condition:
+        editor._condition.wait_for(
+            lambda: editor.flushed_version == editor.version, timeout=10
+        )
+    assert read_store(url).loc[10, "A"] == 5
+    editor.close()
+
+
+def test_write_behind_appended_rows(
+    sample_df: pd.DataFrame, editor_config: EditorConfig, url: str
+):
+    """Test rows appended through the buffer are written to the store."""
+    editor = WriteBehindEditor(sample_df.copy(), editor_config, url=url)
+    editor.append([13], pd.NA)
+    editor.append([14], 7)
+    editor.flush()
+
+    stored = read_store(url)
+    assert stored.index.tolist() == [10, 11, 12, 13, 14]
+    assert stored.loc[13].tolist() == [3, "z"]
+    assert stored.loc[14, "A"] == 7
+    editor.close()
+
+
+def test_write_behind_requires_sqlite(sample_df: pd.DataFrame):
+    """Test stores other than SQLite are rejected, as rows are loaded by rowid."""
+    with pytest.raises(ValueError, match="SQLite"):
+        WriteBehindEditor(sample_df.copy(), url="postgresql://localhost/db")
+
+
+def test_write_behind_rejects_edits_after_close(
+    sample_df: pd.DataFrame, editor_config: EditorConfig, url: str
+):
+    """Test edits of a closed editor raise without changing the table."""
+    editor = WriteBehindEditor(sample_df.copy(), editor_config, url=url)
+    editor.close()
+    version = editor.version
+    with pytest.raises(RuntimeError, match="closed"):
+        editor.commit(sample_df.iloc[:1].copy())
+    with pytest.raises(RuntimeError, match="closed"):
+        editor.append([13], 7)
+    with pytest.raises(RuntimeError, match="closed"):
+        editor.sort("A", ascending=False)
+    assert editor.version == version
+    pd.testing.assert_frame_equal(editor.table, sample_df)
+
+
+def test_write_behind_backs_off_after_failed_writes(sample_df: pd.DataFrame, url: str):
+    """Test failed writes are retried with a backoff and raised by flush."""
+
+    class FailingEditor(WriteBehindEditor):
+        attempts = 0
+
+        def _write(self, changes) -> None:
+            self.attempts += 1
+            raise RuntimeError("disk full")
+
+    config = EditorConfig(flush_interval=0.01, flush_rows=1)
+    editor = FailingEditor(sample_df.copy(), config, url=url)
+    with pytest.raises(RuntimeError, match="disk full"):
+        editor.flush()
+    time.sleep(0.2)
+    # 0.01 + 0.02 + 0.04 + 0.08 seconds between the first attempts.
+    assert 1 <= editor.attempts <= 6
+    assert editor.flushed_version < editor.version
+    editor.close()
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mcp_table_editor.editor import EditorConfig, InMemoryEditor
+from mcp_table_editor.handler._aggregate_handler import (
+    AggregateHandler,
+    AggregateInputSchema,
+)
+
+
+@pytest.fixture
+def sample_df():
+    rng = np.random.default_rng(0)
+    n = 1000
+    df = pd.DataFrame(
+        {
+            "shop": rng.choice(["a", "b", "c", None], n),
+            "day": rng.integers(0, 5, n),
+            "revenue": rng.random(n),
+            "units": rng.integers(0, 10, n),
+        }
+    )
+    df.loc[df.sample(50, random_state=1).index, "revenue"] = np.nan
+    return df
+
+
+@pytest.fixture
+def editor(sample_df):
+    return InMemoryEditor(table=sample_df.copy(), config=EditorConfig.default())
+
+
+def test_aggregate_handler_matches_groupby(editor, sample_df):
+    handler = AggregateHandler(editor)
+    args = AggregateInputSchema(
+        by=["shop", "day"],
+        aggregations={
+            "revenue": ["sum", "mean", "count", "min", "max"],
+            "units": ["nunique"],
+        },
+    )
+    result = handler.handle(args)
+    expected = sample_df.groupby(["shop", "day"]).agg(
+        {"revenue": ["sum", "mean", "count", "min", "max"], "units": ["nunique"]}
+    )
+    expected.columns = [f"{column}_{func}" for column, func in expected.columns]
+    expected = expected.reset_index()
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(result.json_content), expected, check_dtype=False
+    )
+    assert result.groups == len(expected)
+    assert result.version == 0
+
+
+def test_aggregate_handler_whole_table_and_limit(editor, sample_df):
+    handler = AggregateHandler(editor)
+    result = handler.handle(
+        AggregateInputSchema(aggregations={"revenue": ["sum"], "units": ["max"]})
+    )
+    assert result.json_content == [
+        {"revenue_sum": sample_df["revenue"].sum(), "units_max": 9}
+    ]
+
+    result = handler.handle(
+        AggregateInputSchema(by=["day"], aggregations={"units": ["sum"]}, limit=2)
+    )
+    assert result.groups == 5
+    assert [row["day"] for row in result.json_content] == [0, 1]
+
+
+def test_aggregate_keys_keep_their_dtypes(editor, sample_df):
+    """Test the group keys have the dtypes of their columns, not categorical."""
+    result = editor.group_by(["shop", "day"], {"units": "sum"})
+    expected = sample_df.groupby(["shop", "day"])["units"].sum().reset_index()
+    pd.testing.assert_series_equal(result["shop"], expected["shop"])
+    pd.testing.assert_series_equal(result["day"], expected["day"])
+
+
+def test_aggregate_results_are_cached_by_version(editor, sample_df):
+    first = editor.group_by("shop", {"units": "sum"})
+    assert editor.group_by(["shop"], {"units": ["sum"]}) is first
+
+    table = editor.table.copy()
+    table.loc[table["shop"] == "a", "units"] = 100
+    editor.commit(table)
+    second = editor.group_by("shop", {"units": "sum"})
+    assert second is not first
+    assert second.loc[second["shop"] == "a", "units_sum"].item() == (
+        100 * (sample_df["shop"] == "a").sum()
+    )
+
+
+@pytest.mark.parametrize(
+    "by, aggregations, error",
+    [
+        (["shop"], {"revenue": ["median"]}, ValueError),
+        (["shop"], {}, ValueError),
+        (["missing"], {"revenue": ["sum"]}, KeyError),
+        (["shop"], {"missing": ["sum"]}, KeyError),
+    ],
+)
+def test_aggregate_handler_rejects_invalid_arguments(editor, by, aggregations, error):
+    handler = AggregateHandler(editor)
+    with pytest.raises(error):
+        handler.handle(AggregateInputSchema(by=by, aggregations=aggregations))
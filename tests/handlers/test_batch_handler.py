@@ -0,0 +1,107 @@
+import pandas as pd
+import pytest
+
+from mcp_table_editor.editor import EditorConfig, InMemoryEditor
+from mcp_table_editor.handler._batch_handler import (
+    BatchHandler,
+    BatchInputSchema,
+    BatchOperation,
+)
+
+
+@pytest.fixture
+def sample_df():
+    data = {"A": [3, 1, 2], "B": ["x", "y", "z"]}
+    return pd.DataFrame(data)
+
+
+@pytest.fixture
+def editor(sample_df):
+    return InMemoryEditor(
+        table=sample_df.copy(), config=EditorConfig(max_columns=10, max_rows=2)
+    )
+
+
+def test_batch_handler_applies_operations_in_order(editor, sample_df):
+    args = BatchInputSchema(
+        operations=[
+            BatchOperation(
+                tool="update_content", args={"rows": [0], "columns": ["A"], "value": 0}
+            ),
+            BatchOperation(
+                tool="insert_cell",
+                args={"columns": ["C"], "value": 1, "insert_rule": "empty"},
+            ),
+            BatchOperation(tool="sort", args={"by": ["A"]}),
+        ]
+    )
+    result = BatchHandler(editor).handle(args)
+
+    expected = sample_df.copy()
+    expected.loc[0, "A"] = 0
+    expected["C"] = 1
+    expected = expected.sort_values(by=["A"])
+    pd.testing.assert_frame_equal(editor.table, expected)
+    assert result.applied == 3
+    assert (result.rows, result.columns) == (3, 3)
+    assert result.version == editor.version == 1
+    # The response is bounded by the config of the editor.
+    assert len(result.json_content) == 2
+
+
+def test_batch_handler_rolls_back_on_failure(editor, sample_df):
+    args = BatchInputSchema(
+        operations=[
+            BatchOperation(
+                tool="update_content", args={"rows": [0], "columns": ["A"], "value": 0}
+            ),
+            BatchOperation(tool="sort", args={"by": ["missing"]}),
+        ]
+    )
+    with pytest.raises(ValueError, match="Operation 1"):
+        BatchHandler(editor).handle(args)
+    pd.testing.assert_frame_equal(editor.table, sample_df)
+    assert editor.version == 0
+
+
+def test_batch_handler_rejects_unknown_tool(editor):
+    args = BatchInputSchema(operations=[BatchOperation(tool="batch")])
+    with pytest.raises(ValueError, match="not supported"):
+        BatchHandler(editor).handle(args)
+
+
+def test_batch_handler_without_commit(editor, sample_df):
+    args = BatchInputSchema(
+        operations=[BatchOperation(tool="drop_content", args={"rows": [1]})],
+        commit=False,
+    )
+    result = BatchHandler(editor).handle(args)
+    assert result.rows == 2
+    pd.testing.assert_frame_equal(editor.table, sample_df)
+
+
+def test_batch_handler_keep_sorted(editor, sample_df):
+    """Test batches keep the order of the table, and a sort in them replaces it."""
+    editor.sort(by=["A"], keep_sorted=True)
+    BatchHandler(editor).handle(
+        BatchInputSchema(
+            operations=[
+                BatchOperation(
+                    tool="update_content",
+                    args={"rows": [1], "columns": ["A"], "value": 9},
+                ),
+            ]
+        )
+    )
+    assert editor.table["A"].tolist() == [2, 3, 9]
+    assert editor.sort_key == (["A"], True)
+
+    BatchHandler(editor).handle(
+        BatchInputSchema(
+            operations=[
+                BatchOperation(tool="sort", args={"by": ["B"], "ascending": False}),
+            ]
+        )
+    )
+    assert editor.table["B"].tolist() == ["z", "y", "x"]
+    assert editor.sort_key is None
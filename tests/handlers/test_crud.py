@@ -10,6 +10,7 @@ from mcp_table_editor.handler._crud_handler import (
     CrudInputSchema,
     CrudOutputSchema,
     Operation,
+    ResponseMode,
 )
 
 
@@ -257,3 +258,87 @@ def test_crud_handler_insert_column(editor: InMemoryEditor, sample_df: pd.DataFr
     pd.testing.assert_frame_equal(result_df_from_csv, expected_df)
     assert result.json_content == expected_df.to_dict(orient="records")
     pd.testing.assert_frame_equal(editor.table, sample_df)
+
+
+# --- Test commit ---
+
+
+def test_crud_handler_update_commit(editor: InMemoryEditor, sample_df: pd.DataFrame):
+    """Test UPDATE operation writes the result back to the table on commit."""
+    args = CrudInputSchema(
+        method=Operation.UPDATE,
+        rows=[11],
+        columns=["B"],
+        value=50,
+        commit=True,
+    )
+    handler = CrudHandler(editor)
+    version = editor.version
+    handler.handle(args)
+
+    expected_df = sample_df.copy()
+    expected_df.loc[11, "B"] = 50
+    pd.testing.assert_frame_equal(editor.table, expected_df)
+    assert editor.version == version + 1
+
+
+def test_crud_handler_get_commit_keeps_version(editor: InMemoryEditor):
+    """Test GET operation never changes the table even on commit."""
+    args = CrudInputSchema(method=Operation.GET, columns=["A"], commit=True)
+    CrudHandler(editor).handle(args)
+    assert editor.version == 0
+
+
+# --- Test diff response ---
+
+
+def test_crud_handler_update_diff_response(editor: InMemoryEditor):
+    """Test UPDATE operation returns only the changed cells in the diff mode."""
+    args = CrudInputSchema(
+        method=Operation.UPDATE,
+        rows=[11, 12],
+        columns=["B"],
+        value=5,
+        commit=True,
+        response_mode=ResponseMode.DIFF,
+    )
+    result = CrudHandler(editor).handle(args)
+
+    assert result.content is None and result.json_content is None
+    assert [cell.model_dump() for cell in result.patch.cells] == [
+        {"row": 12, "column": "B", "old": 6, "new": 5}
+    ]
+    assert result.shape == (3, 3)
+    assert result.version == editor.version == 1
+
+
+def test_crud_handler_drop_diff_response(editor: InMemoryEditor):
+    """Test DROP operation reports the removed rows in the diff mode."""
+    args = CrudInputSchema(
+        method=Operation.DROP,
+        rows=[10],
+        response_mode=ResponseMode.DIFF,
+    )
+    result = CrudHandler(editor).handle(args)
+
+    assert result.patch.removed_rows == [10]
+    assert result.patch.cells == []
+    assert result.shape == (2, 3)
+    assert result.version == 0
+
+
+def test_crud_handler_insert_column_diff_response(editor: InMemoryEditor):
+    """Test INSERT operation reports the cells of the new column in the diff mode."""
+    args = CrudInputSchema(
+        method=Operation.INSERT,
+        columns=["D"],
+        value=pd.NA,
+        insert_rule=InsertRule.EMPTY,
+        response_mode=ResponseMode.DIFF,
+    )
+    result = CrudHandler(editor).handle(args)
+
+    assert result.patch.added_columns == ["D"]
+    assert [cell.new for cell in result.patch.cells] == [None, None, None]
+    # The patch must be serializable even if it contains missing values.
+    assert '"added_columns":["D"]' in result.model_dump_json()
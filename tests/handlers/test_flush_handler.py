@@ -0,0 +1,61 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from mcp_table_editor.editor import EditorConfig, InMemoryEditor, WriteBehindEditor
+from mcp_table_editor.handler._crud_handler import CrudInputSchema, Operation
+from mcp_table_editor.handler._flush_handler import FlushHandler, FlushInputSchema
+from mcp_table_editor.handler._update_content_handler import UpdateContentHandler
+from mcp_table_editor.mcp.handler_tool import HandlerTool
+from mcp_table_editor.misc.locks import ReadWriteLock
+
+
+@pytest.fixture
+def sample_df():
+    data = {"A": [1, 2], "B": [3, 4]}
+    return pd.DataFrame(data)
+
+
+def test_flush_handler_in_memory_editor(sample_df):
+    editor = InMemoryEditor(table=sample_df.copy())
+    result = FlushHandler(editor).handle(FlushInputSchema())
+    assert result.version == result.flushed_version == editor.version
+
+
+def test_flush_handler_write_behind_editor(sample_df, tmp_path):
+    config = EditorConfig(flush_interval=3600, flush_rows=1_000_000)
+    editor = WriteBehindEditor(
+        table=sample_df.copy(), config=config, url=f"sqlite:///{tmp_path / 't.db'}"
+    )
+    UpdateContentHandler(editor).handle(
+        CrudInputSchema(
+            method=Operation.UPDATE, rows=[0], columns=["A"], value=9, commit=True
+        )
+    )
+    assert editor.flushed_version < editor.version
+
+    result = FlushHandler(editor).handle(FlushInputSchema())
+    assert result.flushed_version == result.version == editor.version
+    editor.close()
+
+
+def test_flush_tool_does_not_wait_for_the_table_lock(sample_df, tmp_path):
+    """Test a flush waits for the writer without holding the lock of the table."""
+    config = EditorConfig(flush_interval=3600, flush_rows=1_000_000)
+    editor = WriteBehindEditor(
+        table=sample_df.copy(), config=config, url=f"sqlite:///{tmp_path / 't.db'}"
+    )
+    lock = ReadWriteLock()
+    results = []
+    with lock.write():
+        thread = threading.Thread(
+            target=lambda: results.append(
+                HandlerTool(FlushHandler).run(editor, {}, lock)
+            )
+        )
+        thread.start()
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+    assert len(results) == 1
+    editor.close()
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mcp_table_editor.editor import EditorConfig, InMemoryEditor
+from mcp_table_editor.handler._query_handler import QueryHandler, QueryInputSchema
+
+
+@pytest.fixture
+def sample_df():
+    rng = np.random.default_rng(0)
+    n = 500
+    return pd.DataFrame(
+        {
+            "price": rng.random(n).round(2),
+            "region": rng.choice(["north", "south"], n),
+            "units": rng.integers(0, 5, n),
+        }
+    )
+
+
+@pytest.fixture
+def editor(sample_df):
+    return InMemoryEditor(table=sample_df.copy(), config=EditorConfig.default())
+
+
+def test_query_handler(editor, sample_df):
+    handler = QueryHandler(editor)
+    result = handler.handle(
+        QueryInputSchema(
+            filter="region == 'north'",
+            sort_by=["price"],
+            ascending=False,
+            columns=["price", "units"],
+            limit=10,
+            explain=True,
+        )
+    )
+    expected = (
+        sample_df.query("region == 'north'")
+        .sort_values("price", ascending=False, kind="stable")[["price", "units"]]
+        .head(10)
+    )
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(result.json_content),
+        expected.reset_index(drop=True),
+        check_dtype=False,
+    )
+    assert "TopK" in result.plan
+    assert editor.version == 0
+
+
+def test_query_handler_rows(editor, sample_df):
+    handler = QueryHandler(editor)
+    result = handler.handle(QueryInputSchema(rows=[3, 1, 2], columns=["units"]))
+    assert result.plan is None
+    assert result.content.splitlines()[1].startswith("3,")
+    assert [row["units"] for row in result.json_content] == sample_df.loc[
+        [3, 1, 2], "units"
+    ].tolist()
@@ -51,3 +51,11 @@ def test_sort_handler_multiple_columns(editor):
     pd.testing.assert_frame_equal(
         pd.DataFrame(result.json_content), expected.reset_index(drop=True)
     )
+
+
+def test_sort_handler_keep_sorted(editor):
+    handler = SortHandler(editor)
+    handler.handle(SortInputSchema(by=["A"], keep_sorted=True))
+    assert editor.sort_key == (["A"], True)
+    editor.append([3], 0)
+    assert editor.table["A"].tolist() == [0, 1, 2, 3]
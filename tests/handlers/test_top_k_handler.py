@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mcp_table_editor.editor import EditorConfig, InMemoryEditor
+from mcp_table_editor.handler._top_k_handler import TopKHandler, TopKInputSchema
+
+
+@pytest.fixture
+def sample_df():
+    rng = np.random.default_rng(0)
+    n = 2000
+    df = pd.DataFrame(
+        {
+            "revenue": rng.random(n).round(1),
+            "region": rng.choice(["north", "south", "east", None], n),
+            "units": rng.integers(0, 5, n),
+        }
+    )
+    df.loc[df.sample(100, random_state=1).index, "revenue"] = np.nan
+    return df
+
+
+@pytest.fixture
+def editor(sample_df):
+    return InMemoryEditor(table=sample_df.copy(), config=EditorConfig.default())
+
+
+@pytest.mark.parametrize(
+    "by, ascending",
+    [
+        (["revenue"], False),
+        (["revenue"], True),
+        (["units", "revenue"], [True, False]),
+        (["region", "units"], False),
+    ],
+)
+def test_top_k_handler_matches_stable_sort(editor, sample_df, by, ascending):
+    handler = TopKHandler(editor)
+    result = handler.handle(TopKInputSchema(by=by, k=20, ascending=ascending))
+    expected = sample_df.sort_values(by=by, ascending=ascending, kind="stable")
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(result.json_content),
+        expected.head(20).reset_index(drop=True),
+        check_dtype=False,
+    )
+    assert result.content.splitlines()[1].startswith(str(expected.index[0]))
+    # The stored table is not reordered.
+    pd.testing.assert_frame_equal(editor.table, sample_df)
+    assert editor.version == 0
+
+
+def test_top_k_handler_custom_order(editor, sample_df):
+    handler = TopKHandler(editor)
+    args = TopKInputSchema(
+        by=["region", "revenue"],
+        k=5,
+        ascending=[True, False],
+        values={"region": ["south", "east"]},
+    )
+    result = pd.DataFrame(handler.handle(args).json_content)
+    expected = (
+        sample_df[sample_df["region"] == "south"]
+        .sort_values("revenue", ascending=False, kind="stable")
+        .head(5)
+    )
+    pd.testing.assert_frame_equal(
+        result, expected.reset_index(drop=True), check_dtype=False
+    )
+
+
+def test_top_k_handler_rejects_unsorted_custom_order(editor):
+    handler = TopKHandler(editor)
+    args = TopKInputSchema(by=["revenue"], values={"region": ["south"]})
+    with pytest.raises(ValueError):
+        handler.handle(args)
@@ -0,0 +1,84 @@
+import json
+
+import pandas as pd
+import pytest
+
+from mcp_table_editor.editor import InMemoryEditor
+from mcp_table_editor.handler import TOOL_HANDLERS_DICT
+from mcp_table_editor.handler._trace_handler import TraceHandler, TraceInputSchema
+from mcp_table_editor.mcp.handler_tool import HandlerTool
+from mcp_table_editor.misc import tracer
+
+
+@pytest.fixture
+def editor():
+    return InMemoryEditor(table=pd.DataFrame({"A": [3, 1, 2], "B": ["x", "y", "z"]}))
+
+
+@pytest.fixture(autouse=True)
+def reset_tracer():
+    yield
+    tracer.enabled = False
+    tracer.export_dir = None
+    tracer.clear()
+
+
+def test_trace_handler_returns_call_breakdowns(editor):
+    handler = TraceHandler(editor)
+    assert handler.handle(TraceInputSchema(enable=True)).enabled
+
+    update = HandlerTool(TOOL_HANDLERS_DICT["update_content"])
+    update.run(editor, {"rows": [0], "columns": ["A"], "value": 0})
+    HandlerTool(TOOL_HANDLERS_DICT["sort"]).run(editor, {"by": ["A"]})
+
+    response = handler.handle(TraceInputSchema(last=2))
+    [crud, sort] = response.calls
+    assert crud.tool == "update_content"
+    assert {
+        "validate",
+        "lock",
+        "handle",
+        "range",
+        "selector_copy",
+        "pandas_op",
+        "from_dataframe",
+        "encode",
+    } <= set(crud.phases_ms)
+    assert crud.phases_ms["handle"] <= crud.duration_ms
+    assert sort.tool == "sort"
+    assert {"pandas_op", "from_dataframe"} <= set(sort.phases_ms)
+
+
+def test_trace_handler_disabled_by_default(editor):
+    HandlerTool(TOOL_HANDLERS_DICT["sort"]).run(editor, {"by": ["A"]})
+    response = TraceHandler(editor).handle(TraceInputSchema())
+    assert not response.enabled
+    assert response.calls == []
+
+
+def test_trace_handler_exports_chrome_trace(editor, tmp_path):
+    tracer.enabled = True
+    tracer.export_dir = str(tmp_path)
+    HandlerTool(TOOL_HANDLERS_DICT["sort"]).run(editor, {"by": ["A"]})
+    response = TraceHandler(editor).handle(
+        TraceInputSchema(enable=False, export_path="trace.json")
+    )
+    assert not response.enabled
+    path = tmp_path / "trace.json"
+    assert response.export_path == str(path.resolve())
+    names = [event["name"] for event in json.loads(path.read_text())["traceEvents"]]
+    assert names[0] == "sort"
+    assert "pandas_op" in names
+
+
+@pytest.mark.parametrize("name", ["/tmp/trace.json", "../trace.json", "a/../../t.json"])
+def test_trace_handler_rejects_paths_outside_trace_dir(editor, tmp_path, name):
+    tracer.export_dir = str(tmp_path / "traces")
+    with pytest.raises(ValueError):
+        TraceHandler(editor).handle(TraceInputSchema(export_path=name))
+    assert not (tmp_path / "trace.json").exists()
+
+
+def test_trace_handler_export_disabled_without_trace_dir(editor):
+    with pytest.raises(ValueError):
+        TraceHandler(editor).handle(TraceInputSchema(export_path="trace.json"))
@@ -0,0 +1,58 @@
+import asyncio
+import json
+
+import pandas as pd
+import pytest
+
+from mcp_table_editor.editor import InMemoryEditor
+from mcp_table_editor.handler import TOOL_HANDLERS_DICT
+from mcp_table_editor.mcp.executor import ToolExecutor
+from mcp_table_editor.mcp.handler_tool import HandlerTool
+
+
+@pytest.fixture
+def editor():
+    return InMemoryEditor(table=pd.DataFrame({"A": [3, 1, 2], "B": ["x", "y", "z"]}))
+
+
+def test_executor_runs_tool_off_the_event_loop(editor):
+    executor = ToolExecutor(max_workers=2)
+    tool = HandlerTool(TOOL_HANDLERS_DICT["sort"])
+
+    async def main():
+        return await executor.run(tool, editor, {"by": ["A"]})
+
+    [content] = asyncio.run(main())
+    executor.shutdown()
+    assert [row["A"] for row in json.loads(content.text)["json_content"]] == [1, 2, 3]
+    assert editor.table["A"].tolist() == [1, 2, 3]
+
+
+def test_executor_serializes_writes_on_the_same_table(editor):
+    executor = ToolExecutor(max_workers=4)
+    tool = HandlerTool(TOOL_HANDLERS_DICT["update_content"])
+
+    async def main():
+        await asyncio.gather(
+            *(
+                executor.run(
+                    tool,
+                    editor,
+                    {"rows": [i % 3], "columns": ["A"], "value": i, "commit": True},
+                )
+                for i in range(30)
+            )
+        )
+
+    asyncio.run(main())
+    executor.shutdown()
+    assert editor.version == 30
+
+
+def test_executor_lock_per_table(editor):
+    executor = ToolExecutor(max_workers=1)
+    other = InMemoryEditor(table=editor.table.copy())
+    assert executor.lock(editor) is executor.lock(editor)
+    assert executor.lock(editor) is not executor.lock(other)
+    executor.release(editor)
+    executor.shutdown()
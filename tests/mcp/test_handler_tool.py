@@ -0,0 +1,74 @@
+import json
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from mcp_table_editor.editor import InMemoryEditor
+from mcp_table_editor.handler import TOOL_HANDLERS_DICT
+from mcp_table_editor.mcp.handler_tool import HandlerTool
+from mcp_table_editor.mcp.metrics import ToolMetrics
+from mcp_table_editor.misc import ReadWriteLock
+
+
+@pytest.fixture
+def editor():
+    return InMemoryEditor(table=pd.DataFrame({"A": [3, 1, 2], "B": ["x", "y", "z"]}))
+
+
+def test_handler_tool_run_validates_args(editor):
+    tool = HandlerTool(TOOL_HANDLERS_DICT["get_content"])
+    [content] = tool.run(editor, {"columns": ["A"]})
+    response = json.loads(content.text)
+    assert response["json_content"] == [{"A": 3}, {"A": 1}, {"A": 2}]
+
+
+def test_handler_tool_run_rejects_invalid_args(editor):
+    tool = HandlerTool(TOOL_HANDLERS_DICT["sort"])
+    with pytest.raises(ValueError):
+        tool.run(editor, {"ascending": True})
+
+
+def test_handler_tool_run_returns_compact_json(editor):
+    tool = HandlerTool(TOOL_HANDLERS_DICT["get_content"])
+    [content] = tool.run(editor, {"columns": ["A"]})
+    assert "\n  " not in content.text
+    assert json.loads(content.text)["json_content"][0] == {"A": 3}
+
+
+def test_handler_tool_run_with_custom_encoder(editor):
+    tool = HandlerTool(
+        TOOL_HANDLERS_DICT["get_content"],
+        encoder=lambda response: response.model_dump_json(indent=2),
+    )
+    [content] = tool.run(editor, {"columns": ["A"]})
+    assert "\n  " in content.text
+
+
+def test_handler_tool_reuses_handler_per_editor(editor):
+    tool = HandlerTool(TOOL_HANDLERS_DICT["sort"])
+    tool.run(editor, {"by": ["A"]})
+    handler = tool.get_handler(editor)
+    tool.run(editor, {"by": ["B"]})
+    assert tool.get_handler(editor) is handler
+    assert tool.get_handler(InMemoryEditor(editor.table.copy())) is not handler
+
+    tool.release(editor)
+    assert tool.get_handler(editor) is not handler
+
+
+def test_handler_tool_reads_the_shape_under_the_lock(editor):
+    metrics = ToolMetrics()
+    tool = HandlerTool(TOOL_HANDLERS_DICT["get_content"], metrics=metrics)
+    lock = ReadWriteLock()
+    with lock.write():
+        thread = threading.Thread(
+            target=tool.run, args=(editor, {"columns": ["A"]}, lock)
+        )
+        thread.start()
+        # The call waits for the lock while the writer grows the table.
+        time.sleep(0.05)
+        editor.table = pd.concat([editor.table, editor.table])
+    thread.join(timeout=10)
+    assert metrics.collect()["get_content"].rows.sum == 6
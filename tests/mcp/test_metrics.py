@@ -0,0 +1,107 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+from mcp_table_editor.editor import InMemoryEditor
+from mcp_table_editor.handler import TOOL_HANDLERS_DICT
+from mcp_table_editor.mcp.handler_tool import HandlerTool
+from mcp_table_editor.mcp.metrics import ToolMetrics
+
+
+@pytest.fixture
+def editor():
+    return InMemoryEditor(table=pd.DataFrame({"A": [3, 1, 2], "B": ["x", "y", "z"]}))
+
+
+def test_handler_tool_records_calls(editor):
+    metrics = ToolMetrics()
+    tool = HandlerTool(TOOL_HANDLERS_DICT["get_content"], metrics=metrics)
+    [content] = tool.run(editor, {"columns": ["A"]})
+    with pytest.raises(ValueError):
+        tool.run(editor, {"columns": "A"})
+
+    stats = metrics.collect()["get_content"]
+    assert stats.calls == 1
+    assert stats.errors == 1
+    assert stats.response_bytes == len(content.text)
+    assert stats.request_bytes == len('{"columns":["A"]}')
+    assert stats.rows.sum == 3
+    assert stats.columns.sum == 2
+    assert stats.latency.sum >= stats.handle_seconds + stats.serialize_seconds
+
+
+def test_handler_tool_counts_dataframe_output_as_serialization(editor, monkeypatch):
+    """Test the CSV output built by a handler is timed as serialization."""
+    to_csv = pd.DataFrame.to_csv
+
+    def slow_to_csv(self, *args, **kwargs):
+        time.sleep(0.05)
+        return to_csv(self, *args, **kwargs)
+
+    monkeypatch.setattr(pd.DataFrame, "to_csv", slow_to_csv)
+    metrics = ToolMetrics()
+    tool = HandlerTool(TOOL_HANDLERS_DICT["get_content"], metrics=metrics)
+    tool.run(editor, {"columns": ["A"]})
+
+    stats = metrics.collect()["get_content"]
+    assert stats.serialize_seconds >= 0.05
+    assert stats.handle_seconds < 0.05
+
+
+def test_render_prometheus_text():
+    metrics = ToolMetrics()
+    for latency in (0.0001, 0.02, 20.0):
+        metrics.observe(
+            'a "tool"',
+            latency=latency,
+            handle_seconds=0.5,
+            serialize_seconds=0.25,
+            request_bytes=10,
+            response_bytes=100,
+            rows=1000,
+            columns=10,
+        )
+    text = metrics.render()
+    assert "# TYPE mcp_table_editor_tool_latency_seconds histogram" in text
+    label = 'tool="a \\"tool\\""'
+    assert (
+        f'mcp_table_editor_tool_latency_seconds_bucket{{{label},le="0.0005"}} 1' in text
+    )
+    assert (
+        f'mcp_table_editor_tool_latency_seconds_bucket{{{label},le="0.025"}} 2' in text
+    )
+    assert (
+        f'mcp_table_editor_tool_latency_seconds_bucket{{{label},le="+Inf"}} 3' in text
+    )
+    assert f"mcp_table_editor_tool_latency_seconds_count{{{label}}} 3" in text
+    assert f"mcp_table_editor_tool_calls_total{{{label}}} 3" in text
+    assert f"mcp_table_editor_tool_handle_seconds_total{{{label}}} 1.5" in text
+    assert f"mcp_table_editor_tool_response_bytes_total{{{label}}} 300" in text
+    assert f'mcp_table_editor_tool_table_rows_bucket{{{label},le="1000"}} 3' in text
+
+
+def test_observe_from_threads():
+    metrics = ToolMetrics()
+
+    def record():
+        for _ in range(1000):
+            metrics.observe("tool", 0.001, 0.0, 0.0, 1, 1, 1, 1)
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert metrics.collect()["tool"].calls == 4000
+
+
+def test_metrics_endpoint():
+    from mcp_table_editor.mcp import web
+
+    response = TestClient(web.app).get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "mcp_table_editor_event_store_events 0" in response.text
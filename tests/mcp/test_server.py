@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from mcp_table_editor.editor import InMemoryEditor
+from mcp_table_editor.mcp import server
+
+
+class EchoInputSchema(BaseModel):
+    text: str
+
+
+class EchoHandler:
+    name = "echo"
+    description = "Echo the text."
+    input_schema = EchoInputSchema
+    output_schema = EchoInputSchema
+
+    def __init__(self, editor: InMemoryEditor) -> None:
+        self.editor = editor
+
+    def is_read_only(self, args: EchoInputSchema) -> bool:
+        return True
+
+    def handle(self, args: EchoInputSchema) -> EchoInputSchema:
+        return args
+
+
+@pytest.fixture
+def echo_tool():
+    yield server.register_tool(EchoHandler)
+    server.unregister_tool(EchoHandler.name)
+
+
+def list_tool_names() -> list[str]:
+    return [tool.name for tool in asyncio.run(server.list_tools())]
+
+
+def test_list_tools_is_cached():
+    first = asyncio.run(server.list_tools())
+    second = asyncio.run(server.list_tools())
+    assert second is first
+    assert [tool.name for tool in first] == list(server.TOOLS)
+
+
+async def measure_list_tools(calls: int) -> tuple[float, float]:
+    start = time.perf_counter()
+    await server.list_tools()
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        await server.list_tools()
+    warm = (time.perf_counter() - start) / calls
+    return cold, warm
+
+
+def test_list_tools_latency():
+    # Start from tools whose schemas are not generated yet, as at startup.
+    for handler in [tool.handler for tool in server.TOOLS.values()]:
+        server.register_tool(handler)
+    cold, warm = asyncio.run(measure_list_tools(100))
+    # Generating the schemas of all the tools takes longer than serving them.
+    assert warm < cold
+    assert cold < 1.0
+
+
+def test_register_tool_invalidates_list(echo_tool):
+    assert "echo" in list_tool_names()
+    server.unregister_tool("echo")
+    assert "echo" not in list_tool_names()
+    server.register_tool(EchoHandler)
+    assert "echo" in list_tool_names()
+
+
+def test_unregister_unknown_tool():
+    with pytest.raises(ValueError):
+        server.unregister_tool("unknown")
+
+
+def test_editor_session_creates_editor_on_first_use():
+    session = server.EditorSession(server.McpSettings())
+    session.close()  # nothing to release yet
+    editor = asyncio.run(session.get_editor())
+    assert isinstance(editor, InMemoryEditor)
+    assert asyncio.run(session.get_editor()) is editor
+    session.close()
+    assert asyncio.run(session.get_editor()) is not editor
+
+
+def test_editor_session_creates_editor_in_the_executor(monkeypatch):
+    session = server.EditorSession(server.McpSettings())
+    create_editor = session._create_editor
+    threads = []
+
+    def record_thread():
+        threads.append(threading.current_thread())
+        return create_editor()
+
+    monkeypatch.setattr(session, "_create_editor", record_thread)
+    asyncio.run(session.get_editor())
+    session.close()
+    assert threads and threads[0] is not threading.main_thread()
@@ -0,0 +1,36 @@
+import json
+import subprocess
+import sys
+
+# Budget of the import of the server in a fresh interpreter, in seconds.
+# Most of it is taken by the mcp package itself.
+STARTUP_BUDGET = 2.0
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import mcp_table_editor.mcp.server
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def import_server() -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_server_import_is_lazy():
+    modules = set(import_server()["modules"])
+    for heavy in ("pandas", "numpy", "sqlalchemy", "fastapi"):
+        assert heavy not in modules
+    assert "mcp_table_editor.handler" not in modules
+    assert "mcp_table_editor.editor" not in modules
+
+
+def test_server_import_within_budget():
+    # Warm up the file system caches, then measure.
+    import_server()
+    assert import_server()["elapsed"] < STARTUP_BUDGET
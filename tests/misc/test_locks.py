@@ -0,0 +1,64 @@
+import threading
+import time
+
+from mcp_table_editor.misc.locks import ReadWriteLock
+
+
+def test_readers_hold_the_lock_together():
+    """Test many readers can hold the lock at the same time."""
+    lock = ReadWriteLock()
+    barrier = threading.Barrier(3, timeout=5)
+
+    def read():
+        with lock.read():
+            barrier.wait()
+
+    threads = [threading.Thread(target=read) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_writer_excludes_readers():
+    """Test a reader waits until the writer releases the lock."""
+    lock = ReadWriteLock()
+    events = []
+
+    def read():
+        with lock.read():
+            events.append("read")
+
+    with lock.write():
+        thread = threading.Thread(target=read)
+        thread.start()
+        time.sleep(0.05)
+        events.append("write")
+    thread.join()
+    assert events == ["write", "read"]
+
+
+def test_waiting_writer_goes_before_new_readers():
+    """Test a waiting writer is not starved by readers arriving after it."""
+    lock = ReadWriteLock()
+    events = []
+
+    def write():
+        with lock.write():
+            events.append("write")
+
+    def read():
+        with lock.read():
+            events.append("read")
+
+    with lock.read():
+        writer = threading.Thread(target=write)
+        writer.start()
+        time.sleep(0.05)
+        reader = threading.Thread(target=read)
+        reader.start()
+        time.sleep(0.05)
+        assert events == []
+    writer.join()
+    reader.join()
+    assert events == ["write", "read"]
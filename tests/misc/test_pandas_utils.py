@@ -1,7 +1,11 @@
 import pandas as pd
 from pandas.testing import assert_index_equal
 
-from mcp_table_editor.misc.pandas_utils import merge_index
+from mcp_table_editor.misc.pandas_utils import (
+    changed_index,
+    diff_dataframe,
+    merge_index,
+)
 
 
 def test_merge_index_empty():
@@ -86,3 +90,78 @@ def test_merge_index_mixed_types_in_df_index_fails():
     # Union: [0, 1, 2.0] -> Sorted: [0, 1, 2.0] -> Reindexed: [1, 2.0, 0]
     expected = pd.Index([1, 2.0, 0], dtype="float64")  # Pandas promotes to float
     assert_index_equal(result, expected)
+
+
+def test_changed_index():
+    """Test getting the rows whose values differ."""
+    before = pd.DataFrame({"A": [1, 2, 3], "B": ["x", None, "z"]}, index=[0, 1, 2])
+    after = before.copy()
+    after.loc[2, "A"] = 30
+    result = changed_index(before, after)
+    assert_index_equal(result, pd.Index([2]))
+
+
+def test_changed_index_ignores_equal_missing_values():
+    """Test missing values in both dataframes are treated as equal."""
+    before = pd.DataFrame({"A": [1.0, None]}, index=[0, 1])
+    after = pd.DataFrame({"A": [1.0, pd.NA]}, index=[0, 1], dtype=object)
+    result = changed_index(before, after)
+    assert len(result) == 0
+
+
+def test_changed_index_with_candidates():
+    """Test only the candidate rows are compared and added rows are skipped."""
+    before = pd.DataFrame({"A": [1, 2, 3]}, index=[0, 1, 2])
+    after = pd.DataFrame({"A": [10, 20, 3, 4]}, index=[0, 1, 2, 3])
+    result = changed_index(before, after, pd.Index([1, 3]))
+    assert_index_equal(result, pd.Index([1]))
+
+
+def test_diff_dataframe_changed_cells():
+    """Test the changed cells are reported with their old and new values."""
+    before = pd.DataFrame({"A": [1, 2], "B": ["x", "y"]}, index=[0, 1])
+    after = before.copy()
+    after.loc[1, "B"] = "z"
+    diff = diff_dataframe(before, after)
+    assert diff.cells.to_dict(orient="records") == [
+        {"row": 1, "column": "B", "old": "y", "new": "z"}
+    ]
+    assert len(diff.added_rows) == len(diff.removed_rows) == 0
+
+
+def test_diff_dataframe_added_and_removed():
+    """Test added rows and columns are reported with their cells."""
+    before = pd.DataFrame({"A": [1, 2]}, index=[0, 1])
+    after = pd.DataFrame({"A": [2, 3], "C": [5, 6]}, index=[1, 2])
+    diff = diff_dataframe(before, after)
+    assert_index_equal(diff.added_rows, pd.Index([2]))
+    assert_index_equal(diff.removed_rows, pd.Index([0]))
+    assert_index_equal(diff.added_columns, pd.Index(["C"]))
+    assert len(diff.removed_columns) == 0
+    cells = diff.cells.to_dict(orient="records")
+    assert {"row": 2, "column": "A", "old": None, "new": 3} in cells
+    assert {"row": 1, "column": "C", "old": None, "new": 5} in cells
+    assert len(cells) == 3
+
+
+def test_diff_dataframe_restricted_to_candidates():
+    """Test only the given rows and columns are compared."""
+    before = pd.DataFrame({"A": [1, 2], "B": [3, 4]}, index=[0, 1])
+    after = pd.DataFrame({"A": [10, 20], "B": [30, 40]}, index=[0, 1])
+    diff = diff_dataframe(before, after, rows=pd.Index([1]), columns=pd.Index(["B"]))
+    assert diff.cells.to_dict(orient="records") == [
+        {"row": 1, "column": "B", "old": 4, "new": 40}
+    ]
+
+
+def test_diff_dataframe_duplicated_row_labels():
+    """Test a row added with the label of an existing row is reported as added."""
+    before = pd.DataFrame({"A": [1, 2]}, index=[0, 1])
+    after = pd.DataFrame({"A": [1, 5, 3]}, index=[0, 1, 1])
+    diff = diff_dataframe(before, after)
+    assert_index_equal(diff.added_rows, pd.Index([1]))
+    assert len(diff.removed_rows) == 0
+    assert diff.cells.to_dict(orient="records") == [
+        {"row": 1, "column": "A", "old": 2, "new": 5},
+        {"row": 1, "column": "A", "old": None, "new": 3},
+    ]
@@ -0,0 +1,58 @@
+import json
+import time
+
+from mcp_table_editor.misc.tracing import Tracer, span
+
+
+def test_span_without_trace_is_noop():
+    with span("phase") as result:
+        assert result is None
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer()
+    with tracer.trace("call"):
+        with span("phase"):
+            pass
+    assert tracer.last() == []
+
+
+def test_tracer_records_nested_spans():
+    tracer = Tracer(enabled=True)
+    with tracer.trace("call", rows=3):
+        with span("outer"):
+            with span("inner"):
+                time.sleep(0.001)
+        with span("inner"):
+            pass
+    [trace] = tracer.last()
+    assert trace.name == "call"
+    assert [item.name for item in trace.spans] == ["inner", "outer", "inner"]
+    phases = trace.breakdown()
+    assert phases["outer"] >= 0.001
+    assert trace.duration >= phases["outer"]
+
+
+def test_tracer_keeps_last_traces():
+    tracer = Tracer(max_traces=3, enabled=True)
+    for i in range(5):
+        with tracer.trace(f"call{i}"):
+            pass
+    assert [trace.name for trace in tracer.last()] == ["call2", "call3", "call4"]
+    assert [trace.name for trace in tracer.last(2)] == ["call3", "call4"]
+    assert tracer.last(0) == []
+
+
+def test_export_chrome_trace(tmp_path):
+    tracer = Tracer(enabled=True)
+    with tracer.trace("call", rows=3):
+        with span("phase"):
+            pass
+    path = tmp_path / "trace.json"
+    tracer.export(str(path))
+    events = json.loads(path.read_text())["traceEvents"]
+    assert [event["name"] for event in events] == ["call", "phase"]
+    assert all(event["ph"] == "X" for event in events)
+    assert events[0]["args"] == {"rows": 3}
+    assert events[0]["ts"] <= events[1]["ts"]
+    assert events[1]["dur"] <= events[0]["dur"]